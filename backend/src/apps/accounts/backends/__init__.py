@@ -0,0 +1,3 @@
+from .email_backend import EmailAuthenticationBackend
+
+__all__ = ["EmailAuthenticationBackend"]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+
+from allauth.account import app_settings
+from allauth.account.app_settings import LoginMethod
+from allauth.account.auth_backends import AuthenticationBackend
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.base_user import AbstractBaseUser
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest
+from pack_logger import log
+
+
+class EmailAuthenticationBackend(AuthenticationBackend):
+    """
+    Backend logowania emailem: jedno zapytanie zamiast łańcucha
+    ModelBackend + AuthenticationBackend z allauth.
+
+    Dziedziczy po backendzie allauth, więc zachowuje jego semantykę
+    (preferowanie zweryfikowanych adresów, stash nieaktywnego użytkownika,
+    ochronę przed timing attack, uprawnienia z ModelBackend). Zmienia się
+    tylko wyszukiwanie po emailu: CustomUserManager.for_login robi jedno
+    zapytanie po indeksie lower(email), a brak użytkownika jest na krótko
+    zapamiętywany w cache. Powtórne próby na nieistniejący email nie
+    dotykają bazy; hash hasła dalej jest liczony, więc czas odpowiedzi
+    nie zdradza, czy konto istnieje.
+
+    Poprzednie backendy zostają w AUTHENTICATION_BACKENDS tylko po to, żeby
+    działały sesje zapisane z ich ścieżką. Ten backend obsługuje wszystko,
+    co one (USERNAME_FIELD to email), więc po odrzuceniu emaila/username z
+    hasłem rzuca PermissionDenied — Django przerywa wtedy łańcuch i nie
+    powtarza zapytań ani hashowania hasła w starych backendach.
+    """
+
+    KEY_PREFIX = "accounts:auth:missing"
+
+    @classmethod
+    def negative_cache_key(cls, email: str) -> str:
+        digest = hashlib.sha256(email.lower().encode()).hexdigest()
+        return f"{cls.KEY_PREFIX}:{digest}"
+
+    @staticmethod
+    def _negative_timeout() -> int:
+        return getattr(settings, "ACCOUNTS_AUTH_NEGATIVE_CACHE_TIMEOUT", 30)
+
+    @classmethod
+    def forget_missing(cls, email: str) -> None:
+        """Usuń negatywny wpis — email właśnie pojawił się w bazie."""
+        try:
+            cache.delete(cls.negative_cache_key(email))
+        except Exception as exc:
+            log.warning("Auth negative cache invalidation failed", error=str(exc))
+
+    def authenticate(  # type: ignore[override]
+        self, request: HttpRequest | None, **credentials
+    ) -> AbstractBaseUser | None:
+        user = super().authenticate(request, **credentials)
+        handled = credentials.get("email") or credentials.get("username")
+        if user is None and handled and credentials.get("password"):
+            raise PermissionDenied
+        return user
+
+    def _authenticate_by_email(
+        self, email: str, password: str
+    ) -> AbstractBaseUser | None:
+        if not email or LoginMethod.EMAIL not in app_settings.LOGIN_METHODS:
+            return None
+
+        timeout = self._negative_timeout()
+        key = self.negative_cache_key(email)
+        if timeout:
+            try:
+                if cache.get(key):
+                    return None
+            except Exception as exc:
+                log.warning("Auth negative cache unavailable", error=str(exc))
+
+        users = get_user_model().objects.for_login(email)
+        if not users:
+            if timeout:
+                try:
+                    cache.set(key, True, timeout)
+                except Exception as exc:
+                    log.warning("Auth negative cache write failed", error=str(exc))
+            return None
+
+        for user in users:
+            if self._check_password(user, password):
+                return user
+        return None
@@ -1,3 +1,11 @@
+from .address_manager import AddressManager, AddressQuerySet
+from .profile_manager import ProfileManager, ProfileQuerySet
 from .user_manager import CustomUserManager
 
-__all__ = ["CustomUserManager"]
+__all__ = [
+    "AddressManager",
+    "AddressQuerySet",
+    "CustomUserManager",
+    "ProfileManager",
+    "ProfileQuerySet",
+]
@@ -0,0 +1,52 @@
+from django.db import IntegrityError, models, transaction
+from django.utils import timezone
+
+
+class AddressQuerySet(models.QuerySet):
+    def for_user(self, user):
+        """Adresy należące do profilu danego użytkownika."""
+        return self.filter(profile__user=user)
+
+
+class AddressManager(models.Manager.from_queryset(AddressQuerySet)):
+    """Manager for Address – atomowe przełączanie adresu domyślnego."""
+
+    SET_DEFAULT_ATTEMPTS = 3
+
+    def set_default(self, address) -> bool:
+        """
+        Ustaw adres jako domyślny dla jego profilu w jednej transakcji.
+
+        Dwa warunkowe UPDATE-y bez odczytu: najpierw zdjęcie flagi ze starego
+        domyślnego, potem ustawienie nowego. Kolejność jest wymuszona przez
+        częściowy unikalny indeks (profile, is_default) WHERE is_default —
+        nieodroczony indeks jest sprawdzany per wiersz, więc pojedynczy UPDATE
+        zamieniający oba wiersze mógłby go naruszyć zależnie od kolejności.
+        Wyścig z równoległym requestem kończy się IntegrityError na indeksie
+        i ponowieniem transakcji na świeżym snapshocie.
+
+        Args:
+            address: Adres, który ma zostać domyślnym.
+
+        Returns:
+            bool: True jeśli flaga została przestawiona, False gdy adres
+                był już domyślny.
+        """
+        siblings = self.filter(profile_id=address.profile_id)
+        for attempt in range(1, self.SET_DEFAULT_ATTEMPTS + 1):
+            now = timezone.now()
+            try:
+                with transaction.atomic():
+                    siblings.filter(is_default=True).exclude(pk=address.pk).update(
+                        is_default=False, updated_at=now
+                    )
+                    updated = siblings.filter(pk=address.pk, is_default=False).update(
+                        is_default=True, updated_at=now
+                    )
+            except IntegrityError:
+                if attempt == self.SET_DEFAULT_ATTEMPTS:
+                    raise
+                continue
+            address.is_default = True
+            return bool(updated)
+        return False
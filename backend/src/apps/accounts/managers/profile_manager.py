@@ -0,0 +1,55 @@
+from datetime import date
+
+from django.db import models
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Concat, ExtractYear, Trim
+
+
+class ProfileQuerySet(models.QuerySet):
+    # Kolumny odczytu dla ProfileReadSerializer (annotacje mają prefiks db_,
+    # żeby nie kolidować z właściwościami modelu full_name i age).
+    READ_FIELDS = (
+        "id",
+        "user__email",
+        "first_name",
+        "last_name",
+        "db_full_name",
+        "date_of_birth",
+        "db_age",
+        "phone_number",
+        "role",
+        "avatar",
+        "avatar_variants",
+    )
+
+    def with_read_annotations(self):
+        """
+        Dołącz użytkownika i policz full_name oraz age po stronie bazy.
+
+        Wiek liczony jest względem dzisiejszej daty przekazanej jako parametr
+        — tak samo jak właściwość Profile.age, również w testach z freezegun.
+        """
+        today = date.today()
+        birthday_not_reached = Q(date_of_birth__month__gt=today.month) | Q(
+            date_of_birth__month=today.month, date_of_birth__day__gt=today.day
+        )
+        return self.select_related("user").annotate(
+            db_full_name=Trim(Concat("first_name", Value(" "), "last_name")),
+            db_age=Case(
+                When(date_of_birth__isnull=True, then=Value(None)),
+                When(
+                    birthday_not_reached,
+                    then=Value(today.year) - ExtractYear("date_of_birth") - 1,
+                ),
+                default=Value(today.year) - ExtractYear("date_of_birth"),
+                output_field=IntegerField(),
+            ),
+        )
+
+    def read_rows(self):
+        """Wiersze (dict) gotowe dla ProfileReadSerializer — jedno zapytanie."""
+        return self.with_read_annotations().values(*self.READ_FIELDS)
+
+
+class ProfileManager(models.Manager.from_queryset(ProfileQuerySet)):
+    """Manager for Profile – ścieżka odczytu z annotacjami SQL."""
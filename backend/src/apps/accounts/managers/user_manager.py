@@ -1,4 +1,6 @@
 from django.contrib.auth.models import BaseUserManager
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Lower
 
 
 class CustomUserManager(BaseUserManager):
@@ -24,3 +26,56 @@ class CustomUserManager(BaseUserManager):
             raise ValueError("Superuser musi mieć is_superuser=True.")
 
         return self.create_user(email, password, **extra_fields)
+
+    # Zapytanie logowania kompilowane raz na bazę — kompilacja UNION z
+    # podzapytaniami w ORM kosztuje więcej niż samo wykonanie. Parametry
+    # równe _EMAIL_PLACEHOLDER są podmieniane na szukany email.
+    _EMAIL_PLACEHOLDER = "\x00email\x00"
+    _login_sql: dict[str, tuple[str, tuple]] = {}
+
+    def _login_querysets(self, email: str):
+        from allauth.account.models import EmailAddress
+
+        addresses = EmailAddress.objects.filter(email=email)
+        annotations = {
+            "email_lower": Lower("email"),
+            "has_verified_email": Exists(
+                addresses.filter(user=OuterRef("pk"), verified=True)
+            ),
+        }
+        by_email = self.annotate(**annotations).filter(email_lower=email)
+        by_address = self.filter(emailaddress__email=email).annotate(**annotations)
+        return by_email, by_address
+
+    def for_login(self, email: str) -> list:
+        """
+        Kandydaci do logowania emailem — jedno zapytanie (UNION).
+
+        Semantyka jak `filter_users_by_email(prefer_verified=True)` z allauth:
+        użytkownicy z pasującym EmailAddress lub polem email; jeśli któryś
+        adres jest zweryfikowany, zwracani są tylko tacy użytkownicy. Pole
+        email porównywane jest przez lower(email), więc zapytanie trafia
+        w indeks funkcyjny accounts_user_email_lower.
+        """
+        alias = self.db
+        compiled = self._login_sql.get(alias)
+        if compiled is None:
+            # Gałęzie składane ręcznie: QuerySet.union() nadaje kolumnom
+            # aliasy colN, których raw() nie mapuje na pola modelu.
+            parts = [
+                queryset.query.get_compiler(using=alias).as_sql()
+                for queryset in self._login_querysets(self._EMAIL_PLACEHOLDER)
+            ]
+            compiled = (
+                " UNION ".join(sql for sql, _ in parts),
+                tuple(param for _, params in parts for param in params),
+            )
+            self._login_sql[alias] = compiled
+        sql, params = compiled
+
+        email = email.lower()
+        params = [email if p == self._EMAIL_PLACEHOLDER else p for p in params]
+        users = list(self.raw(sql, params))
+
+        verified = [user for user in users if user.has_verified_email]
+        return verified or users
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:31
+
+from django.db import migrations, models
+
+
+def keep_newest_default(apps, schema_editor):
+    """Zostaw najnowszy adres domyślny per profil — inaczej indeks się nie utworzy."""
+    Address = apps.get_model("accounts", "Address")
+    seen = set()
+    duplicates = []
+    for address_id, profile_id in (
+        Address.objects.filter(is_default=True)
+        .order_by("profile_id", "-created_at")
+        .values_list("id", "profile_id")
+        .iterator()
+    ):
+        if profile_id in seen:
+            duplicates.append(address_id)
+        seen.add(profile_id)
+    Address.objects.filter(pk__in=duplicates).update(is_default=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_newest_default, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='address',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_default', True)), fields=('profile', 'is_default'), name='accounts_address_one_default_per_profile'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_address_one_default_per_profile'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='address',
+            options={'ordering': ['-created_at', '-id'], 'verbose_name': 'Address', 'verbose_name_plural': 'Addresses'},
+        ),
+        migrations.AlterModelOptions(
+            name='profile',
+            options={'ordering': ['-created_at', '-id'], 'verbose_name': 'Profile', 'verbose_name_plural': 'Profiles'},
+        ),
+        migrations.AddIndex(
+            model_name='address',
+            index=models.Index(fields=['created_at', 'id'], name='accounts_address_cursor'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['created_at', 'id'], name='accounts_profile_cursor'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:45
+
+import common.identifiers
+from django.db import migrations, models
+
+
+# Zmienia tylko domyślną wartość po stronie Pythona (common.identifiers) —
+# migracja nie wykonuje SQL, a istniejące klucze uuid4 zostają bez zmian.
+# Po włączeniu TIMESTAMPED_MODEL_UUID7 nowe wiersze dostają UUIDv7 w tej
+# samej kolumnie uuid.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='address',
+            name='id',
+            field=models.UUIDField(default=common.identifiers.default_uuid, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='id',
+            field=models.UUIDField(default=common.identifiers.default_uuid, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:48
+
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY nie blokuje zapisów do tabeli użytkowników,
+    # ale nie może działać w transakcji.
+    atomic = False
+
+    dependencies = [
+        ('accounts', '0004_timestamped_model_default_uuid'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='customuser',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='accounts_user_email_lower'),
+        ),
+    ]
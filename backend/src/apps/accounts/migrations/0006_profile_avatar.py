@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:09
+
+import core.storage.storages
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_user_email_lower_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='avatar',
+            field=models.ImageField(blank=True, help_text='Avatar image key in the profiles bucket', max_length=512, storage=core.storage.storages.ProfileStorage, upload_to=''),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:20
+
+import apps.uploads.storages
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_profile_avatar_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='avatar',
+            field=models.ImageField(blank=True, help_text='Avatar image key in the profiles bucket', max_length=512, storage=apps.uploads.storages.ContentAddressedProfileStorage, upload_to=''),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django_countries.fields import CountryField
 
+from apps.accounts.managers import AddressManager
 from common import TimestampedModel
 
 
@@ -30,11 +31,18 @@ class Address(TimestampedModel):
     country = CountryField(blank=True, help_text="Country name")
     is_default = models.BooleanField(default=False, help_text="Is this the default address?")
 
+    objects: AddressManager = AddressManager()
 
-    class Meta:
+    class Meta(TimestampedModel.Meta):
         verbose_name = "Address"
         verbose_name_plural = "Addresses"
-        ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["profile", "is_default"],
+                condition=models.Q(is_default=True),
+                name="accounts_address_one_default_per_profile",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.street}, {self.city}, {self.state}, {self.postal_code}, {self.country}"
\ No newline at end of file
@@ -4,7 +4,9 @@ from django.conf import settings
 from django.db import models
 from phonenumber_field.modelfields import PhoneNumberField
 
+from apps.accounts.managers import ProfileManager
 from apps.accounts.models.roles_model import RoleChoices
+from apps.uploads.storages import ContentAddressedProfileStorage
 from common import TimestampedModel
 
 # Create your models here.
@@ -19,6 +21,8 @@ class Profile(TimestampedModel):
         date_of_birth: User's date of birth.
         phone_number: Primary phone number with country code.
         role: User's role in the system.
+        avatar: Avatar image in the profiles bucket (set by direct uploads).
+        avatar_variants: Resized avatar keys, {format: {width: key}}.
     """
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
@@ -47,11 +51,23 @@ class Profile(TimestampedModel):
         choices=RoleChoices.choices,
         default=RoleChoices.CUSTOMER,
         )
+    avatar = models.ImageField(
+        storage=ContentAddressedProfileStorage,
+        max_length=512,
+        blank=True,
+        help_text="Avatar image key in the profiles bucket",
+    )
+    avatar_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Resized avatar variant keys by format and width",
+    )
+
+    objects: ProfileManager = ProfileManager()
 
-    class Meta:
+    class Meta(TimestampedModel.Meta):
         verbose_name = "Profile"
         verbose_name_plural = "Profiles"
-        ordering = ["-created_at"]
 
     def __str__(self):
         return f"{self.user.email} - {self.role}"
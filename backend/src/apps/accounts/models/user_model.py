@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
+from django.db.models.functions import Lower
 
 from apps.accounts.managers import CustomUserManager
 
@@ -30,6 +31,11 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = "Użytkownik"
         verbose_name_plural = "Użytkownicy"
+        indexes = [
+            # Logowanie porównuje email bez rozróżniania wielkości liter
+            # (CustomUserManager.for_login).
+            models.Index(Lower("email"), name="accounts_user_email_lower"),
+        ]
 
     def __str__(self):
         return self.email
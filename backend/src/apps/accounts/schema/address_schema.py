@@ -1,12 +1,25 @@
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiResponse,
     extend_schema,
     extend_schema_view,
+    inline_serializer,
 )
+from rest_framework import serializers
 
 from apps.accounts.serializers import AddressSerializer
 
+ADDRESS_IMPORT_RESULT = inline_serializer(
+    name="AddressImportResult",
+    fields={
+        "created": serializers.IntegerField(),
+        "errors": serializers.ListField(child=serializers.DictField()),
+        "errors_truncated": serializers.BooleanField(),
+        "limit_exceeded": serializers.BooleanField(),
+    },
+)
+
 address_schema = extend_schema_view(
     list=extend_schema(tags=["Addresses"]),
     retrieve=extend_schema(tags=["Addresses"]),
@@ -41,4 +54,44 @@ address_schema = extend_schema_view(
             404: OpenApiResponse(description="Address not found"),
         },
     ),
+    bulk_import=extend_schema(
+        tags=["Addresses"],
+        summary="Bulk Import Addresses",
+        description=(
+            "Imports addresses from an NDJSON body (one camelCase address object "
+            "per line). Invalid lines are skipped and reported by line number. "
+            "Requires Content-Length; the body is capped at 20 MiB and 50 000 "
+            "lines."
+        ),
+        request={"application/x-ndjson": OpenApiTypes.BINARY},
+        responses={
+            201: OpenApiResponse(
+                response=ADDRESS_IMPORT_RESULT,
+                description="At least one address imported",
+            ),
+            200: OpenApiResponse(
+                response=ADDRESS_IMPORT_RESULT, description="No lines in body"
+            ),
+            400: OpenApiResponse(
+                response=ADDRESS_IMPORT_RESULT,
+                description="Empty body, no valid lines or profile missing",
+            ),
+            411: OpenApiResponse(description="Content-Length header missing"),
+            413: OpenApiResponse(
+                response=ADDRESS_IMPORT_RESULT,
+                description="Body size or line limit exceeded",
+            ),
+        },
+    ),
+    bulk_export=extend_schema(
+        tags=["Addresses"],
+        summary="Bulk Export Addresses",
+        description="Streams all addresses of the authenticated user as NDJSON.",
+        responses={
+            (200, "application/x-ndjson"): OpenApiResponse(
+                response=OpenApiTypes.BINARY,
+                description="One camelCase address object per line",
+            ),
+        },
+    ),
 )
@@ -1,4 +1,4 @@
 from .address_serializer import AddressSerializer
-from .profile_serializer import ProfileSerializer
+from .profile_serializer import ProfileReadSerializer, ProfileSerializer
 
-__all__ = ["ProfileSerializer", "AddressSerializer"]
+__all__ = ["ProfileSerializer", "ProfileReadSerializer", "AddressSerializer"]
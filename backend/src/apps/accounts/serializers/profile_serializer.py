@@ -9,6 +9,8 @@ class ProfileSerializer(serializers.ModelSerializer):
     phone_number = PhoneNumberField(required=False, allow_blank=True)
     full_name = serializers.SerializerMethodField(read_only=True)
     age = serializers.SerializerMethodField(read_only=True)
+    avatar = serializers.ImageField(read_only=True)
+    avatar_variants = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = Profile
@@ -21,11 +23,63 @@ class ProfileSerializer(serializers.ModelSerializer):
             "age",
             "phone_number",
             "role",
+            "avatar",
+            "avatar_variants",
         ]
-        read_only_fields = ["email", "role"]
+        read_only_fields = ["email", "role", "avatar", "avatar_variants"]
 
     def get_full_name(self, obj: Profile) -> str:
         return obj.full_name
 
     def get_age(self, obj: Profile) -> int | None:
-        return obj.age
\ No newline at end of file
+        return obj.age
+
+    def get_avatar_variants(self, obj: Profile) -> dict[str, dict[str, str]]:
+        return avatar_variant_urls(obj.avatar_variants)
+
+
+class ProfileReadSerializer(serializers.BaseSerializer):
+    """
+    Szybka ścieżka odczytu profilu — ten sam kształt co ProfileSerializer.
+
+    Działa na wierszach z `Profile.objects.read_rows()` (full_name i age są
+    policzone w SQL, email przychodzi z JOIN-a) i składa słownik bez
+    przechodzenia przez pola DRF. Tylko do odczytu; zapis dalej idzie przez
+    ProfileSerializer.
+    """
+
+    def to_representation(self, row: dict) -> dict:
+        date_of_birth = row["date_of_birth"]
+        phone_number = row["phone_number"]
+        return {
+            "email": row["user__email"],
+            "first_name": row["first_name"],
+            "last_name": row["last_name"],
+            "full_name": row["db_full_name"],
+            "date_of_birth": date_of_birth.isoformat() if date_of_birth else None,
+            "age": row["db_age"],
+            # str(PhoneNumber) formatuje wg PHONENUMBER_DEFAULT_FORMAT,
+            # tak jak PhoneNumberField z DRF.
+            "phone_number": None if phone_number is None else str(phone_number),
+            "role": row["role"],
+            "avatar": avatar_url(row["avatar"]),
+            "avatar_variants": avatar_variant_urls(row["avatar_variants"]),
+        }
+
+
+def avatar_url(name: str) -> str | None:
+    """URL avatara jak w ImageField z DRF (pusta nazwa → None)."""
+    if not name:
+        return None
+    return Profile._meta.get_field("avatar").storage.url(name)
+
+
+def avatar_variant_urls(variants: dict) -> dict[str, dict[str, str]]:
+    """Mapa {format: {szerokość: URL}} wariantów avatara."""
+    if not variants:
+        return {}
+    storage = Profile._meta.get_field("avatar").storage
+    return {
+        fmt: {width: storage.url(key) for width, key in widths.items()}
+        for fmt, widths in variants.items()
+    }
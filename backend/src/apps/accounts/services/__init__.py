@@ -0,0 +1,14 @@
+from .address_bulk_service import (
+    NDJSON_CONTENT_TYPE,
+    AddressBulkService,
+    AddressImportResult,
+)
+from .profile_cache_service import CachedProfile, ProfileCacheService
+
+__all__ = [
+    "NDJSON_CONTENT_TYPE",
+    "AddressBulkService",
+    "AddressImportResult",
+    "CachedProfile",
+    "ProfileCacheService",
+]
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db import transaction
+
+from apps.accounts.models import Address, Profile
+from apps.accounts.serializers import AddressSerializer
+from common.camel_case import camelize, underscoreize
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+@dataclass
+class AddressImportResult:
+    created: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    errors_truncated: bool = False
+    limit_exceeded: bool = False
+
+    def add_error(self, line: int, errors: Any, limit: int) -> None:
+        if len(self.errors) >= limit:
+            self.errors_truncated = True
+            return
+        self.errors.append({"line": line, "errors": errors})
+
+
+class AddressBulkService:
+    """
+    Strumieniowy import i eksport adresów w formacie NDJSON.
+
+    Import czyta body linia po linii, waliduje każdą linię AddressSerializerem
+    i zapisuje `bulk_create` w paczkach po `chunk_size`, każda we własnej
+    krótkiej transakcji. Eksport iteruje po queryset `.iterator(chunk_size)`
+    i emituje po jednej linii na adres. W obu kierunkach pamięć zależy od
+    rozmiaru paczki, a nie od liczby wierszy.
+
+    Klucze w liniach są w camelCase, tak jak w pozostałym API.
+
+    Import ma twarde limity liczby linii (MAX_ROWS) i rozmiaru body
+    (MAX_BYTES) — po ich przekroczeniu czytanie jest przerywane, a wynik
+    ma limit_exceeded=True. Zapisane wcześniej paczki zostają.
+    """
+
+    CHUNK_SIZE = 500
+    MAX_REPORTED_ERRORS = 100
+    MAX_ROWS = 50_000
+    MAX_BYTES = 20 * 1024 * 1024
+
+    @classmethod
+    def import_ndjson(
+        cls,
+        lines: Iterable[bytes],
+        profile: Profile,
+        *,
+        chunk_size: int | None = None,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+    ) -> AddressImportResult:
+        """
+        Zaimportuj adresy z linii NDJSON dla profilu.
+
+        Niepoprawne linie są pomijane i raportowane z numerem linii.
+        Flaga is_default nie idzie przez bulk_create (częściowy unikalny
+        indeks) — ostatni adres oznaczony jako domyślny jest ustawiany
+        przez AddressManager.set_default po zapisie wszystkich paczek.
+
+        Args:
+            lines: Surowe linie body (np. sam request).
+            profile: Profil, do którego trafią adresy.
+            chunk_size: Rozmiar paczki bulk_create.
+            max_rows: Limit niepustych linii (domyślnie MAX_ROWS).
+            max_bytes: Limit bajtów body (domyślnie MAX_BYTES).
+
+        Returns:
+            AddressImportResult: Liczba utworzonych adresów i błędy walidacji.
+        """
+        chunk_size = chunk_size or cls.CHUNK_SIZE
+        max_rows = max_rows or cls.MAX_ROWS
+        max_bytes = max_bytes or cls.MAX_BYTES
+        result = AddressImportResult()
+        pending: list[Address] = []
+        default_candidate: Address | None = None
+        rows = read_bytes = 0
+
+        for number, raw in enumerate(lines, start=1):
+            read_bytes += len(raw)
+            if read_bytes > max_bytes:
+                result.limit_exceeded = True
+                result.add_error(
+                    number, f"Body exceeds {max_bytes} bytes", cls.MAX_REPORTED_ERRORS
+                )
+                break
+            raw = raw.strip()
+            if not raw:
+                continue
+            rows += 1
+            if rows > max_rows:
+                result.limit_exceeded = True
+                result.add_error(
+                    number, f"More than {max_rows} lines", cls.MAX_REPORTED_ERRORS
+                )
+                break
+            try:
+                data = underscoreize(json.loads(raw))
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                result.add_error(number, str(exc), cls.MAX_REPORTED_ERRORS)
+                continue
+            if not isinstance(data, dict):
+                result.add_error(
+                    number, "Expected a JSON object", cls.MAX_REPORTED_ERRORS
+                )
+                continue
+
+            serializer = AddressSerializer(data=data)
+            if not serializer.is_valid():
+                result.add_error(
+                    number, dict(serializer.errors), cls.MAX_REPORTED_ERRORS
+                )
+                continue
+
+            validated = dict(serializer.validated_data)
+            make_default = validated.pop("is_default", False)
+            address = Address(profile=profile, **validated)
+            if make_default:
+                default_candidate = address
+            pending.append(address)
+
+            if len(pending) >= chunk_size:
+                result.created += cls._flush(pending)
+                pending = []
+
+        if pending:
+            result.created += cls._flush(pending)
+        if default_candidate is not None:
+            Address.objects.set_default(default_candidate)
+        return result
+
+    @staticmethod
+    def _flush(addresses: list[Address]) -> int:
+        with transaction.atomic():
+            Address.objects.bulk_create(addresses)
+        return len(addresses)
+
+    @classmethod
+    def export_ndjson(
+        cls, queryset, *, chunk_size: int | None = None
+    ) -> Iterator[bytes]:
+        """
+        Generuj linie NDJSON dla adresów z queryset.
+
+        Args:
+            queryset: Adresy do eksportu.
+            chunk_size: Rozmiar paczki pobieranej z bazy.
+
+        Yields:
+            bytes: Jedna linia NDJSON zakończona znakiem nowej linii.
+        """
+        serializer = AddressSerializer()
+        for address in queryset.order_by("created_at", "id").iterator(
+            chunk_size=chunk_size or cls.CHUNK_SIZE
+        ):
+            row = camelize(serializer.to_representation(address))
+            yield json.dumps(row, ensure_ascii=False).encode() + b"\n"
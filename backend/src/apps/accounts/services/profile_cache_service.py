@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from pack_logger import log
+
+# Podbij przy każdej zmianie kształtu odpowiedzi ProfileSerializer —
+# stare wpisy przestaną pasować do kluczy po deployu.
+PROFILE_CACHE_SCHEMA = 3
+
+
+class CachedProfile(TypedDict):
+    id: str
+    data: dict[str, Any]
+
+
+@dataclass
+class ProfileCacheStats:
+    """Liczniki trafień cache profilu w obrębie procesu."""
+
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    invalidations: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "invalidations": self.invalidations,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.errors = self.invalidations = 0
+
+
+class ProfileCacheService:
+    """
+    Read-through cache zserializowanego profilu per użytkownik.
+
+    Każdy użytkownik ma w cache token wersji oraz wpis z payloadem oznaczonym
+    wersją, z którą został zbudowany. Odczyt pobiera oba klucze jednym
+    `get_many`; wpis jest ważny tylko gdy wersje się zgadzają. Unieważnienie
+    (sygnały Profile/CustomUser) podmienia token wersji, więc payload
+    zbudowany na danych sprzed commita nigdy nie zostanie zwrócony.
+
+    Każdy błąd backendu cache jest liczony i logowany, a odczyt degraduje
+    do zapytania do bazy.
+    """
+
+    KEY_PREFIX = "accounts:profile"
+    stats = ProfileCacheStats()
+
+    @classmethod
+    def _keys(cls, user_id: Any) -> tuple[str, str]:
+        return (
+            f"{cls.KEY_PREFIX}:version:{user_id}",
+            f"{cls.KEY_PREFIX}:payload:{PROFILE_CACHE_SCHEMA}:{user_id}",
+        )
+
+    @staticmethod
+    def _timeout() -> int:
+        return getattr(settings, "ACCOUNTS_PROFILE_CACHE_TIMEOUT", 60 * 15)
+
+    @classmethod
+    def get_or_build(
+        cls,
+        user_id: Any,
+        builder: Callable[[], CachedProfile | None],
+    ) -> CachedProfile | None:
+        """
+        Zwróć profil użytkownika z cache lub zbuduj go i zapisz.
+
+        Args:
+            user_id: Klucz główny użytkownika.
+            builder: Funkcja budująca wpis z bazy (None gdy profil nie istnieje).
+
+        Returns:
+            CachedProfile | None: Wpis z id profilu i danymi serializera.
+        """
+        version_key, payload_key = cls._keys(user_id)
+        try:
+            cached = cache.get_many([version_key, payload_key])
+        except Exception as exc:
+            cls.stats.incr("errors")
+            log.warning("Profile cache unavailable", error=str(exc))
+            return builder()
+
+        version = cached.get(version_key)
+        entry = cached.get(payload_key)
+        if version is not None and entry is not None and entry["version"] == version:
+            cls.stats.incr("hits")
+            return entry["profile"]
+
+        cls.stats.incr("misses")
+        if version is None:
+            version = uuid.uuid4().hex
+            try:
+                if not cache.add(version_key, version, cls._timeout()):
+                    # Ktoś równolegle ustawił wersję — nie zapisujemy payloadu,
+                    # zrobi to kolejny odczyt.
+                    return builder()
+            except Exception as exc:
+                cls.stats.incr("errors")
+                log.warning("Profile cache unavailable", error=str(exc))
+                return builder()
+
+        profile = builder()
+        try:
+            cache.set(
+                payload_key,
+                {"version": version, "profile": profile},
+                cls._timeout(),
+            )
+        except Exception as exc:
+            cls.stats.incr("errors")
+            log.warning("Profile cache write failed", error=str(exc))
+        return profile
+
+    @classmethod
+    def invalidate(cls, user_id: Any) -> None:
+        """
+        Unieważnij profil użytkownika natychmiast i ponownie po commicie.
+
+        Drugie unieważnienie odrzuca wpisy zbudowane przez równoległe odczyty
+        z danych sprzed zakończenia transakcji.
+
+        Args:
+            user_id: Klucz główny użytkownika.
+        """
+        cls._bump_version(user_id)
+        transaction.on_commit(lambda: cls._bump_version(user_id))
+
+    @classmethod
+    def _bump_version(cls, user_id: Any) -> None:
+        version_key, _ = cls._keys(user_id)
+        cls.stats.incr("invalidations")
+        try:
+            cache.set(version_key, uuid.uuid4().hex, cls._timeout())
+        except Exception as exc:
+            cls.stats.incr("errors")
+            log.warning("Profile cache invalidation failed", error=str(exc))
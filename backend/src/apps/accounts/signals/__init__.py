@@ -0,0 +1,14 @@
+from .auth_signals import forget_missing_email_address, forget_missing_user_email
+from .profile_signals import (
+    invalidate_profile_cache,
+    invalidate_user_profile_cache,
+    release_profile_avatar,
+)
+
+__all__ = [
+    "forget_missing_email_address",
+    "forget_missing_user_email",
+    "invalidate_profile_cache",
+    "invalidate_user_profile_cache",
+    "release_profile_avatar",
+]
@@ -0,0 +1,30 @@
+from allauth.account.models import EmailAddress
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.accounts.backends import EmailAuthenticationBackend
+
+
+def _forget_missing(email: str) -> None:
+    # Drugi raz po commicie — próba logowania w trakcie transakcji mogła
+    # zapisać brak użytkownika, którego jeszcze nie widziała.
+    EmailAuthenticationBackend.forget_missing(email)
+    transaction.on_commit(lambda: EmailAuthenticationBackend.forget_missing(email))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def forget_missing_user_email(sender, instance, created, **kwargs) -> None:
+    """Usuń negatywny wpis logowania po utworzeniu użytkownika lub zmianie emaila."""
+    update_fields = kwargs.get("update_fields")
+    if not created and update_fields is not None and "email" not in update_fields:
+        return
+    if instance.email:
+        _forget_missing(instance.email)
+
+
+@receiver(post_save, sender=EmailAddress)
+def forget_missing_email_address(sender, instance: EmailAddress, **kwargs) -> None:
+    """Usuń negatywny wpis logowania po dodaniu adresu email."""
+    _forget_missing(instance.email)
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.models import Profile
+from apps.accounts.services import ProfileCacheService
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_profile_cache(sender, instance: Profile, **kwargs) -> None:
+    """Unieważnij cache profilu po zapisie lub usunięciu profilu."""
+    ProfileCacheService.invalidate(instance.user_id)
+
+
+@receiver(post_delete, sender=Profile)
+def release_profile_avatar(sender, instance: Profile, **kwargs) -> None:
+    """Zwolnij referencję avatara w storage'u adresowanym treścią."""
+    name = instance.avatar.name
+    if name:
+        storage = instance.avatar.storage
+        transaction.on_commit(lambda: storage.delete(name))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_profile_cache(sender, instance, **kwargs) -> None:
+    """
+    Unieważnij cache profilu po zmianie użytkownika.
+
+    Zapis samego `last_login` (każde logowanie) nie zmienia payloadu profilu,
+    więc nie kasuje cache.
+    """
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "email" not in update_fields:
+        return
+    ProfileCacheService.invalidate(instance.pk)
@@ -1,18 +1,24 @@
+from dataclasses import asdict
+
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.accounts.models import Address
+from apps.accounts.models import Address, Profile
 from apps.accounts.schema import address_schema
 from apps.accounts.serializers import AddressSerializer
+from apps.accounts.services import NDJSON_CONTENT_TYPE, AddressBulkService
+from common.query_budget import QueryBudgetMixin
 
 # Create your views here.
 
 
 @address_schema
-class AddressViewSet(viewsets.ModelViewSet):
+class AddressViewSet(QueryBudgetMixin, viewsets.ModelViewSet):
     """
     A viewset for viewing and editing address instances.
 
@@ -24,23 +30,92 @@ class AddressViewSet(viewsets.ModelViewSet):
     - partial_update: PATCH /api/v1/addresses/{id}/
     - destroy:        DELETE /api/v1/addresses/{id}/
     - set_default:    PATCH /api/v1/addresses/{id}/set-default/
+    - bulk_import:    POST /api/v1/addresses/import/  (NDJSON)
+    - bulk_export:    GET  /api/v1/addresses/export/  (NDJSON)
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = AddressSerializer
+    # Stałe niezależnie od liczby adresów (+1 na odczyt użytkownika przy
+    # uwierzytelnieniu sesją). Import/eksport NDJSON skalują się z plikiem.
+    query_budgets = {
+        "list": 2,
+        "retrieve": 2,
+        "create": 5,
+        "update": 5,
+        "partial_update": 5,
+        "destroy": 3,
+        "set_default": 4,
+    }
 
     def get_queryset(self):
-        return Address.objects.filter(user=self.request.user)
+        return Address.objects.for_user(self.request.user)
+
+    def _get_profile(self) -> Profile:
+        profile = Profile.objects.filter(user=self.request.user).first()
+        if profile is None:
+            raise ValidationError("Profile is required to add an address")
+        return profile
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        self._save_with_default(serializer, profile=self._get_profile())
+
+    def perform_update(self, serializer):
+        self._save_with_default(serializer)
+
+    @transaction.atomic
+    def _save_with_default(self, serializer, **kwargs):
+        """Zapisz adres; is_default=True ustaw atomowym przełączeniem w managerze."""
+        if serializer.validated_data.get("is_default") is not True:
+            serializer.save(**kwargs)
+            return
+        serializer.validated_data.pop("is_default")
+        address = serializer.save(**kwargs)
+        if not address.is_default:
+            Address.objects.set_default(address)
 
     @action(detail=True, methods=["patch"], url_path="set-default")
     def set_default(self, request, pk=None):
-        Address.objects.filter(user=request.user).update(is_default=False)
         address = self.get_object()
-        if address.is_default:
+        if address.is_default or not Address.objects.set_default(address):
             raise ValidationError("Address is already set as default")
-        address.is_default = True
-        address.save()
         return Response(self.get_serializer(address).data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def bulk_import(self, request):
+        # Body czytamy strumieniowo z requestu — bez request.data, żeby nie
+        # ładować całego pliku do pamięci. Body bez Content-Length (chunked)
+        # jest pod WSGI nieczytelne — request.stream to wtedy None.
+        content_length = request.META.get("CONTENT_LENGTH", "")
+        if not content_length.isdigit():
+            return Response(
+                {"detail": "Content-Length is required"},
+                status=status.HTTP_411_LENGTH_REQUIRED,
+            )
+        if int(content_length) > AddressBulkService.MAX_BYTES:
+            return Response(
+                {"detail": f"Body exceeds {AddressBulkService.MAX_BYTES} bytes"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        if request.stream is None:
+            raise ValidationError("Request body is empty")
+        profile = self._get_profile()
+        result = AddressBulkService.import_ndjson(request.stream, profile)
+        if result.limit_exceeded:
+            response_status = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        elif result.created:
+            response_status = status.HTTP_201_CREATED
+        elif result.errors:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_200_OK
+        return Response(asdict(result), status=response_status)
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def bulk_export(self, request):
+        response = StreamingHttpResponse(
+            AddressBulkService.export_ndjson(self.get_queryset()),
+            content_type=NDJSON_CONTENT_TYPE,
+        )
+        response["Content-Disposition"] = 'attachment; filename="addresses.ndjson"'
+        return response
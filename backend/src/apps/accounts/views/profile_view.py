@@ -6,11 +6,13 @@ from rest_framework.response import Response
 
 from apps.accounts.models import Profile, RoleChoices
 from apps.accounts.schema import profile_schema
-from apps.accounts.serializers import ProfileSerializer
+from apps.accounts.serializers import ProfileReadSerializer, ProfileSerializer
+from apps.accounts.services import CachedProfile, ProfileCacheService
+from common.query_budget import QueryBudgetMixin
 
 
 @profile_schema
-class ProfileViewSet(viewsets.ModelViewSet):
+class ProfileViewSet(QueryBudgetMixin, viewsets.ModelViewSet):
     """
     A viewset for viewing and editing profile instances.
 
@@ -26,6 +28,14 @@ class ProfileViewSet(viewsets.ModelViewSet):
 
     permission_classes = [IsAuthenticated]
     serializer_class = ProfileSerializer
+    # +1 na odczyt użytkownika przy uwierzytelnieniu sesją.
+    query_budgets = {
+        "list": 2,
+        "retrieve": 2,
+        "partial_update": 4,
+        "update": 4,
+        "change_role": 4,
+    }
 
     def get_queryset(self):
         return Profile.objects.filter(user=self.request.user)
@@ -33,6 +43,33 @@ class ProfileViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    # list i retrieve czytają profil przez ProfileCacheService — powtórny
+    # odczyt nie wykonuje zapytań o profil. Przy chybieniu wpis budowany jest
+    # z jednego wiersza z annotacjami SQL (ProfileReadSerializer).
+    def _build_cached_profile(self) -> CachedProfile | None:
+        row = self.get_queryset().read_rows().first()
+        if row is None:
+            return None
+        return {"id": str(row["id"]), "data": ProfileReadSerializer(row).data}
+
+    def _get_cached_profile(self) -> CachedProfile | None:
+        return ProfileCacheService.get_or_build(
+            self.request.user.pk, self._build_cached_profile
+        )
+
+    def list(self, request, *args, **kwargs):
+        # Profil jest OneToOne z użytkownikiem — lista ma co najwyżej jedną
+        # stronę, więc koperta paginacji nie ma kursorów.
+        cached = self._get_cached_profile()
+        results = [] if cached is None else [cached["data"]]
+        return self.get_paginated_response(results)
+
+    def retrieve(self, request, *args, **kwargs):
+        cached = self._get_cached_profile()
+        if cached is None or cached["id"] != str(kwargs.get(self.lookup_field)):
+            return super().retrieve(request, *args, **kwargs)
+        return Response(cached["data"])
+
     @action(
         detail=True,
         methods=["patch"],
@@ -0,0 +1,34 @@
+from django.contrib import admin
+from django.template.defaultfilters import filesizeformat
+
+from apps.uploads.models import StoredBlob, Upload
+
+
+@admin.register(Upload)
+class UploadAdmin(admin.ModelAdmin):
+    list_display = ("key", "target", "status", "size", "owner", "created_at")
+    list_filter = ("target", "status")
+    search_fields = ("key", "owner__email")
+    readonly_fields = ("committed_at", "created_at", "updated_at")
+
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    list_display = ("key", "bucket", "size", "ref_count", "created_at")
+    list_filter = ("bucket",)
+    search_fields = ("key", "digest")
+    readonly_fields = ("bucket", "key", "digest", "size", "ref_count")
+
+    def has_add_permission(self, request):
+        # Wiersze powstają wyłącznie przy zapisie przez ContentAddressedStorage.
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        stats = StoredBlob.objects.dedupe_stats()
+        title = (
+            f"Stored blobs — dedupe ratio {stats['dedupe_ratio']}×, "
+            f"{filesizeformat(stats['bytes_saved'])} saved "
+            f"({stats['references']} references, {stats['objects']} objects)"
+        )
+        extra_context = {**(extra_context or {}), "title": title, "dedupe": stats}
+        return super().changelist_view(request, extra_context=extra_context)
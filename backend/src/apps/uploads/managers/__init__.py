@@ -0,0 +1,3 @@
+from .stored_blob_manager import StoredBlobManager, StoredBlobQuerySet
+
+__all__ = ["StoredBlobManager", "StoredBlobQuerySet"]
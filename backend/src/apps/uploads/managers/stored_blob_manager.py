@@ -0,0 +1,74 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Sum
+
+
+class StoredBlobQuerySet(models.QuerySet):
+    def acquire(self, bucket: str, key: str) -> bool:
+        """
+        Dodaj referencję do istniejącego obiektu — jedno UPDATE, bez blokad.
+
+        Returns:
+            bool: False, gdy obiektu nie ma w rejestrze (trzeba go wysłać).
+        """
+        updated = self.filter(bucket=bucket, key=key, ref_count__gt=0).update(
+            ref_count=F("ref_count") + 1
+        )
+        return updated > 0
+
+    def register(self, bucket: str, key: str, digest: str, size: int) -> None:
+        """Zapisz nowo wysłany obiekt z jedną referencją (albo dodaj kolejną)."""
+        try:
+            with transaction.atomic():
+                self.create(
+                    bucket=bucket, key=key, digest=digest, size=size, ref_count=1
+                )
+        except IntegrityError:
+            # Ten sam plik wysłany równolegle — obiekt jest ten sam.
+            self.filter(bucket=bucket, key=key).update(ref_count=F("ref_count") + 1)
+
+    def release(self, bucket: str, key: str) -> int | None:
+        """
+        Usuń referencję; przy ostatniej usuń też wiersz rejestru.
+
+        Returns:
+            int | None: Liczba pozostałych referencji albo None, gdy klucza
+                nie ma w rejestrze (obiekt spoza storage'u adresowanego treścią).
+        """
+        with transaction.atomic():
+            blob = self.select_for_update().filter(bucket=bucket, key=key).first()
+            if blob is None:
+                return None
+            if blob.ref_count <= 1:
+                blob.delete()
+                return 0
+            # Wiersz jest zablokowany — zwykłe odejmowanie jest bezpieczne.
+            blob.ref_count -= 1
+            blob.save(update_fields=["ref_count", "updated_at"])
+            return blob.ref_count
+
+    def dedupe_stats(self) -> dict[str, float | int]:
+        """
+        Bieżący efekt deduplikacji.
+
+        logical_bytes to rozmiar wszystkich referencji (ile zajęłyby kopie),
+        stored_bytes — to, co faktycznie leży w bucketach.
+        """
+        totals = self.aggregate(
+            stored_bytes=Sum("size"),
+            logical_bytes=Sum(F("size") * F("ref_count")),
+            references=Sum("ref_count"),
+        )
+        stored = totals["stored_bytes"] or 0
+        logical = totals["logical_bytes"] or 0
+        return {
+            "objects": self.count(),
+            "references": totals["references"] or 0,
+            "stored_bytes": stored,
+            "logical_bytes": logical,
+            "bytes_saved": logical - stored,
+            "dedupe_ratio": round(logical / stored, 2) if stored else 1.0,
+        }
+
+
+class StoredBlobManager(models.Manager.from_queryset(StoredBlobQuerySet)):
+    """Manager rejestru obiektów adresowanych treścią (liczniki referencji)."""
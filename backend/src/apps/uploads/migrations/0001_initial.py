@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 00:09
+
+import common.identifiers
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Upload',
+            fields=[
+                ('id', models.UUIDField(default=common.identifiers.default_uuid, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp when the record was created')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Timestamp when the record was last updated')),
+                ('target', models.CharField(choices=[('profile_avatar', 'Profile avatar'), ('product_image', 'Product image'), ('private_document', 'Private document')], max_length=32)),
+                ('key', models.CharField(max_length=512, unique=True)),
+                ('filename', models.CharField(blank=True, max_length=255)),
+                ('content_type', models.CharField(max_length=100)),
+                ('size', models.PositiveBigIntegerField()),
+                ('checksum_sha256', models.CharField(blank=True, max_length=64)),
+                ('multipart_upload_id', models.CharField(blank=True, max_length=1024)),
+                ('part_size', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('committed', 'Committed'), ('aborted', 'Aborted')], default='pending', max_length=16)),
+                ('committed_at', models.DateTimeField(blank=True, null=True)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='uploads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Upload',
+                'verbose_name_plural': 'Uploads',
+                'ordering': ['-created_at', '-id'],
+                'abstract': False,
+                'indexes': [models.Index(fields=['created_at', 'id'], name='uploads_upload_cursor')],
+            },
+        ),
+    ]
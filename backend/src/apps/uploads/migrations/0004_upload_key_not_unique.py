@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 01:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0003_stored_blob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='upload',
+            name='key',
+            field=models.CharField(db_index=True, max_length=512),
+        ),
+    ]
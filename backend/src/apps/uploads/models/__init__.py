@@ -0,0 +1,4 @@
+from .stored_blob_model import StoredBlob
+from .upload_model import Upload, UploadStatus, UploadTarget
+
+__all__ = ["StoredBlob", "Upload", "UploadStatus", "UploadTarget"]
@@ -0,0 +1,35 @@
+from django.db import models
+
+from apps.uploads.managers import StoredBlobManager
+from common import TimestampedModel
+
+
+class StoredBlob(TimestampedModel):
+    """Object stored once under a content-addressed key.
+
+    Attributes:
+        bucket: Bucket holding the object.
+        key: Content-addressed object key.
+        digest: Hex SHA-256 of the content.
+        size: Object size in bytes.
+        ref_count: Number of saves that currently point at the object.
+    """
+    bucket = models.CharField(max_length=63)
+    key = models.CharField(max_length=512)
+    digest = models.CharField(max_length=64)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=1)
+
+    objects: StoredBlobManager = StoredBlobManager()
+
+    class Meta(TimestampedModel.Meta):
+        verbose_name = "Stored blob"
+        verbose_name_plural = "Stored blobs"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["bucket", "key"], name="uploads_storedblob_bucket_key"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.bucket}/{self.key} ({self.ref_count} refs)"
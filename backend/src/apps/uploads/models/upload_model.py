@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.db import models
+
+from common import TimestampedModel
+
+
+class UploadTarget(models.TextChoices):
+    PROFILE_AVATAR = "profile_avatar", "Profile avatar"
+    PRODUCT_IMAGE = "product_image", "Product image"
+    PRIVATE_DOCUMENT = "private_document", "Private document"
+
+
+class UploadStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    COMMITTED = "committed", "Committed"
+    ABORTED = "aborted", "Aborted"
+
+
+class Upload(TimestampedModel):
+    """Direct-to-S3 upload of a single object.
+
+    Attributes:
+        owner: User who initiated the upload.
+        target: Upload target (decides bucket, limits and linked model).
+        key: Object key in the target bucket (content-addressed after commit
+            for deduplicated targets, so several uploads may share it).
+        filename: Original client-side file name.
+        content_type: Declared MIME type, signed into the upload URL.
+        size: Declared size in bytes, checked on commit.
+        checksum_sha256: Declared base64 SHA-256 of the whole content.
+        multipart_upload_id: S3 UploadId for multipart uploads.
+        part_size: Part size in bytes for multipart uploads.
+        status: Upload lifecycle status.
+        committed_at: Timestamp when the upload was verified and linked.
+        variants: Image variant keys, {format: {width: key}}.
+    """
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="uploads",
+    )
+    target = models.CharField(max_length=32, choices=UploadTarget.choices)
+    key = models.CharField(max_length=512, db_index=True)
+    filename = models.CharField(max_length=255, blank=True)
+    content_type = models.CharField(max_length=100)
+    size = models.PositiveBigIntegerField()
+    checksum_sha256 = models.CharField(max_length=64, blank=True)
+    multipart_upload_id = models.CharField(max_length=1024, blank=True)
+    part_size = models.PositiveBigIntegerField(null=True, blank=True)
+    status = models.CharField(
+        max_length=16,
+        choices=UploadStatus.choices,
+        default=UploadStatus.PENDING,
+    )
+    committed_at = models.DateTimeField(null=True, blank=True)
+    variants = models.JSONField(default=dict, blank=True)
+
+    class Meta(TimestampedModel.Meta):
+        verbose_name = "Upload"
+        verbose_name_plural = "Uploads"
+
+    def __str__(self):
+        return f"{self.target}: {self.key} ({self.status})"
+
+    @property
+    def is_multipart(self) -> bool:
+        return bool(self.multipart_upload_id)
@@ -0,0 +1,3 @@
+from .upload_schema import upload_schema
+
+__all__ = ["upload_schema"]
@@ -0,0 +1,55 @@
+from drf_spectacular.utils import (
+    OpenApiResponse,
+    extend_schema,
+    extend_schema_view,
+)
+
+from apps.uploads.serializers import (
+    UploadCommitSerializer,
+    UploadInitiateSerializer,
+    UploadInstructionsSerializer,
+    UploadSerializer,
+)
+
+upload_schema = extend_schema_view(
+    list=extend_schema(tags=["Uploads"]),
+    retrieve=extend_schema(tags=["Uploads"]),
+    create=extend_schema(
+        tags=["Uploads"],
+        summary="Start Direct Upload",
+        description=(
+            "Creates a pending upload and returns a presigned PUT URL "
+            "(single-part) or one presigned URL per part (multipart). "
+            "The file is sent straight to object storage with the returned "
+            "headers; afterwards call the commit endpoint."
+        ),
+        request=UploadInitiateSerializer,
+        responses={
+            201: UploadInstructionsSerializer,
+            400: OpenApiResponse(description="Invalid type, size or checksum"),
+        },
+    ),
+    commit=extend_schema(
+        tags=["Uploads"],
+        summary="Commit Direct Upload",
+        description=(
+            "Completes a multipart upload, verifies size, content type and "
+            "the declared SHA-256 of the stored object and links it to its "
+            "target model. Objects failing verification are deleted."
+        ),
+        request=UploadCommitSerializer,
+        responses={
+            200: UploadSerializer,
+            400: OpenApiResponse(description="Verification failed"),
+            404: OpenApiResponse(description="Upload not found"),
+        },
+    ),
+    destroy=extend_schema(
+        tags=["Uploads"],
+        summary="Abort Direct Upload",
+        responses={
+            204: OpenApiResponse(description="Upload aborted"),
+            400: OpenApiResponse(description="Upload already committed"),
+        },
+    ),
+)
@@ -0,0 +1,15 @@
+from .upload_serializer import (
+    UploadCommitSerializer,
+    UploadInitiateSerializer,
+    UploadInstructionsSerializer,
+    UploadPartSerializer,
+    UploadSerializer,
+)
+
+__all__ = [
+    "UploadCommitSerializer",
+    "UploadInitiateSerializer",
+    "UploadInstructionsSerializer",
+    "UploadPartSerializer",
+    "UploadSerializer",
+]
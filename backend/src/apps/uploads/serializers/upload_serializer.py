@@ -0,0 +1,76 @@
+from rest_framework import serializers
+
+from apps.uploads.models import Upload, UploadStatus, UploadTarget
+from apps.uploads.services import UPLOAD_TARGETS, ImageVariantService
+
+
+class UploadSerializer(serializers.ModelSerializer):
+    url = serializers.SerializerMethodField(read_only=True)
+    variants = serializers.SerializerMethodField(read_only=True)
+
+    class Meta:
+        model = Upload
+        fields = [
+            "id",
+            "target",
+            "key",
+            "filename",
+            "content_type",
+            "size",
+            "status",
+            "url",
+            "variants",
+            "committed_at",
+        ]
+        read_only_fields = fields
+
+    def get_variants(self, obj: Upload) -> dict[str, dict[str, str]]:
+        return ImageVariantService.variant_urls(obj.target, obj.variants)
+
+    def get_url(self, obj: Upload) -> str | None:
+        if obj.status != UploadStatus.COMMITTED:
+            return None
+        return UPLOAD_TARGETS[obj.target].storage().url(obj.key)
+
+
+class UploadInitiateSerializer(serializers.Serializer):
+    target = serializers.ChoiceField(choices=UploadTarget.choices)
+    filename = serializers.CharField(max_length=255, required=False, allow_blank=True)
+    content_type = serializers.CharField(max_length=100)
+    size = serializers.IntegerField(min_value=1)
+    checksum = serializers.RegexField(
+        r"^[A-Za-z0-9+/]{43}=$",
+        source="checksum_sha256",
+        help_text="Base64-encoded SHA-256 of the whole file",
+    )
+
+
+class UploadPartSerializer(serializers.Serializer):
+    part_number = serializers.IntegerField(min_value=1, max_value=10_000)
+    etag = serializers.CharField(max_length=128)
+
+
+class UploadCommitSerializer(serializers.Serializer):
+    parts = UploadPartSerializer(many=True, required=False)
+
+
+class UploadInstructionsSerializer(UploadSerializer):
+    """Upload i dane do wysłania pliku — odpowiedź na utworzenie uploadu."""
+
+    method = serializers.CharField()
+    upload_url = serializers.CharField(allow_null=True)
+    headers = serializers.DictField(child=serializers.CharField())
+    parts = serializers.ListField(child=serializers.DictField())
+    part_size = serializers.IntegerField(allow_null=True)
+    expires_at = serializers.DateTimeField()
+
+    class Meta(UploadSerializer.Meta):
+        fields = UploadSerializer.Meta.fields + [
+            "method",
+            "upload_url",
+            "headers",
+            "parts",
+            "part_size",
+            "expires_at",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,11 @@
+from .direct_upload_service import DirectUploadService
+from .image_variant_service import ImageVariantError, ImageVariantService
+from .upload_targets import UPLOAD_TARGETS, UploadTargetConfig
+
+__all__ = [
+    "UPLOAD_TARGETS",
+    "DirectUploadService",
+    "ImageVariantError",
+    "ImageVariantService",
+    "UploadTargetConfig",
+]
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import math
+from datetime import datetime, timedelta
+from typing import Any
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.uploads.models import Upload, UploadStatus
+from common import uuid7
+from core.storage.clients import registry
+from core.storage.storages import DefaultStorage
+
+from .upload_targets import EXTENSIONS, SIGNATURES, UPLOAD_TARGETS, UploadTargetConfig
+
+# Limity S3 dla multipart: minimalny rozmiar części (poza ostatnią) i
+# maksymalna liczba części.
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10_000
+
+
+class DirectUploadService:
+    """
+    Uploady bezpośrednio do S3/MinIO przez presigned URL.
+
+    1. initiate() zapisuje Upload (pending) i zwraca presigned PUT — jeden
+       URL albo URL na każdą część uploadu multipart. Content-Type i
+       x-amz-checksum-sha256 są podpisane, więc S3 odrzuci inne nagłówki
+       i (dla single-part) treść o innej sumie kontrolnej.
+    2. Klient wysyła plik prosto do S3 — workery Django nie niosą danych.
+    3. commit() kończy multipart, sprawdza HEAD-em rozmiar i typ, pierwsze
+       bajty pliku i sumę kontrolną, a potem podpina obiekt do modelu.
+       Obiekt, który nie przejdzie weryfikacji, jest usuwany. Dla obrazów
+       po zatwierdzeniu transakcji startuje zadanie budujące warianty.
+
+    Suma SHA-256 całego pliku jest deklarowana przy initiate także dla
+    multipart. S3 nie liczy pełnej sumy SHA-256 obiektu multipart (tylko
+    złożoną z części), więc commit czyta taki obiekt strumieniowo i liczy
+    ją sam — ETag z części podanych przez klienta niczego nie dowodzi.
+    """
+
+    SNIFF_BYTES = 16
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    @classmethod
+    def initiate(
+        cls,
+        owner,
+        *,
+        target: str,
+        content_type: str,
+        size: int,
+        filename: str = "",
+        checksum_sha256: str = "",
+    ) -> tuple[Upload, dict[str, Any]]:
+        """
+        Utwórz upload i zwróć instrukcje dla klienta.
+
+        Raises:
+            ValidationError: Typ lub rozmiar niedozwolony dla celu, albo brak
+                sumy kontrolnej.
+        """
+        config = UPLOAD_TARGETS[target]
+        if content_type not in config.content_types:
+            raise ValidationError({"content_type": "Content type is not allowed"})
+        if size > config.max_size:
+            raise ValidationError(
+                {"size": f"File is too large (max {config.max_size} bytes)"}
+            )
+
+        if not checksum_sha256:
+            raise ValidationError({"checksum": "Checksum is required"})
+        multipart = size > settings.UPLOADS_MULTIPART_THRESHOLD
+
+        storage = config.storage()
+        extension = EXTENSIONS[content_type]
+        upload = Upload(
+            owner=owner,
+            target=target,
+            key=f"{config.prefix}/{owner.pk}/{uuid7().hex}{extension}",
+            filename=filename,
+            content_type=content_type,
+            size=size,
+            checksum_sha256=checksum_sha256,
+        )
+        if multipart:
+            instructions = cls._start_multipart(storage, upload)
+        else:
+            instructions = cls._single_part(storage, upload)
+        upload.save()
+        return upload, instructions
+
+    @classmethod
+    def commit(cls, upload: Upload, parts: list[dict] | None = None) -> Upload:
+        """
+        Zweryfikuj wgrany obiekt i podepnij go do modelu docelowego.
+
+        Wiersz uploadu jest blokowany (select_for_update) na czas weryfikacji,
+        a status sprawdzany ponownie pod blokadą — równoległy commit tego
+        samego uploadu czeka i dostaje błąd zamiast drugiego podpięcia.
+
+        Args:
+            upload: Upload w statusie pending.
+            parts: Dla multipart — lista {"part_number", "etag"} z odpowiedzi S3.
+
+        Returns:
+            Upload: Świeżo odczytany, zatwierdzony upload.
+
+        Raises:
+            ValidationError: Upload nie jest pending, obiektu brak albo nie
+                przeszedł weryfikacji (wtedy obiekt jest usuwany).
+        """
+        with transaction.atomic():
+            upload = Upload.objects.select_for_update().get(pk=upload.pk)
+            if upload.status != UploadStatus.PENDING:
+                raise ValidationError("Upload is not pending")
+
+            config = UPLOAD_TARGETS[upload.target]
+            storage = config.storage()
+            client = storage.connection.meta.client
+            location = {"Bucket": storage.bucket_name, "Key": upload.key}
+
+            try:
+                if upload.is_multipart:
+                    cls._complete_multipart(client, location, upload, parts or [])
+                head = client.head_object(**location, ChecksumMode="ENABLED")
+            except ClientError as exc:
+                raise ValidationError(
+                    f"Uploaded object is missing or incomplete: {exc}"
+                )
+
+            errors = cls._verify(client, location, upload, head)
+            if errors:
+                client.delete_object(**location)
+                upload.status = UploadStatus.ABORTED
+                upload.save(update_fields=["status", "updated_at"])
+            else:
+                cls._link(config, upload)
+        if errors:
+            raise ValidationError(errors)
+        return upload
+
+    @classmethod
+    def abort(cls, upload: Upload) -> None:
+        """Przerwij upload: usuń części multipart lub wgrany obiekt."""
+        with transaction.atomic():
+            # Ta sama blokada co w commit() — abort nie wejdzie w trakcie
+            # weryfikacji i nie usunie już podpiętego obiektu.
+            upload = Upload.objects.select_for_update().get(pk=upload.pk)
+            if upload.status == UploadStatus.COMMITTED:
+                raise ValidationError("Committed uploads cannot be aborted")
+
+            storage = UPLOAD_TARGETS[upload.target].storage()
+            client = storage.connection.meta.client
+            location = {"Bucket": storage.bucket_name, "Key": upload.key}
+            try:
+                if upload.is_multipart:
+                    client.abort_multipart_upload(
+                        **location, UploadId=upload.multipart_upload_id
+                    )
+                else:
+                    client.delete_object(**location)
+            except ClientError:
+                # Części mogły już wygasnąć albo obiekt nigdy nie powstał.
+                pass
+            upload.status = UploadStatus.ABORTED
+            upload.save(update_fields=["status", "updated_at"])
+
+    @staticmethod
+    def part_size(size: int) -> int:
+        """Rozmiar części: z ustawień, ale nie mniej niż limity S3 pozwalają."""
+        return max(
+            settings.UPLOADS_PART_SIZE,
+            MIN_PART_SIZE,
+            math.ceil(size / MAX_PARTS),
+        )
+
+    @staticmethod
+    def presign_client(storage: DefaultStorage):
+        """
+        Klient do podpisywania URL-i — z publicznym endpointem S3/MinIO.
+
+        Podpis obejmuje host, więc URL musi wskazywać adres osiągalny dla
+        klienta (AWS_S3_PUBLIC_ENDPOINT_URL), a nie wewnętrzny endpoint.
+        """
+        endpoint_url = settings.AWS_S3_PUBLIC_ENDPOINT_URL or storage.endpoint_url
+        return registry.client(
+            storage.client_options(
+                endpoint_url=endpoint_url or None, signature_version="s3v4"
+            )
+        )
+
+    @classmethod
+    def _single_part(cls, storage: DefaultStorage, upload: Upload) -> dict:
+        url = cls.presign_client(storage).generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": storage.bucket_name,
+                "Key": upload.key,
+                "ContentType": upload.content_type,
+                "ChecksumSHA256": upload.checksum_sha256,
+            },
+            ExpiresIn=settings.UPLOADS_URL_EXPIRES,
+        )
+        return {
+            "method": "PUT",
+            "upload_url": url,
+            "headers": {
+                "Content-Type": upload.content_type,
+                "x-amz-checksum-sha256": upload.checksum_sha256,
+            },
+            "parts": [],
+            "part_size": None,
+            "expires_at": cls._expires_at(),
+        }
+
+    @classmethod
+    def _start_multipart(cls, storage: DefaultStorage, upload: Upload) -> dict:
+        client = storage.connection.meta.client
+        response = client.create_multipart_upload(
+            Bucket=storage.bucket_name,
+            Key=upload.key,
+            ContentType=upload.content_type,
+        )
+        upload.multipart_upload_id = response["UploadId"]
+        upload.part_size = cls.part_size(upload.size)
+
+        presigner = cls.presign_client(storage)
+        parts = [
+            {
+                "part_number": number,
+                "url": presigner.generate_presigned_url(
+                    "upload_part",
+                    Params={
+                        "Bucket": storage.bucket_name,
+                        "Key": upload.key,
+                        "UploadId": upload.multipart_upload_id,
+                        "PartNumber": number,
+                    },
+                    ExpiresIn=settings.UPLOADS_URL_EXPIRES,
+                ),
+            }
+            for number in range(1, math.ceil(upload.size / upload.part_size) + 1)
+        ]
+        return {
+            "method": "PUT",
+            "upload_url": None,
+            "headers": {},
+            "parts": parts,
+            "part_size": upload.part_size,
+            "expires_at": cls._expires_at(),
+        }
+
+    @staticmethod
+    def _complete_multipart(client, location: dict, upload: Upload, parts) -> None:
+        expected = math.ceil(upload.size / upload.part_size)
+        numbers = sorted(part["part_number"] for part in parts)
+        if numbers != list(range(1, expected + 1)):
+            raise ValidationError({"parts": f"Expected parts 1..{expected}"})
+        client.complete_multipart_upload(
+            **location,
+            UploadId=upload.multipart_upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part["part_number"], "ETag": part["etag"]}
+                    for part in sorted(parts, key=lambda part: part["part_number"])
+                ]
+            },
+        )
+
+    @classmethod
+    def _verify(
+        cls, client, location: dict, upload: Upload, head: dict
+    ) -> dict[str, str]:
+        errors = {}
+        if head.get("ContentLength") != upload.size:
+            errors["size"] = "Uploaded size does not match the declared size"
+        if head.get("ContentType") != upload.content_type:
+            errors["content_type"] = "Uploaded content type does not match"
+        else:
+            head_range = f"bytes=0-{cls.SNIFF_BYTES - 1}"
+            sniff = client.get_object(**location, Range=head_range)["Body"].read()
+            if not SIGNATURES[upload.content_type](sniff):
+                errors["content_type"] = "File content does not match the content type"
+        if not cls._checksum_matches(client, location, upload, head):
+            errors["checksum"] = "Checksum does not match"
+        return errors
+
+    @classmethod
+    def _checksum_matches(
+        cls, client, location: dict, upload: Upload, head: dict
+    ) -> bool:
+        reported = head.get("ChecksumSHA256")
+        # Suma złożona z części ("…-N") nie jest sumą pliku — liczymy sami.
+        if reported and "-" not in reported:
+            return reported == upload.checksum_sha256
+        # Multipart albo magazyn bez sum kontrolnych — liczymy strumieniowo,
+        # małymi porcjami.
+        digest = hashlib.sha256()
+        body = client.get_object(**location)["Body"]
+        for chunk in body.iter_chunks(cls.HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        return base64.b64encode(digest.digest()).decode() == upload.checksum_sha256
+
+    @staticmethod
+    def _link(config: UploadTargetConfig, upload: Upload) -> None:
+        upload.status = UploadStatus.COMMITTED
+        upload.committed_at = timezone.now()
+        upload.save(update_fields=["status", "committed_at", "updated_at"])
+        if config.link is not None:
+            config.link(upload)
+        if config.variants:
+            # Import lokalny — moduł zadań importuje serwisy.
+            from apps.uploads.tasks import build_image_variants
+
+            upload_id = str(upload.pk)
+            transaction.on_commit(lambda: build_image_variants.delay(upload_id))
+
+    @staticmethod
+    def _expires_at() -> datetime:
+        return timezone.now() + timedelta(seconds=settings.UPLOADS_URL_EXPIRES)
+
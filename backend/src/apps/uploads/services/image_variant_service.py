@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import tempfile
+from typing import IO
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from apps.uploads.models import Upload, UploadStatus
+
+from .upload_targets import UPLOAD_TARGETS
+
+# Format wariantu → (format Pillow, Content-Type, rozszerzenie).
+VARIANT_FORMATS = {
+    "webp": ("WEBP", "image/webp", "webp"),
+    "jpeg": ("JPEG", "image/jpeg", "jpg"),
+}
+
+
+class ImageVariantError(Exception):
+    """Obraz źródłowy nie nadaje się do przetworzenia (zbyt duży, uszkodzony)."""
+
+
+class ImageVariantService:
+    """
+    Warianty obrazów (WebP + JPEG w kilku szerokościach) dla zatwierdzonych uploadów.
+
+    Klucze wariantów są adresowane treścią: variants/<sha256 źródła>/
+    w<szerokość>-q<jakość>.<rozszerzenie>. Ten sam plik wgrany ponownie
+    trafia pod te same klucze, więc warianty buduje się tylko raz, a
+    odpowiedzi mogą mieć Cache-Control z długim max-age i immutable.
+
+    Pamięć jest ograniczona niezależnie od rozmiaru źródła:
+    - źródło jest czytane z S3 porcjami do SpooledTemporaryFile (ponad
+      limit ląduje na dysku), hash liczony w locie,
+    - JPEG jest dekodowany od razu w zmniejszonej skali (Image.draft),
+    - liczba pikseli jest sprawdzana przed dekodowaniem,
+    - kolejne szerokości powstają z poprzedniego, większego wariantu.
+    """
+
+    READ_CHUNK_SIZE = 1024 * 1024
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+    @classmethod
+    def process(cls, upload: Upload) -> dict[str, dict[str, str]]:
+        """
+        Zbuduj warianty zatwierdzonego uploadu, zapisz mapę kluczy i przekaż
+        ją do modelu docelowego (np. profil z tym avatarem).
+        """
+        if upload.status != UploadStatus.COMMITTED:
+            return {}
+        upload.variants = cls.build(upload)
+        upload.save(update_fields=["variants", "updated_at"])
+        link_variants = UPLOAD_TARGETS[upload.target].link_variants
+        if link_variants is not None:
+            link_variants(upload)
+        return upload.variants
+
+    @classmethod
+    def build(cls, upload: Upload) -> dict[str, dict[str, str]]:
+        """
+        Zbuduj i wyślij warianty; zwróć mapę {format: {szerokość: klucz}}.
+
+        Raises:
+            ImageVariantError: Obraz przekracza IMAGE_VARIANT_MAX_PIXELS
+                albo nie da się go zdekodować.
+        """
+        storage = UPLOAD_TARGETS[upload.target].storage()
+        client = storage.connection.meta.client
+        bucket = storage.bucket_name
+        # Warianty mają tę samą widoczność co oryginał (np. public-read).
+        acl = {"ACL": storage.default_acl} if storage.default_acl else {}
+
+        with tempfile.SpooledTemporaryFile(max_size=cls.SPOOL_MAX_SIZE) as source:
+            digest = cls._download(client, bucket, upload.key, source)
+            keys = cls.variant_keys(digest)
+            if cls._all_exist(client, bucket, digest, keys):
+                return keys
+            source.seek(0)
+            for fmt, width, body in cls._render(source):
+                _, content_type, _ = VARIANT_FORMATS[fmt]
+                client.put_object(
+                    Bucket=bucket,
+                    Key=keys[fmt][str(width)],
+                    Body=body,
+                    ContentType=content_type,
+                    CacheControl=settings.IMAGE_VARIANT_CACHE_CONTROL,
+                    **acl,
+                )
+        return keys
+
+    @staticmethod
+    def variant_keys(digest: str) -> dict[str, dict[str, str]]:
+        """Deterministyczne klucze wariantów dla skrótu SHA-256 źródła."""
+        quality = settings.IMAGE_VARIANT_QUALITY
+        return {
+            fmt: {
+                str(width): f"variants/{digest}/w{width}-q{quality}.{extension}"
+                for width in settings.IMAGE_VARIANT_WIDTHS
+            }
+            for fmt, (_, _, extension) in VARIANT_FORMATS.items()
+        }
+
+    @classmethod
+    def variant_urls(
+        cls, target: str, variants: dict[str, dict[str, str]]
+    ) -> dict[str, dict[str, str]]:
+        """Mapa {format: {szerokość: URL}} dla zapisanych kluczy wariantów."""
+        if not variants:
+            return {}
+        storage = UPLOAD_TARGETS[target].storage()
+        return {
+            fmt: {width: storage.url(key) for width, key in widths.items()}
+            for fmt, widths in variants.items()
+        }
+
+    @classmethod
+    def _download(cls, client, bucket: str, key: str, target: IO[bytes]) -> str:
+        digest = hashlib.sha256()
+        body = client.get_object(Bucket=bucket, Key=key)["Body"]
+        for chunk in body.iter_chunks(cls.READ_CHUNK_SIZE):
+            digest.update(chunk)
+            target.write(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _all_exist(client, bucket: str, digest: str, keys: dict) -> bool:
+        expected = {key for widths in keys.values() for key in widths.values()}
+        response = client.list_objects_v2(Bucket=bucket, Prefix=f"variants/{digest}/")
+        existing = {item["Key"] for item in response.get("Contents", [])}
+        return expected <= existing
+
+    @classmethod
+    def _render(cls, source: IO[bytes]):
+        """Generator (format, szerokość, bajty) — od największej szerokości."""
+        widths = sorted(settings.IMAGE_VARIANT_WIDTHS, reverse=True)
+        try:
+            with Image.open(source) as image:
+                if image.width * image.height > settings.IMAGE_VARIANT_MAX_PIXELS:
+                    raise ImageVariantError(
+                        f"Image too large: {image.width}x{image.height}"
+                    )
+                # Dekodowanie JPEG od razu w mniejszej skali (DCT) — bufor
+                # nie rośnie do pełnej rozdzielczości źródła.
+                largest = (widths[0], widths[0] * image.height // image.width)
+                image.draft("RGB", largest)
+                current = ImageOps.exif_transpose(image)
+                if current.mode not in ("RGB", "RGBA"):
+                    has_alpha = "A" in current.getbands() or (
+                        "transparency" in current.info
+                    )
+                    current = current.convert("RGBA" if has_alpha else "RGB")
+                current.load()
+        except (OSError, Image.DecompressionBombError) as exc:
+            raise ImageVariantError(str(exc)) from exc
+
+        for width in widths:
+            if current.width > width:
+                height = max(1, round(current.height * width / current.width))
+                current = current.resize((width, height), Image.Resampling.LANCZOS)
+            for fmt in VARIANT_FORMATS:
+                yield fmt, width, cls._encode(current, fmt)
+
+    @staticmethod
+    def _encode(image: Image.Image, fmt: str) -> bytes:
+        pillow_format = VARIANT_FORMATS[fmt][0]
+        if pillow_format == "JPEG" and image.mode != "RGB":
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, "white")
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        buffer = io.BytesIO()
+        image.save(
+            buffer,
+            format=pillow_format,
+            quality=settings.IMAGE_VARIANT_QUALITY,
+            optimize=pillow_format == "JPEG",
+        )
+        return buffer.getvalue()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from apps.accounts.models import Profile
+from apps.uploads.models import Upload, UploadStatus, UploadTarget
+from apps.uploads.storages import (
+    ContentAddressedProductStorage,
+    ContentAddressedStorage,
+)
+from core.storage.storages import (
+    DefaultStorage,
+    PrivateMediaStorage,
+    ProductStorage,
+    ProfileStorage,
+)
+
+MB = 1024 * 1024
+
+IMAGE_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
+
+EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "application/pdf": ".pdf",
+}
+
+# Sygnatury początku pliku dla dozwolonych typów — commit sprawdza, czy
+# zawartość zgadza się z zadeklarowanym Content-Type.
+SIGNATURES: dict[str, Callable[[bytes], bool]] = {
+    "image/jpeg": lambda head: head.startswith(b"\xff\xd8\xff"),
+    "image/png": lambda head: head.startswith(b"\x89PNG\r\n\x1a\n"),
+    "image/webp": lambda head: head[:4] == b"RIFF" and head[8:12] == b"WEBP",
+    "application/pdf": lambda head: head.startswith(b"%PDF-"),
+}
+
+
+def adopt_upload(upload: Upload, storage: ContentAddressedStorage) -> str:
+    """
+    Przenieś zatwierdzony obiekt pod klucz adresowany treścią (jedna nowa
+    referencja w StoredBlob) i zapisz nowy klucz na uploadzie.
+
+    Suma kontrolna jest w tym momencie zweryfikowana przez commit.
+    """
+    digest = base64.b64decode(upload.checksum_sha256).hex()
+    upload.key = storage.adopt(upload.key, digest, upload.size)
+    upload.save(update_fields=["key", "updated_at"])
+    return upload.key
+
+
+def link_profile_avatar(upload: Upload) -> None:
+    """
+    Ustaw wgrany obiekt jako avatar profilu właściciela.
+
+    Referencję trzyma profil: nowy avatar ją dodaje, a poprzedni zwalnia
+    swoją po zatwierdzeniu transakcji (usunięcie profilu — sygnał w accounts).
+    """
+    profile = (
+        Profile.objects.select_for_update().filter(user_id=upload.owner_id).first()
+    )
+    if profile is None:
+        raise ValidationError("Profile is required to set an avatar")
+    storage = Profile._meta.get_field("avatar").storage
+    previous = profile.avatar.name
+    profile.avatar = adopt_upload(upload, storage)
+    profile.avatar_variants = upload.variants
+    profile.save(update_fields=["avatar", "avatar_variants", "updated_at"])
+    if previous:
+        transaction.on_commit(lambda: storage.delete(previous))
+
+
+def link_product_image(upload: Upload) -> None:
+    """Zdeduplikuj zdjęcie produktu — referencję trzyma sam Upload."""
+    adopt_upload(upload, ContentAddressedProductStorage())
+
+
+def release_product_image(upload: Upload) -> None:
+    """Zwolnij referencję zdjęcia produktu po usunięciu uploadu."""
+    if upload.status == UploadStatus.COMMITTED:
+        ContentAddressedProductStorage().delete(upload.key)
+
+
+def link_profile_avatar_variants(upload: Upload) -> None:
+    """Zapisz warianty avatara, jeśli upload nadal jest avatarem profilu."""
+    profile = Profile.objects.filter(
+        user_id=upload.owner_id, avatar=upload.key
+    ).first()
+    if profile is not None:
+        profile.avatar_variants = upload.variants
+        profile.save(update_fields=["avatar_variants", "updated_at"])
+
+
+@dataclass(frozen=True)
+class UploadTargetConfig:
+    """Bucket, limity i model docelowy dla jednego rodzaju uploadu."""
+
+    storage_class: type[DefaultStorage]
+    prefix: str
+    content_types: frozenset[str]
+    max_size: int
+    link: Callable[[Upload], None] | None = None
+    # Wywoływane po usunięciu uploadu, gdy to on trzyma referencję obiektu.
+    release: Callable[[Upload], None] | None = None
+    # Czy po commicie budować warianty obrazu (ImageVariantService) i co z
+    # nimi zrobić poza zapisaniem na Upload.
+    variants: bool = False
+    link_variants: Callable[[Upload], None] | None = None
+
+    def storage(self) -> DefaultStorage:
+        return self.storage_class()
+
+
+UPLOAD_TARGETS: dict[str, UploadTargetConfig] = {
+    UploadTarget.PROFILE_AVATAR: UploadTargetConfig(
+        storage_class=ProfileStorage,
+        prefix="avatars",
+        content_types=IMAGE_TYPES,
+        max_size=5 * MB,
+        link=link_profile_avatar,
+        variants=True,
+        link_variants=link_profile_avatar_variants,
+    ),
+    # Produkty nie mają jeszcze modelu — zatwierdzony Upload jest rekordem
+    # obiektu (i trzyma jego referencję), model produktu podepnie się kluczem.
+    UploadTarget.PRODUCT_IMAGE: UploadTargetConfig(
+        storage_class=ProductStorage,
+        prefix="images",
+        content_types=IMAGE_TYPES,
+        max_size=20 * MB,
+        link=link_product_image,
+        release=release_product_image,
+        variants=True,
+    ),
+    UploadTarget.PRIVATE_DOCUMENT: UploadTargetConfig(
+        storage_class=PrivateMediaStorage,
+        prefix="documents",
+        content_types=IMAGE_TYPES | {"application/pdf"},
+        max_size=50 * MB,
+    ),
+}
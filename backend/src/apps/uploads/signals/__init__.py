@@ -0,0 +1,3 @@
+from .upload_signals import release_upload_object
+
+__all__ = ["release_upload_object"]
@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.uploads.models import Upload
+from apps.uploads.services import UPLOAD_TARGETS
+
+
+@receiver(post_delete, sender=Upload)
+def release_upload_object(sender, instance: Upload, **kwargs) -> None:
+    """Zwolnij referencję obiektu, którą trzymał usunięty upload."""
+    release = UPLOAD_TARGETS[instance.target].release
+    if release is not None:
+        transaction.on_commit(lambda: release(instance))
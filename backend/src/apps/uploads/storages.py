@@ -0,0 +1,118 @@
+"""
+Storage adresowany treścią: jeden obiekt na unikalną zawartość.
+
+Zapis liczy SHA-256 strumieniowo, a obiekt trafia pod klucz wyliczony z
+hasha (cas/ab/cd/<sha256>.<rozszerzenie>). Gdy taki obiekt jest już w
+rejestrze StoredBlob, PUT jest pomijany i przybywa tylko referencja.
+delete() zdejmuje referencję — obiekt znika z bucketu razem z ostatnią.
+
+Obiekty wgrane bezpośrednio przez DirectUploadService trafiają do rejestru
+przez adopt() — kopią po stronie S3, bez przesyłania danych przez proces.
+Klucze spoza rejestru są usuwane jak w zwykłym PublicStorage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+
+from django.core.files import File
+from django.db import transaction
+
+from apps.uploads.models import StoredBlob
+from core.storage.storages import PublicStorage
+
+
+class ContentAddressedStorage(PublicStorage):
+    """PublicStorage z deduplikacją zapisów i licznikiem referencji."""
+
+    location = ""
+    key_prefix = "cas"
+    HASH_CHUNK_SIZE = 1024 * 1024
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+    def content_key(self, digest: str, name: str) -> str:
+        """Klucz obiektu dla skrótu treści; rozszerzenie z nazwy pliku."""
+        extension = os.path.splitext(name)[1].lower()
+        return f"{self.key_prefix}/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+    def _save(self, name, content):
+        if not self._seekable(content):
+            content = self._spool(content)
+        digest, size = self._digest(content)
+        key = self.content_key(digest, name)
+        if StoredBlob.objects.acquire(self.bucket_name, key):
+            return key
+        content.seek(0)
+        key = super()._save(key, content)
+        StoredBlob.objects.register(self.bucket_name, key, digest, size)
+        return key
+
+    def adopt(self, name: str, digest: str, size: int) -> str:
+        """
+        Przejmij obiekt wgrany już do bucketu pod klucz adresowany treścią.
+
+        Obiekt jest kopiowany po stronie S3 (copy_object) — chyba że ta treść
+        już jest w rejestrze, wtedy przybywa tylko referencja. Obiekt źródłowy
+        jest usuwany po zatwierdzeniu transakcji.
+
+        Args:
+            name: Klucz wgranego obiektu.
+            digest: Hex SHA-256 treści — musi być już zweryfikowany.
+            size: Rozmiar obiektu w bajtach.
+
+        Returns:
+            str: Klucz obiektu w rejestrze (z jedną nową referencją).
+        """
+        key = self.content_key(digest, name)
+        client = self.connection.meta.client
+        if not StoredBlob.objects.acquire(self.bucket_name, key):
+            client.copy_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                CopySource={"Bucket": self.bucket_name, "Key": name},
+                ACL=self.default_acl,
+            )
+            StoredBlob.objects.register(self.bucket_name, key, digest, size)
+        if name != key:
+            transaction.on_commit(
+                lambda: client.delete_object(Bucket=self.bucket_name, Key=name)
+            )
+        return key
+
+    def delete(self, name):
+        # Obiekt jest usuwany pod blokadą wiersza rejestru — równoległy zapis
+        # tej samej treści poczeka i wyśle obiekt od nowa.
+        with transaction.atomic():
+            remaining = StoredBlob.objects.release(self.bucket_name, name)
+            if not remaining:
+                super().delete(name)
+
+    def _digest(self, content) -> tuple[str, int]:
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in content.chunks(self.HASH_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+        return digest.hexdigest(), size
+
+    @staticmethod
+    def _seekable(content) -> bool:
+        seekable = getattr(content, "seekable", None)
+        return bool(seekable and seekable())
+
+    def _spool(self, content) -> File:
+        spooled = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE)
+        for chunk in iter(lambda: content.read(self.HASH_CHUNK_SIZE), b""):
+            spooled.write(chunk)
+        spooled.seek(0)
+        return File(spooled, name=getattr(content, "name", None))
+
+
+class ContentAddressedProfileStorage(ContentAddressedStorage):
+    bucket_name = "profiles"
+
+
+class ContentAddressedProductStorage(ContentAddressedStorage):
+    bucket_name = "products"
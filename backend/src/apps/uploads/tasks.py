@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from botocore.exceptions import BotoCoreError, ClientError
+from celery import shared_task
+from pack_logger import log
+
+from apps.uploads.models import Upload
+from apps.uploads.services import ImageVariantError, ImageVariantService
+
+
+@shared_task(
+    autoretry_for=(BotoCoreError, ClientError),
+    retry_backoff=True,
+    max_retries=3,
+    ignore_result=True,
+)
+def build_image_variants(upload_id: str) -> int:
+    upload = Upload.objects.filter(pk=upload_id).first()
+    if upload is None:
+        return 0
+    try:
+        variants = ImageVariantService.process(upload)
+    except ImageVariantError as exc:
+        log.warning("Image variants skipped", upload_id=upload_id, error=str(exc))
+        return 0
+    return sum(len(widths) for widths in variants.values())
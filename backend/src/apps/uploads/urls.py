@@ -0,0 +1,11 @@
+from django.urls import include, path
+from rest_framework.routers import SimpleRouter
+
+from apps.uploads.views import UploadViewSet
+
+router = SimpleRouter()
+router.register(r"", UploadViewSet, basename="upload")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
@@ -0,0 +1,3 @@
+from .upload_view import UploadViewSet
+
+__all__ = ["UploadViewSet"]
@@ -0,0 +1,60 @@
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.uploads.models import Upload
+from apps.uploads.schema import upload_schema
+from apps.uploads.serializers import (
+    UploadCommitSerializer,
+    UploadInitiateSerializer,
+    UploadSerializer,
+)
+from apps.uploads.services import DirectUploadService
+
+
+@upload_schema
+class UploadViewSet(
+    mixins.RetrieveModelMixin,
+    mixins.ListModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Direct-to-S3 uploads.
+
+    Actions:
+    - list:     GET    /uploads/
+    - retrieve: GET    /uploads/{id}/
+    - create:   POST   /uploads/              (presigned URL / parts)
+    - commit:   POST   /uploads/{id}/commit/  (verify and link)
+    - destroy:  DELETE /uploads/{id}/         (abort)
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = UploadSerializer
+
+    def get_queryset(self):
+        return Upload.objects.filter(owner=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        serializer = UploadInitiateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload, instructions = DirectUploadService.initiate(
+            request.user, **serializer.validated_data
+        )
+        data = {**self.get_serializer(upload).data, **instructions}
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=["post"])
+    def commit(self, request, pk=None):
+        upload = self.get_object()
+        serializer = UploadCommitSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = DirectUploadService.commit(
+            upload, serializer.validated_data.get("parts")
+        )
+        return Response(self.get_serializer(upload).data, status=status.HTTP_200_OK)
+
+    def destroy(self, request, *args, **kwargs):
+        DirectUploadService.abort(self.get_object())
+        return Response(status=status.HTTP_204_NO_CONTENT)
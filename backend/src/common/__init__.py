@@ -1,3 +1,4 @@
 from .abstract_models import TimestampedModel
+from .identifiers import default_uuid, uuid7
 
-__all__ = ["TimestampedModel"]
+__all__ = ["TimestampedModel", "default_uuid", "uuid7"]
@@ -1,14 +1,14 @@
 
-import uuid
-
 from django.db import models
 
+from common.identifiers import default_uuid
+
 
 class TimestampedModel(models.Model):
     """Abstract base model that provides timestamp fields."""
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=default_uuid,
         editable=False,
     )
     created_at = models.DateTimeField(
@@ -22,4 +22,11 @@ class TimestampedModel(models.Model):
 
     class Meta:
         abstract = True
-        ordering = ["-created_at"]
\ No newline at end of file
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            # Indeks pod paginację keyset (common.pagination).
+            models.Index(
+                fields=["created_at", "id"],
+                name="%(app_label)s_%(class)s_cursor",
+            ),
+        ]
\ No newline at end of file
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from djangorestframework_camel_case.util import (
+    camelize_re,
+    get_underscoreize_re,
+    is_iterable,
+    underscore_to_camel,
+)
+
+# Górna granica wpisów w tablicach memo — klucze z body żądań pochodzą od
+# klienta, więc cache nie może rosnąć bez końca.
+KEY_CACHE_SIZE = 4096
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def camelize_key(key: str) -> str:
+    """snake_case → camelCase, ta sama reguła co djangorestframework_camel_case."""
+    return camelize_re.sub(underscore_to_camel, key)
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def underscore_key(key: str, no_underscore_before_number: bool = False) -> str:
+    """camelCase → snake_case, ta sama reguła co djangorestframework_camel_case."""
+    pattern = get_underscoreize_re(
+        {"no_underscore_before_number": no_underscore_before_number}
+    )
+    return pattern.sub(r"\1_\2", key).lower()
+
+
+def camelize(data: Any, ignore_fields=None, ignore_keys=None) -> Any:
+    """
+    Zamień klucze słowników na camelCase (rekurencyjnie).
+
+    Wynik jest taki sam jak `djangorestframework_camel_case.util.camelize`,
+    ale konwersja kluczy idzie przez memo, a typy skalarne i listy nie
+    przechodzą przez ogólne sprawdzenia iterowalności. Zwraca zwykłe
+    dict/list — przeznaczone do renderowania JSON.
+    """
+    return _camelize(data, ignore_fields or (), ignore_keys or ())
+
+
+def _camelize(data: Any, ignore_fields, ignore_keys) -> Any:
+    if type(data) in _SCALAR_TYPES:
+        return data
+    if isinstance(data, Promise):
+        return force_str(data)
+    if isinstance(data, dict):
+        result = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            if isinstance(key, str) and "_" in key:
+                new_key = camelize_key(key)
+            else:
+                new_key = key
+            if ignore_fields and (key in ignore_fields or new_key in ignore_fields):
+                new_value = value
+            else:
+                new_value = _camelize(value, ignore_fields, ignore_keys)
+            if ignore_keys and (key in ignore_keys or new_key in ignore_keys):
+                result[key] = new_value
+            else:
+                result[new_key] = new_value
+        return result
+    if isinstance(data, (list, tuple)):
+        return [_camelize(item, ignore_fields, ignore_keys) for item in data]
+    if isinstance(data, str) or not is_iterable(data):
+        return data
+    return [_camelize(item, ignore_fields, ignore_keys) for item in data]
+
+
+def underscoreize(
+    data: Any,
+    no_underscore_before_number: bool = False,
+    ignore_fields=None,
+    ignore_keys=None,
+) -> Any:
+    """
+    Zamień klucze słowników na snake_case (rekurencyjnie).
+
+    Odpowiednik `djangorestframework_camel_case.util.underscoreize` dla
+    danych z `json.loads` (dict, list i skalary JSON). QueryDict i pliki
+    dalej obsługują parsery formularzy z biblioteki.
+    """
+    return _underscoreize(
+        data, no_underscore_before_number, ignore_fields or (), ignore_keys or ()
+    )
+
+
+def _underscoreize(data: Any, no_number, ignore_fields, ignore_keys) -> Any:
+    if isinstance(data, dict):
+        result = {}
+        for key, value in data.items():
+            new_key = underscore_key(key, no_number) if isinstance(key, str) else key
+            if ignore_fields and (key in ignore_fields or new_key in ignore_fields):
+                new_value = value
+            else:
+                new_value = _underscoreize(value, no_number, ignore_fields, ignore_keys)
+            if ignore_keys and (key in ignore_keys or new_key in ignore_keys):
+                result[key] = new_value
+            else:
+                result[new_key] = new_value
+        return result
+    if isinstance(data, list):
+        return [
+            _underscoreize(item, no_number, ignore_fields, ignore_keys)
+            for item in data
+        ]
+    return data
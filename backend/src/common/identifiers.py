@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_BITS = 12
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    UUID w wersji 7 (RFC 9562): 48 bitów czasu unix w ms + losowość.
+
+    Kolejne wartości z jednego procesu są ściśle rosnące: pole rand_a jest
+    licznikiem w obrębie milisekundy (start od losowej wartości z dolnej
+    połowy zakresu), a po jego przepełnieniu czas przesuwa się o 1 ms.
+    62 losowe bity rand_b rozdzielają wartości z różnych procesów.
+    """
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _counter = int.from_bytes(os.urandom(2)) & (_COUNTER_MAX >> 1)
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                _last_ms += 1
+                _counter = 0
+        timestamp, counter = _last_ms, _counter
+
+    rand_b = int.from_bytes(os.urandom(8)) & ((1 << 62) - 1)
+    value = (
+        (timestamp & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def uuid7_timestamp_ms(value: uuid.UUID) -> int:
+    """Czas utworzenia (unix ms) zapisany w UUIDv7."""
+    return value.int >> 80
+
+
+def default_uuid() -> uuid.UUID:
+    """
+    Domyślny klucz główny TimestampedModel.
+
+    uuid7 gdy TIMESTAMPED_MODEL_UUID7 jest włączone, w przeciwnym razie
+    uuid4. Oba typy to zwykłe UUID — kolumny, API i istniejące wiersze
+    się nie zmieniają.
+    """
+    if getattr(settings, "TIMESTAMPED_MODEL_UUID7", False):
+        return uuid7()
+    return uuid.uuid4()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from django.core import signing
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class TimestampedCursorPagination(CursorPagination):
+    """
+    Paginacja keyset po (created_at, id) dla modeli TimestampedModel.
+
+    W odróżnieniu od CursorPagination z DRF pozycja kursora to pełna para
+    (created_at, id), a nie pierwsze pole + offset — każda strona to jedno
+    zapytanie z warunkiem zakresowym po indeksie (created_at, id), niezależnie
+    od głębokości. Kursor jest podpisany (django.core.signing), więc klient
+    nie może go zmodyfikować ani podrobić.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    signing_salt = "common.pagination.cursor"
+
+    # Stan strony — domyślnie brak sąsiednich stron, więc
+    # get_paginated_response działa też dla list zbudowanych poza
+    # paginate_queryset (np. odczyt z cache).
+    base_url = None
+    has_next = False
+    has_previous = False
+    next_position = None
+    previous_position = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        position, reverse = self.decode_cursor(request)
+
+        ordering = self._invert(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        first = self._position(results[0]) if results else position
+        last = self._position(results[-1]) if results else position
+        if reverse:
+            self.has_previous, self.has_next = has_more, position is not None
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.previous_position, self.next_position = first, last
+        return results
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self._link(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self._link(self.previous_position, reverse=True)
+
+    def decode_cursor(self, request):
+        """
+        Odczytaj pozycję i kierunek z kursora w query params.
+
+        Raises:
+            NotFound: Kursor uszkodzony lub podpis się nie zgadza.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            position, reverse = signing.loads(encoded, salt=self.signing_salt)
+        except (signing.BadSignature, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(reverse)
+
+    def encode_cursor(self, position, reverse: bool) -> str:
+        return signing.dumps(
+            [position, reverse], salt=self.signing_salt, compress=True
+        )
+
+    def _link(self, position, *, reverse: bool) -> str:
+        return replace_query_param(
+            self.base_url,
+            self.cursor_query_param,
+            self.encode_cursor(position, reverse),
+        )
+
+    def _position(self, instance) -> list[str]:
+        return [
+            instance._meta.get_field(name.lstrip("-")).value_to_string(instance)
+            for name in self.ordering
+        ]
+
+    @staticmethod
+    def _invert(ordering) -> tuple[str, ...]:
+        return tuple(
+            name[1:] if name.startswith("-") else f"-{name}" for name in ordering
+        )
+
+    @staticmethod
+    def _after(ordering, position) -> Q:
+        """
+        Warunek „wiersze za pozycją” dla porządku (pierwsze, drugie pole).
+        Oba pola muszą mieć ten sam kierunek sortowania.
+
+        Zapis `a <= x AND (a < x OR b < y)` zamiast samej alternatywy pozwala
+        planerowi użyć zakresu po indeksie (created_at, id).
+        """
+        (first, second), (first_value, second_value) = ordering, position
+        op = "lt" if first.startswith("-") else "gt"
+        first, second = first.lstrip("-"), second.lstrip("-")
+        return Q(**{f"{first}__{op}e": first_value}) & (
+            Q(**{f"{first}__{op}": first_value})
+            | Q(**{f"{second}__{op}": second_value})
+        )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+
+from django.conf import settings
+from djangorestframework_camel_case.settings import api_settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from common.camel_case import underscoreize
+
+
+class CamelCaseJSONParser(JSONParser):
+    """
+    Parser JSON z kluczami camelCase → snake_case — zamiennik parsera z
+    djangorestframework_camel_case o tym samym wyniku i komunikatach błędów,
+    z konwersją kluczy przez memo (common.camel_case).
+    """
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            data = json.loads(stream.read().decode(encoding))
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+        return underscoreize(data, **self.json_underscoreize)
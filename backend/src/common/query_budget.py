@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections
+from pack_logger import log
+
+_IN_LIST = re.compile(r"\bIN \((?:%s|\?)(?:, ?(?:%s|\?))*\)", re.IGNORECASE)
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACE = re.compile(r"\s+")
+# Sterowanie transakcją — w testach (atomic w transakcji testu) każdy
+# atomic() to SAVEPOINT, na produkcji BEGIN poza kursorem. Nie liczymy.
+_TRANSACTION = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Postać SQL bez wartości — te same zapytania z innymi parametrami
+    dają ten sam fingerprint (listy IN (...) niezależnie od długości).
+    """
+    sql = _IN_LIST.sub("IN (...)", sql)
+    sql = _LITERAL.sub("?", sql)
+    return _SPACE.sub(" ", sql).strip()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Akcja wykonała więcej zapytań, niż pozwala jej budżet."""
+
+
+class QueryLog:
+    """Wrapper SQL (connection.execute_wrappers) zbierający zapytania."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if not sql.startswith(_TRANSACTION):
+            self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def fingerprints(self, limit: int = 5) -> list[tuple[str, int]]:
+        """Najczęstsze fingerprinty — powtarzające się wskazują N+1."""
+        counts = Counter(fingerprint(sql) for sql in self.queries)
+        return counts.most_common(limit)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryLog]:
+    """Zbieraj zapytania wszystkich połączeń wykonane w bloku."""
+    query_log = QueryLog()
+    wrapped = connections.all()
+    for conn in wrapped:
+        conn.execute_wrappers.append(query_log)
+    try:
+        yield query_log
+    finally:
+        for conn in wrapped:
+            conn.execute_wrappers.remove(query_log)
+
+
+def budget_message(label: str, query_log: QueryLog, budget: int) -> str:
+    lines = [f"{label}: {len(query_log)} queries, budget {budget}"]
+    lines += [f"  {count}x {sql}" for sql, count in query_log.fingerprints()]
+    return "\n".join(lines)
+
+
+class QueryBudgetMixin:
+    """
+    Budżet zapytań SQL per akcja viewsetu.
+
+    query_budgets = {"list": 3, "retrieve": 3} — maksymalna liczba zapytań
+    dla akcji, niezależna od liczby zwracanych wierszy (stały budżet
+    wychwytuje N+1). Akcje bez wpisu nie są sprawdzane.
+
+    Tryb z QUERY_BUDGET_MODE: "off"; "log" — przekroczenie logowane z
+    fingerprintami zapytań (produkcja); "raise" — QueryBudgetExceeded.
+    Testy sprawdzają budżety dla 1, 10 i 100 wierszy fixture'm query_budget.
+    """
+
+    query_budgets: dict[str, int] = {}
+
+    def dispatch(self, request, *args, **kwargs):
+        mode = settings.QUERY_BUDGET_MODE
+        if mode == "off" or not self.query_budgets:
+            return super().dispatch(request, *args, **kwargs)
+
+        with capture_queries() as query_log:
+            response = super().dispatch(request, *args, **kwargs)
+        budget = self.query_budgets.get(getattr(self, "action", None))
+        if budget is not None and len(query_log) > budget:
+            label = f"{type(self).__name__}.{self.action}"
+            if mode == "raise":
+                raise QueryBudgetExceeded(budget_message(label, query_log, budget))
+            log.warning(
+                "Query budget exceeded",
+                view=label,
+                queries=len(query_log),
+                budget=budget,
+                fingerprints=[
+                    f"{count}x {sql}" for sql, count in query_log.fingerprints()
+                ],
+            )
+        return response
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+
+from djangorestframework_camel_case.settings import api_settings
+from rest_framework.compat import (
+    INDENT_SEPARATORS,
+    LONG_SEPARATORS,
+    SHORT_SEPARATORS,
+)
+from rest_framework.renderers import JSONRenderer
+
+from common.camel_case import camelize
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """
+    Renderer JSON z kluczami w camelCase — zamiennik renderera z
+    djangorestframework_camel_case o identycznym wyjściu (bajt w bajt).
+
+    Klucze konwertowane są przez memo (common.camel_case), a enkoder JSON
+    dla danej konfiguracji (wcięcie, separatory) jest tworzony raz i
+    używany ponownie. Dane po camelize to zawsze świeże dict/list, więc
+    enkoder nie musi sprawdzać cykli (check_circular=False) — cykl i tak
+    przerwałby wcześniej rekurencję camelize.
+    """
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    _encoders: dict[tuple, object] = {}
+    _encoders_lock = threading.Lock()
+
+    def get_encoder(self, indent, separators):
+        key = (self.encoder_class, indent, separators, self.ensure_ascii, self.strict)
+        encoder = self._encoders.get(key)
+        if encoder is None:
+            with self._encoders_lock:
+                encoder = self._encoders.setdefault(
+                    key,
+                    self.encoder_class(
+                        ensure_ascii=self.ensure_ascii,
+                        check_circular=False,
+                        allow_nan=not self.strict,
+                        indent=indent,
+                        separators=separators,
+                    ),
+                )
+        return encoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent is None:
+            separators = SHORT_SEPARATORS if self.compact else LONG_SEPARATORS
+        else:
+            separators = INDENT_SEPARATORS
+
+        options = self.json_underscoreize
+        ret = self.get_encoder(indent, separators).encode(
+            camelize(
+                data,
+                ignore_fields=options.get("ignore_fields"),
+                ignore_keys=options.get("ignore_keys"),
+            )
+        )
+        # Jak w JSONRenderer z DRF: \u2028 i \u2029 zawsze escapowane.
+        ret = ret.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+        return ret.encode()
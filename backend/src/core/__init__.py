@@ -0,0 +1,5 @@
+# Aplikacja Celery ładowana razem z Django — shared_task (np. .delay() z
+# procesu web) korzysta wtedy z konfiguracji CELERY_* zamiast domyślnej.
+from .celery import app as celery_app
+
+__all__ = ["celery_app"]
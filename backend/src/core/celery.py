@@ -2,11 +2,14 @@ import os
 
 from celery import Celery
 
+from core.services.task_metrics import connect_signals
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
 app = Celery("core")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+connect_signals()
 
 
 @app.task(bind=True)
@@ -0,0 +1,87 @@
+"""
+Usuwanie nieaktywowanych kont paczkami, w limicie czasu.
+
+Konta są przeglądane po pk (keyset), a każda paczka jest usuwana we
+własnej krótkiej transakcji — collector Django kasuje powiązane wiersze
+tylko dla tej paczki, więc accounts_customuser nie jest blokowane na czas
+całego sprzątania. Gdy limit czasu się skończy, kursor (ostatnie pk)
+zostaje w cache'u i następne uruchomienie zaczyna od niego.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from pack_logger import log
+
+from core.services.allauth.selectors import get_stale_unverified_users_queryset
+
+CURSOR_CACHE_KEY = "allauth:stale-users-cleanup:cursor"
+# Kursor ma przetrwać przerwę między uruchomieniami, ale nie wisieć wiecznie.
+CURSOR_TIMEOUT = 7 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class CleanupResult:
+    """Wynik jednego uruchomienia sprzątania."""
+
+    deleted: int
+    batches: int
+    finished: bool
+
+
+def delete_stale_unverified_users(
+    batch_size: int | None = None,
+    time_budget: float | None = None,
+) -> CleanupResult:
+    """
+    Usuń nieaktywowane konta paczkami, do wyczerpania limitu czasu.
+
+    Paczka jest wybierana po pk powyżej kursora, a w transakcji usuwane
+    są tylko konta, które nadal spełniają warunki — konto aktywowane w
+    międzyczasie zostaje.
+
+    Returns:
+        CleanupResult: finished=False, gdy przerwano po limicie czasu.
+    """
+    batch_size = batch_size or settings.STALE_USERS_CLEANUP_BATCH_SIZE
+    if time_budget is None:
+        time_budget = settings.STALE_USERS_CLEANUP_TIME_BUDGET
+    deadline = time.monotonic() + time_budget
+    queryset = get_stale_unverified_users_queryset()
+    label = queryset.model._meta.label
+
+    cursor = cache.get(CURSOR_CACHE_KEY)
+    deleted = batches = 0
+    while True:
+        page = queryset if cursor is None else queryset.filter(pk__gt=cursor)
+        pks = list(page.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            break
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            _, per_model = queryset.filter(pk__in=pks).delete()
+        batches += 1
+        deleted += per_model.get(label, 0)
+        cursor = pks[-1]
+        log.info(
+            "Stale users batch deleted",
+            batch=batches,
+            deleted=per_model.get(label, 0),
+            cursor=cursor,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+
+        if len(pks) < batch_size:
+            break
+        if time.monotonic() >= deadline:
+            cache.set(CURSOR_CACHE_KEY, cursor, CURSOR_TIMEOUT)
+            return CleanupResult(deleted=deleted, batches=batches, finished=False)
+
+    cache.delete(CURSOR_CACHE_KEY)
+    return CleanupResult(deleted=deleted, batches=batches, finished=True)
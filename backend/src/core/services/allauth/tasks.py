@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 from celery import shared_task
+from django.conf import settings
 from pack_logger import log
 
-from core.services.allauth.selectors import get_stale_unverified_users_queryset
+from core.services.allauth.cleanup import delete_stale_unverified_users
 
 
-@shared_task
-def cleanup_stale_unverified_users() -> None:
-    qs = get_stale_unverified_users_queryset()
-
-    count = qs.count()
-    if count > 0:
-        log.info(f"Deleting {count} stale unverified users")
-        qs.delete()
\ No newline at end of file
+@shared_task(ignore_result=False)
+def cleanup_stale_unverified_users() -> int:
+    result = delete_stale_unverified_users()
+    if result.deleted > 0:
+        log.info(
+            f"Deleted {result.deleted} stale unverified users",
+            batches=result.batches,
+            finished=result.finished,
+        )
+    if not result.finished:
+        # Limit czasu wyczerpany — dokończ od kursora po krótkiej przerwie.
+        cleanup_stale_unverified_users.apply_async(
+            countdown=settings.STALE_USERS_CLEANUP_RESUME_DELAY
+        )
+    return result.deleted
@@ -1,4 +1,11 @@
 from .adapter import AsyncAccountAdapter
+from .outbox import MailOutbox, enqueue_mail, mail_outbox
 from .service import MailService
 
-__all__ = ["AsyncAccountAdapter", "MailService"]
+__all__ = [
+    "AsyncAccountAdapter",
+    "MailOutbox",
+    "MailService",
+    "enqueue_mail",
+    "mail_outbox",
+]
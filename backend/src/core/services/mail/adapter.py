@@ -1,20 +1,66 @@
 from __future__ import annotations
 
-from typing import Any, cast
-
 from allauth.account.adapter import DefaultAccountAdapter
-from django.db.transaction import on_commit
+from django.conf import settings
+from django.utils import translation
+from django.utils.encoding import force_str
 
+from core.services.mail.outbox import enqueue_mail
+from core.services.mail.rendering import decode_context, encode_context
 from core.services.mail.service import MailService
-from core.services.mail.tasks import send_email_payloads_task
+from core.services.mail.types import EmailPayload, MailJob
 
 
 class AsyncAccountAdapter(DefaultAccountAdapter):
+    """
+    Adapter allauth wysyłający maile przez Celery.
+
+    Przy MAIL_RENDER_IN_WORKER żądanie kolejkuje tylko prefiks szablonu,
+    odbiorcę i kontekst w JSON; szablony renderuje worker (render_job).
+    Kontekstu, którego nie da się zakodować, nie odkładamy — taki mail
+    jest renderowany od razu, jak wcześniej.
+    """
+
+    # Prefiks tematu policzony w żądaniu — worker nie ma requestu, z którego
+    # format_email_subject() wziąłby nazwę strony.
+    subject_prefix: str | None = None
+
     def send_mail(self, template_prefix: str, email: str, context: dict) -> None:
+        if settings.MAIL_RENDER_IN_WORKER:
+            job = self.mail_job(template_prefix, email, context)
+            if job is not None:
+                enqueue_mail(job)
+                return
         msg = self.render_mail(template_prefix, email, context)
-        payload = MailService.serialize(msg)
-        task = cast(Any, send_email_payloads_task)
-        on_commit(lambda: task.delay([payload]))
+        enqueue_mail(MailService.serialize(msg))
+
+    def mail_job(
+        self, template_prefix: str, email: str, context: dict
+    ) -> MailJob | None:
+        encoded = encode_context(context)
+        if encoded is None:
+            return None
+        return {
+            "template_prefix": template_prefix,
+            "to": email,
+            "context": encoded,
+            "subject_prefix": self.format_email_subject(""),
+            "language": translation.get_language(),
+        }
+
+    def render_job(self, job: MailJob) -> EmailPayload:
+        """Wyrenderuj zakolejkowany mail (w workerze)."""
+        self.subject_prefix = job["subject_prefix"]
+        with translation.override(job["language"]):
+            msg = self.render_mail(
+                job["template_prefix"], job["to"], decode_context(job["context"])
+            )
+        return MailService.serialize(msg)
+
+    def format_email_subject(self, subject: str) -> str:
+        if self.subject_prefix is not None:
+            return self.subject_prefix + force_str(subject)
+        return super().format_email_subject(subject)
 
     def clean_username(self, username: str | None, shallow: bool = False) -> str | None:
         """
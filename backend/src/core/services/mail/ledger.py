@@ -0,0 +1,114 @@
+"""
+Rejestr doręczeń maili w Redis — jeden hash na klucz idempotencji.
+
+Każdy mail dostaje klucz przy kolejkowaniu (enqueue_mail). Worker przed
+wysyłką bierze krótką blokadę klucza i pomija maile już oznaczone jako
+wysłane, więc ponowienie porcji albo ponowne dostarczenie zadania przez
+brokera nie dubluje maili. Po próbie zapisywany jest wynik: status,
+liczba prób, ostatni błąd.
+
+Gdy Redis jest niedostępny, rejestr nie blokuje wysyłki — mail wychodzi
+bez zapisu (jak przed wprowadzeniem rejestru).
+"""
+
+from __future__ import annotations
+
+import time
+
+import redis
+from django.conf import settings
+from pack_logger import log
+
+_clients: dict[str, redis.Redis] = {}
+
+
+class DeliveryStatus:
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+    DEAD = "dead"
+
+
+def get_ledger_redis() -> redis.Redis:
+    """Klient Redis rejestru doręczeń (jeden na URL w procesie)."""
+    url = settings.MAIL_LEDGER_REDIS_URL
+    client = _clients.get(url)
+    if client is None:
+        client = _clients.setdefault(
+            url,
+            redis.Redis.from_url(
+                url,
+                decode_responses=True,
+                socket_connect_timeout=settings.MAIL_LEDGER_REDIS_TIMEOUT,
+                socket_timeout=settings.MAIL_LEDGER_REDIS_TIMEOUT,
+            ),
+        )
+    return client
+
+
+class DeliveryLedger:
+    KEY_PREFIX = "mail:delivery:"
+    LOCK_PREFIX = "mail:delivery-lock:"
+    LOCK_TTL = 300
+
+    def __init__(self, client: redis.Redis | None = None) -> None:
+        self.client = client or get_ledger_redis()
+
+    @classmethod
+    def _key(cls, key: str) -> str:
+        return cls.KEY_PREFIX + key
+
+    def get(self, key: str) -> dict[str, str]:
+        try:
+            return self.client.hgetall(self._key(key))
+        except redis.RedisError:
+            return {}
+
+    def acquire(self, key: str) -> str:
+        """
+        Zablokuj klucz na czas wysyłki.
+
+        Returns:
+            str: "acquired"; "sent", gdy mail już wyszedł; "locked", gdy
+                wysyła go teraz inny worker (albo worker padł w trakcie —
+                blokada wygaśnie po LOCK_TTL).
+        """
+        try:
+            lock = self.LOCK_PREFIX + key
+            if not self.client.set(lock, "1", nx=True, ex=self.LOCK_TTL):
+                return "locked"
+            if self.client.hget(self._key(key), "status") == DeliveryStatus.SENT:
+                self.release(key)
+                return "sent"
+        except redis.RedisError as exc:
+            log.warning("Mail ledger unavailable", error=str(exc))
+        return "acquired"
+
+    def release(self, key: str) -> None:
+        try:
+            self.client.delete(self.LOCK_PREFIX + key)
+        except redis.RedisError:
+            pass
+
+    def mark_sent(self, key: str, recipients: list[str]) -> None:
+        self._record(
+            key,
+            {"status": DeliveryStatus.SENT, "to": ",".join(recipients), "error": ""},
+        )
+
+    def mark_failed(self, key: str, error: str, *, dead: bool = False) -> None:
+        """Zapisz nieudaną próbę; dead — bez kolejnych ponowień."""
+        status = DeliveryStatus.DEAD if dead else DeliveryStatus.FAILED
+        self._record(key, {"status": status, "error": error[:500]})
+
+    def _record(self, key: str, fields: dict[str, str]) -> None:
+        name = self._key(key)
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(name, mapping={**fields, "updated_at": str(int(time.time()))})
+            pipe.hincrby(name, "attempts", 1)
+            pipe.expire(name, settings.MAIL_LEDGER_TTL)
+            pipe.delete(self.LOCK_PREFIX + key)
+            pipe.execute()
+        except redis.RedisError as exc:
+            log.warning("Mail ledger unavailable", error=str(exc))
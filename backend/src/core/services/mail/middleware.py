@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from .outbox import mail_outbox
+
+
+class MailOutboxMiddleware:
+    """Maile z całego żądania wysyłane do workera jednym zadaniem."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with mail_outbox():
+            return self.get_response(request)
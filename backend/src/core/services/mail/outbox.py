@@ -0,0 +1,83 @@
+"""
+Outbox maili: payloady z jednego żądania trafiają do workera razem.
+
+Każdy mail z AsyncAccountAdapter rejestruje on_commit, więc mail z
+wycofanej transakcji (także savepointu) nigdy nie wychodzi. Zatwierdzony
+payload trafia do bufora otwartego przez mail_outbox() — middleware
+otwiera go na czas żądania — a przy zamknięciu bufor jest wysyłany jako
+send_email_payloads_task w porcjach po MAIL_OUTBOX_MAX_BATCH. Rejestracja,
+która wysyła kilka maili, to jeden round trip do brokera.
+
+Poza mail_outbox() (np. shell, zadania Celery bez własnego scope'u) każdy
+mail jest wysyłany osobno po commicie — jak wcześniej.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, cast
+
+from django.conf import settings
+from django.db.transaction import on_commit
+
+from .tasks import send_email_payloads_task
+from .types import QueuedMail
+
+_current: ContextVar[MailOutbox | None] = ContextVar("mail_outbox", default=None)
+
+
+class MailOutbox:
+    """Bufor zatwierdzonych payloadów, wysyłany przy zamknięciu scope'u."""
+
+    def __init__(self) -> None:
+        self.payloads: list[QueuedMail] = []
+        self.closed = False
+
+    def add(self, payload: QueuedMail) -> None:
+        # Transakcja zatwierdzona już po zamknięciu scope'u — nie ma na co czekać.
+        if self.closed:
+            dispatch([payload])
+        else:
+            self.payloads.append(payload)
+
+    def flush(self) -> None:
+        self.closed = True
+        payloads, self.payloads = self.payloads, []
+        dispatch(payloads)
+
+
+def dispatch(payloads: list[QueuedMail]) -> None:
+    """Wyślij payloady do workera — jedno zadanie na porcję."""
+    size = max(1, settings.MAIL_OUTBOX_MAX_BATCH)
+    task = cast(Any, send_email_payloads_task)
+    for start in range(0, len(payloads), size):
+        task.delay(payloads[start : start + size])
+
+
+def enqueue_mail(payload: QueuedMail) -> None:
+    """Zakolejkuj mail po zatwierdzeniu bieżącej transakcji."""
+    payload = {**payload, "idempotency_key": uuid.uuid4().hex}
+    outbox = _current.get()
+    if outbox is None:
+        on_commit(lambda: dispatch([payload]))
+    else:
+        on_commit(lambda: outbox.add(payload))
+
+
+@contextmanager
+def mail_outbox() -> Iterator[MailOutbox]:
+    """Zbieraj maile do końca bloku; zagnieżdżony scope używa zewnętrznego."""
+    outbox = _current.get()
+    if outbox is not None:
+        yield outbox
+        return
+    outbox = MailOutbox()
+    token = _current.set(outbox)
+    try:
+        yield outbox
+    finally:
+        _current.reset(token)
+        outbox.flush()
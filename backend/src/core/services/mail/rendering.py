@@ -0,0 +1,77 @@
+"""
+Kontekst maila allauth w postaci JSON — do renderowania w workerze.
+
+Obsługiwane wartości: typy JSON, listy i słowniki, datetime, instancje
+modeli (pobierane w workerze po pk) oraz strona (current_site, tylko
+name i domain). "request" jest pomijany — worker renderuje bez żądania.
+Kontekst z czymkolwiek innym zwraca None i mail jest renderowany od
+razu, w procesie web.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+from django.apps import apps
+from django.db import models
+from django.utils.functional import Promise
+
+_UNSUPPORTED = object()
+
+SKIPPED_KEYS = frozenset({"request"})
+
+
+def encode_context(context: dict[str, Any]) -> dict[str, Any] | None:
+    """Kontekst szablonu jako JSON albo None, gdy zawiera nieobsługiwane wartości."""
+    encoded = {}
+    for key, value in context.items():
+        if key in SKIPPED_KEYS:
+            continue
+        item = _encode(value)
+        if item is _UNSUPPORTED:
+            return None
+        encoded[key] = item
+    return encoded
+
+
+def decode_context(data: dict[str, Any]) -> dict[str, Any]:
+    """Odtwórz kontekst zakodowany przez encode_context()."""
+    return {key: _decode(value) for key, value in data.items()}
+
+
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Promise):
+        return str(value)
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, models.Model):
+        return {"__model__": value._meta.label_lower, "pk": str(value.pk)}
+    if hasattr(value, "domain") and hasattr(value, "name"):
+        # Site albo RequestSite — szablony allauth czytają tylko te dwa pola.
+        return {"__site__": {"name": str(value.name), "domain": str(value.domain)}}
+    if isinstance(value, (list, tuple)):
+        items = [_encode(item) for item in value]
+        return _UNSUPPORTED if _UNSUPPORTED in items else items
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        items = {key: _encode(item) for key, item in value.items()}
+        return _UNSUPPORTED if _UNSUPPORTED in items.values() else items
+    return _UNSUPPORTED
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__model__" in value:
+        model = apps.get_model(value["__model__"])
+        return model._default_manager.filter(pk=value["pk"]).first()
+    if "__site__" in value:
+        return SimpleNamespace(**value["__site__"])
+    return {key: _decode(item) for key, item in value.items()}
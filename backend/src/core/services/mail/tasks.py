@@ -1,15 +1,101 @@
 from __future__ import annotations
 
+import hashlib
+import json
+
+from allauth.account.adapter import get_adapter
 from celery import shared_task
 from django.conf import settings
 from django.core.mail import get_connection
+from pack_logger import log
 
+from core.services.mail.ledger import DeliveryLedger
 from core.services.mail.service import MailService
-from core.services.mail.types import EmailPayload
+from core.services.mail.types import QueuedMail
+
 
+@shared_task(bind=True, ignore_result=True)
+def send_email_payloads_task(self, payloads: list[QueuedMail]) -> int:
+    """
+    Wyślij porcję maili jednym połączeniem, z rejestrem doręczeń.
 
-@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
-def send_email_payloads_task(self, payloads: list[EmailPayload]) -> int:
+    Elementy z template_prefix (MailJob) są najpierw renderowane — szablony
+    kompiluje raz na proces cached loader Django.
+
+    Każdy mail jest wysyłany i zapisywany w DeliveryLedger osobno: maile już
+    wysłane (ponowienie, redelivery) są pomijane, a do kolejki wracają tylko
+    nieudane — z opóźnieniem rosnącym wykładniczo z liczbą ich prób, do
+    MAIL_MAX_ATTEMPTS.
+    """
+    ledger = DeliveryLedger()
+    adapter = get_adapter()
     connection = get_connection(backend=settings.ACTUAL_EMAIL_BACKEND)
-    messages = [MailService.build(p, connection=connection) for p in payloads]
-    return connection.send_messages(messages) or 0
+    retries: dict[int, list[QueuedMail]] = {}
+    sent = 0
+
+    try:
+        connection.open()
+    except Exception as exc:
+        for item in payloads:
+            _failed(ledger, retries, item, mail_key(item), exc)
+        _schedule(retries)
+        return 0
+
+    try:
+        for item in payloads:
+            key = mail_key(item)
+            state = ledger.acquire(key)
+            if state == "sent":
+                continue
+            if state == "locked":
+                retries.setdefault(DeliveryLedger.LOCK_TTL, []).append(item)
+                continue
+            try:
+                payload = item
+                if "template_prefix" in item:
+                    payload = adapter.render_job(item)
+                message = MailService.build(payload, connection=connection)
+                connection.send_messages([message])
+            except Exception as exc:
+                _failed(ledger, retries, item, key, exc)
+                continue
+            ledger.mark_sent(key, message.to)
+            sent += 1
+    finally:
+        connection.close()
+
+    _schedule(retries)
+    return sent
+
+
+def mail_key(item: QueuedMail) -> str:
+    """Klucz idempotencji — nadany przy kolejkowaniu albo hash treści."""
+    key = item.get("idempotency_key")
+    if key:
+        return key
+    encoded = json.dumps(item, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def retry_delay(attempt: int) -> int:
+    """Opóźnienie (s) przed próbą attempt + 1: backoff × 2^(attempt - 1)."""
+    delay = settings.MAIL_RETRY_BACKOFF * 2 ** (attempt - 1)
+    return min(delay, settings.MAIL_RETRY_BACKOFF_MAX)
+
+
+def _failed(ledger, retries, item: QueuedMail, key: str, exc: Exception) -> None:
+    attempt = item.get("attempt", 0) + 1
+    dead = attempt >= settings.MAIL_MAX_ATTEMPTS
+    ledger.mark_failed(key, repr(exc), dead=dead)
+    if dead:
+        log.error("Mail delivery failed", idempotency_key=key, error=str(exc))
+        return
+    retry = {**item, "idempotency_key": key, "attempt": attempt}
+    retries.setdefault(retry_delay(attempt), []).append(retry)
+
+
+def _schedule(retries: dict[int, list[QueuedMail]]) -> None:
+    # Jedno zadanie na wspólne opóźnienie — maile z tą samą liczbą prób
+    # wracają razem.
+    for countdown, items in retries.items():
+        send_email_payloads_task.apply_async(args=[items], countdown=countdown)
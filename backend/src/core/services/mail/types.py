@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import Any, NotRequired, TypedDict
 
 
 class EmailPayload(TypedDict):
@@ -13,3 +13,22 @@ class EmailPayload(TypedDict):
     reply_to: list[str]
     headers: dict[str, str]
     alternatives: dict[str, str]  # np. {"text/html": "<b>hi</b>"}
+    # Nadawane przy kolejkowaniu (rejestr doręczeń) i przy ponowieniu.
+    idempotency_key: NotRequired[str]
+    attempt: NotRequired[int]
+
+
+class MailJob(TypedDict):
+    """Mail do wyrenderowania w workerze (AsyncAccountAdapter.render_job)."""
+
+    template_prefix: str
+    to: str
+    context: dict[str, Any]  # zakodowany przez rendering.encode_context
+    subject_prefix: str
+    language: str | None
+    idempotency_key: NotRequired[str]
+    attempt: NotRequired[int]
+
+
+# Element zadania send_email_payloads_task: gotowy mail albo do wyrenderowania.
+QueuedMail = EmailPayload | MailJob
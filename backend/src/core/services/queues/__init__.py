@@ -0,0 +1,3 @@
+from .routing import QueueAnnotations, queue_for, route_task
+
+__all__ = ["QueueAnnotations", "queue_for", "route_task"]
@@ -0,0 +1,63 @@
+"""
+Routing zadań Celery do kolejek według tabeli z ustawień.
+
+CELERY_TASK_QUEUE_MAP przypisuje zadaniom (pełna nazwa albo wzorzec,
+np. "core.services.mail.tasks.*") kolejkę, a CELERY_QUEUE_PROFILES
+opisuje kolejkę: priorytet wiadomości i acks_late. Zadanie bez wpisu
+trafia do CELERY_TASK_DEFAULT_QUEUE.
+
+Pula, współbieżność i prefetch to ustawienia procesu workera, nie
+kolejki — każda grupa kolejek ma swój worker (docker/.../worker.sh).
+"""
+
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+from typing import Any
+
+from django.conf import settings
+
+
+def queue_for(task_name: str) -> str:
+    """Kolejka zadania: wpis dokładny, potem pierwszy pasujący wzorzec."""
+    queue_map = settings.CELERY_TASK_QUEUE_MAP
+    queue = queue_map.get(task_name)
+    if queue is not None:
+        return queue
+    for pattern, queue in queue_map.items():
+        if fnmatchcase(task_name, pattern):
+            return queue
+    return settings.CELERY_TASK_DEFAULT_QUEUE
+
+
+def _profile(queue: str) -> dict[str, Any]:
+    return settings.CELERY_QUEUE_PROFILES.get(queue, {})
+
+
+def route_task(name, args, kwargs, options, task=None, **kw) -> dict[str, Any]:
+    """
+    Router Celery (task_routes): kolejka i domyślny priorytet zadania.
+
+    Opcje podane przy wysyłce (apply_async(queue=..., priority=...))
+    Celery nakłada na wynik routera, więc wygrywają.
+    """
+    queue = queue_for(name)
+    route: dict[str, Any] = {"queue": queue}
+    priority = _profile(queue).get("priority")
+    if priority is not None:
+        route["priority"] = priority
+    return route
+
+
+class QueueAnnotations:
+    """Adnotacje zadań (task_annotations): acks_late według profilu kolejki."""
+
+    def annotate(self, task) -> dict[str, Any] | None:
+        profile = _profile(queue_for(task.name))
+        if "acks_late" not in profile:
+            return None
+        return {
+            "acks_late": profile["acks_late"],
+            # Zadanie z padniętego procesu wraca do kolejki (tylko z acks_late).
+            "reject_on_worker_lost": profile["acks_late"],
+        }
@@ -0,0 +1,9 @@
+from .collector import RequestMetrics, export, get_request_metrics
+from .middleware import RequestMetricsMiddleware
+
+__all__ = [
+    "RequestMetrics",
+    "RequestMetricsMiddleware",
+    "export",
+    "get_request_metrics",
+]
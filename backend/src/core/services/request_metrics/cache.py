@@ -0,0 +1,47 @@
+"""
+Backendy cache zliczające trafienia i chybienia bieżącego żądania.
+
+Liczniki trafiają do RequestSample wątku, tylko gdy żądanie przechodzi
+przez RequestMetricsMiddleware; poza żądaniem (Celery, shell) backend
+działa jak bazowy.
+"""
+
+from __future__ import annotations
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from .collector import get_request_metrics
+
+_MISSING = object()
+
+
+class MeteredCacheMixin:
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        sample = get_request_metrics().sample
+        if value is _MISSING:
+            if sample is not None:
+                sample.cache_misses += 1
+            return default
+        if sample is not None:
+            sample.cache_hits += 1
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        values = super().get_many(keys, version)
+        sample = get_request_metrics().sample
+        if sample is not None:
+            sample.cache_hits += len(values)
+            sample.cache_misses += len(keys) - len(values)
+        return values
+
+
+class MeteredRedisCache(MeteredCacheMixin, RedisCache):
+    pass
+
+
+class MeteredLocMemCache(MeteredCacheMixin, LocMemCache):
+    # get_many z BaseCache woła get() per klucz — liczy już get().
+    get_many = LocMemCache.get_many
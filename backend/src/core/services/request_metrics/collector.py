@@ -0,0 +1,219 @@
+"""
+Metryki żądań HTTP agregowane w pamięci procesu, bez blokad.
+
+Każdy wątek zapisuje do własnego słownika statystyk (shard), więc ścieżka
+żądania nie bierze żadnej blokady — blokada chroni tylko rejestrację
+nowego wątku. Eksport sumuje shardy w chwili odczytu.
+
+Shard zakończonego wątku jest doliczany do sumy "retired" i usuwany przy
+rejestracji kolejnego wątku albo przy odczycie — przy serwerze z wątkiem
+na żądanie (runserver) liczba shardów nie rośnie z liczbą żądań.
+
+Metryki są per proces (label "pid"): przy kilku procesach web każdy ma
+własne liczniki, a sumę liczy zapytanie w Prometheusie.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from core.utils.metrics import PrometheusWriter
+
+HISTOGRAMS = {
+    "latency": (
+        "http_request_duration_seconds",
+        "Request latency per resolved view.",
+    ),
+    "queries": ("http_request_db_queries", "Database queries per request."),
+    "size": ("http_response_size_bytes", "Response body size."),
+}
+COUNTERS = {
+    "query_seconds": (
+        "http_request_db_query_seconds_total",
+        "Time spent in database queries.",
+    ),
+    "cache_hits": ("http_request_cache_hits_total", "Cache hits."),
+    "cache_misses": ("http_request_cache_misses_total", "Cache misses."),
+    "errors": ("http_request_errors_total", "Responses with status 5xx."),
+}
+
+
+class RequestSample:
+    """Liczniki bieżącego żądania, zasilane przez wrapper SQL i cache."""
+
+    __slots__ = ("queries", "query_seconds", "cache_hits", "cache_misses")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class ViewStats:
+    """Sumy dla pary (widok, metoda) w jednym wątku."""
+
+    __slots__ = (
+        "latency",
+        "latency_sum",
+        "queries",
+        "queries_sum",
+        "size",
+        "size_sum",
+        "query_seconds",
+        "cache_hits",
+        "cache_misses",
+        "errors",
+    )
+
+    def __init__(self) -> None:
+        self.latency = [0] * (len(settings.REQUEST_METRICS_LATENCY_BUCKETS) + 1)
+        self.queries = [0] * (len(settings.REQUEST_METRICS_QUERY_BUCKETS) + 1)
+        self.size = [0] * (len(settings.REQUEST_METRICS_SIZE_BUCKETS) + 1)
+        self.latency_sum = self.query_seconds = 0.0
+        self.queries_sum = self.size_sum = 0
+        self.cache_hits = self.cache_misses = self.errors = 0
+
+
+# Statystyki jednego wątku: (widok, metoda) → ViewStats.
+Shard = dict[tuple[str, str], ViewStats]
+
+
+class RequestMetrics:
+    """Rejestr shardów statystyk żądań jednego procesu."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, Shard]] = []
+        self._retired: Shard = {}
+        self._lock = threading.Lock()
+        self.latency_buckets = tuple(settings.REQUEST_METRICS_LATENCY_BUCKETS)
+        self.query_buckets = tuple(settings.REQUEST_METRICS_QUERY_BUCKETS)
+        self.size_buckets = tuple(settings.REQUEST_METRICS_SIZE_BUCKETS)
+
+    @property
+    def sample(self) -> RequestSample | None:
+        """Liczniki żądania obsługiwanego w tym wątku (None poza żądaniem)."""
+        return getattr(self._local, "sample", None)
+
+    def start(self) -> RequestSample:
+        sample = self._local.sample = RequestSample()
+        return sample
+
+    def _shard(self) -> Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._reap()
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _reap(self) -> None:
+        """Dolicz shardy zakończonych wątków do sumy retired (pod blokadą)."""
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                _merge(self._retired, shard)
+        self._shards = live
+
+    def record(
+        self,
+        view: str,
+        method: str,
+        status: int,
+        seconds: float,
+        size: int,
+        sample: RequestSample,
+    ) -> None:
+        self._local.sample = None
+        shard = self._shard()
+        stats = shard.get((view, method))
+        if stats is None:
+            stats = shard[(view, method)] = ViewStats()
+        stats.latency[bisect_left(self.latency_buckets, seconds)] += 1
+        stats.latency_sum += seconds
+        stats.queries[bisect_left(self.query_buckets, sample.queries)] += 1
+        stats.queries_sum += sample.queries
+        stats.size[bisect_left(self.size_buckets, size)] += 1
+        stats.size_sum += size
+        stats.query_seconds += sample.query_seconds
+        stats.cache_hits += sample.cache_hits
+        stats.cache_misses += sample.cache_misses
+        if status >= 500:
+            stats.errors += 1
+
+    def snapshot(self) -> Shard:
+        """Sumy ze wszystkich wątków procesu, także już zakończonych."""
+        total: Shard = {}
+        with self._lock:
+            self._reap()
+            shards = [shard for _, shard in self._shards]
+            _merge(total, self._retired)
+        for shard in shards:
+            _merge(total, shard)
+        return total
+
+    def export(self, writer: PrometheusWriter) -> None:
+        snapshot = sorted(self.snapshot().items())
+        pid = str(os.getpid())
+        buckets = {
+            "latency": self.latency_buckets,
+            "queries": self.query_buckets,
+            "size": self.size_buckets,
+        }
+        for field, (name, help_text) in HISTOGRAMS.items():
+            writer.family(name, "histogram", help_text)
+            for (view, method), stats in snapshot:
+                writer.histogram(
+                    name,
+                    {"view": view, "method": method, "pid": pid},
+                    buckets[field],
+                    getattr(stats, field),
+                    getattr(stats, f"{field}_sum"),
+                )
+        for field, (name, help_text) in COUNTERS.items():
+            writer.family(name, "counter", help_text)
+            for (view, method), stats in snapshot:
+                labels = {"view": view, "method": method, "pid": pid}
+                writer.sample(name, labels, getattr(stats, field))
+
+
+def _merge(total: Shard, shard: Shard) -> None:
+    # Kopia kluczy: wątek shardu może w tym czasie dodać nowy widok.
+    for key, stats in list(shard.items()):
+        merged = total.get(key)
+        if merged is None:
+            merged = total[key] = ViewStats()
+        for name in ViewStats.__slots__:
+            value = getattr(stats, name)
+            current = getattr(merged, name)
+            if isinstance(value, list):
+                setattr(merged, name, [a + b for a, b in zip(current, value)])
+            else:
+                setattr(merged, name, current + value)
+
+
+_metrics: RequestMetrics | None = None
+
+
+def get_request_metrics() -> RequestMetrics:
+    """Rejestr metryk żądań procesu (tworzony przy pierwszym użyciu)."""
+    global _metrics
+    if _metrics is None:
+        _metrics = RequestMetrics()
+    return _metrics
+
+
+def export(writer: PrometheusWriter) -> None:
+    """Eksporter dla METRICS_EXPORTERS."""
+    get_request_metrics().export(writer)
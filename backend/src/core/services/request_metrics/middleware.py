@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .collector import RequestSample, get_request_metrics
+
+UNRESOLVED = "<unresolved>"
+# Metodę podaje klient — spoza listy trafiają do jednej etykiety, żeby
+# dowolne czasowniki nie tworzyły nowych serii.
+METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+OTHER_METHOD = "other"
+
+
+class RequestMetricsMiddleware:
+    """
+    Czas, zapytania SQL, trafienia cache i rozmiar odpowiedzi per widok.
+
+    Pierwsze na liście MIDDLEWARE, więc czas obejmuje cały stos. Widok to
+    nazwa z resolver_match (np. "address-list"); żądania bez dopasowanego
+    URL trafiają do "<unresolved>", a niestandardowe metody HTTP do "other".
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.metrics = get_request_metrics()
+
+    def __call__(self, request):
+        sample = self.metrics.start()
+        wrapper = _QueryTimer(sample)
+        wrapped = connections.all()
+        for conn in wrapped:
+            conn.execute_wrappers.append(wrapper)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            elapsed = time.perf_counter() - started
+            for conn in wrapped:
+                conn.execute_wrappers.remove(wrapper)
+
+        match = request.resolver_match
+        # Bez nazwy URL Django podaje tu ścieżkę funkcji widoku.
+        view = match.view_name if match else UNRESOLVED
+        method = request.method if request.method in METHODS else OTHER_METHOD
+        size = 0 if response.streaming else len(response.content)
+        self.metrics.record(view, method, response.status_code, elapsed, size, sample)
+        return response
+
+
+class _QueryTimer:
+    """Wrapper SQL (connection.execute_wrappers) liczący zapytania i czas."""
+
+    __slots__ = ("sample",)
+
+    def __init__(self, sample: RequestSample) -> None:
+        self.sample = sample
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sample.queries += 1
+            self.sample.query_seconds += time.perf_counter() - started
@@ -0,0 +1,3 @@
+from .backend import SessionStore, get_session_redis
+
+__all__ = ["SessionStore", "get_session_redis"]
@@ -0,0 +1,292 @@
+"""
+Silnik sesji: Redis jako magazyn główny, django_session jako trwała kopia.
+
+Zapis sesji trafia tylko do Redisa (SET z TTL) i dopisuje klucz do zbioru
+„brudnych” sesji. Zadanie persist_dirty_sessions co kilka sekund zrzuca ten
+zbiór paczkami do django_session — wiele zapisów jednej sesji kończy się
+jednym UPSERT-em. Odczyt bez trafienia w Redis (restart, eviction) wraca
+do bazy i odtwarza wpis w Redis.
+
+TTL przesuwany jest tylko wtedy, gdy pozostały czas życia spadnie poniżej
+SESSION_REFRESH_THRESHOLD — zamiast zapisu przy każdym requeście
+(SESSION_SAVE_EVERY_REQUEST) jest co najwyżej jeden na okres odświeżenia.
+
+Wylogowanie zostawia w Redis krótkotrwały tombstone. Zrzut sprawdza go po
+commicie i usuwa wiersze sesji wylogowanych w trakcie zrzutu — inaczej
+UPSERT danych odczytanych przed delete() przywróciłby sesję w bazie.
+
+Gdy Redis jest niedostępny, silnik degraduje do zwykłego silnika bazodanowego.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import redis
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends.base import CreateError
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.db import router, transaction
+from django.utils import timezone
+from pack_logger import log
+
+_clients: dict[str, redis.Redis] = {}
+
+
+def get_session_redis() -> redis.Redis:
+    """
+    Klient Redis dla sesji (jeden na URL w procesie).
+
+    Pula połączeń redis-py sama odtwarza się po fork(), więc klient może
+    powstać przed startem workerów.
+    """
+    url = settings.SESSION_REDIS_URL
+    client = _clients.get(url)
+    if client is None:
+        client = _clients.setdefault(
+            url,
+            redis.Redis.from_url(
+                url,
+                decode_responses=True,
+                socket_connect_timeout=settings.SESSION_REDIS_TIMEOUT,
+                socket_timeout=settings.SESSION_REDIS_TIMEOUT,
+            ),
+        )
+    return client
+
+
+class SessionStore(DBStore):
+    KEY_PREFIX = "session:"
+    DIRTY_KEY = "session:dirty"
+    TOMBSTONE_PREFIX = "session:deleted:"
+
+    @classmethod
+    def _key(cls, session_key: str) -> str:
+        return f"{cls.KEY_PREFIX}{session_key}"
+
+    @classmethod
+    def _tombstone(cls, session_key: str) -> str:
+        return f"{cls.TOMBSTONE_PREFIX}{session_key}"
+
+    def _needs_refresh(self, session: dict, remaining: int) -> bool:
+        # Wiek z danych sesji, nie z self — jesteśmy w trakcie load().
+        threshold = settings.SESSION_REFRESH_THRESHOLD
+        age = self.get_expiry_age(expiry=session.get("_session_expiry"))
+        if threshold >= age:
+            # Krótsza sesja (set_expiry) — odświeżaj po połowie życia.
+            threshold = age // 2
+        return remaining < threshold
+
+    def load(self):
+        if self.session_key is None:
+            return {}
+        try:
+            with get_session_redis().pipeline(transaction=False) as pipe:
+                pipe.get(self._key(self.session_key))
+                pipe.ttl(self._key(self.session_key))
+                data, remaining = pipe.execute()
+        except redis.RedisError as exc:
+            log.warning("Session Redis unavailable", error=str(exc))
+            return super().load()
+
+        if data is None:
+            return self._load_from_db()
+
+        session = self.decode(data)
+        if remaining >= 0 and self._needs_refresh(session, remaining):
+            self.modified = True
+        return session
+
+    def _load_from_db(self) -> dict:
+        s = self._get_session_from_db()
+        if s is None:
+            self._session_key = None
+            return {}
+        session = self.decode(s.session_data)
+        remaining = int((s.expire_date - timezone.now()).total_seconds())
+        if remaining > 0:
+            try:
+                get_session_redis().set(
+                    self._key(s.session_key), s.session_data, ex=remaining
+                )
+            except redis.RedisError as exc:
+                log.warning("Session Redis write failed", error=str(exc))
+        if self._needs_refresh(session, remaining):
+            self.modified = True
+        return session
+
+    def exists(self, session_key):
+        try:
+            if get_session_redis().exists(self._key(session_key)):
+                return True
+        except redis.RedisError as exc:
+            log.warning("Session Redis unavailable", error=str(exc))
+        return super().exists(session_key)
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        data = self.encode(self._get_session(no_load=must_create))
+        key = self._key(self.session_key)
+        client = get_session_redis()
+        try:
+            if must_create:
+                if not client.set(key, data, ex=self.get_expiry_age(), nx=True):
+                    raise CreateError
+                client.sadd(self.DIRTY_KEY, self.session_key)
+            else:
+                with client.pipeline(transaction=False) as pipe:
+                    pipe.set(key, data, ex=self.get_expiry_age())
+                    pipe.sadd(self.DIRTY_KEY, self.session_key)
+                    pipe.execute()
+        except redis.RedisError as exc:
+            log.warning("Session Redis write failed", error=str(exc))
+            super().save(must_create=must_create)
+
+    def delete(self, session_key=None):
+        session_key = session_key or self.session_key
+        if session_key is None:
+            return
+        try:
+            with get_session_redis().pipeline(transaction=False) as pipe:
+                # Tombstone przed usunięciem wiersza — zrzut w toku sprawdza
+                # go po swoim commicie (patrz _persist_batch).
+                pipe.set(
+                    self._tombstone(session_key),
+                    1,
+                    ex=settings.SESSION_TOMBSTONE_TTL,
+                )
+                pipe.delete(self._key(session_key))
+                pipe.srem(self.DIRTY_KEY, session_key)
+                pipe.execute()
+        except redis.RedisError as exc:
+            log.warning("Session Redis delete failed", error=str(exc))
+        # Wylogowanie musi być trwałe od razu, nie dopiero po zrzucie.
+        super().delete(session_key)
+
+    @classmethod
+    def persist_dirty(cls, batch_size: int | None = None) -> int:
+        """
+        Zrzuć zmienione sesje z Redisa do django_session paczkami.
+
+        Sesje, których już nie ma w Redis (wylogowane, wygasłe), są
+        pomijane, a wylogowane w trakcie zrzutu — usuwane z bazy po zapisie.
+        Przy błędzie zapisu klucze paczki wracają do zbioru.
+
+        Returns:
+            int: Liczba zapisanych sesji.
+        """
+        batch_size = batch_size or settings.SESSION_PERSIST_BATCH_SIZE
+        client = get_session_redis()
+        persisted = 0
+        while True:
+            session_keys = client.spop(cls.DIRTY_KEY, batch_size)
+            if not session_keys:
+                break
+            try:
+                persisted += cls._persist_batch(client, session_keys)
+            except Exception:
+                client.sadd(cls.DIRTY_KEY, *session_keys)
+                raise
+            if len(session_keys) < batch_size:
+                break
+        return persisted
+
+    @classmethod
+    def _persist_batch(cls, client: redis.Redis, session_keys: list[str]) -> int:
+        with client.pipeline(transaction=False) as pipe:
+            for session_key in session_keys:
+                pipe.get(cls._key(session_key))
+                pipe.ttl(cls._key(session_key))
+            values = pipe.execute()
+
+        now = timezone.now()
+        model = cls.get_model_class()
+        sessions = [
+            model(
+                session_key=session_key,
+                session_data=data,
+                expire_date=now + timedelta(seconds=remaining),
+            )
+            for session_key, data, remaining in zip(
+                session_keys, values[::2], values[1::2]
+            )
+            if data is not None and remaining > 0
+        ]
+        using = cls._db_alias()
+        with transaction.atomic(using=using):
+            model.objects.using(using).bulk_create(
+                sessions,
+                update_conflicts=True,
+                unique_fields=["session_key"],
+                update_fields=["session_data", "expire_date"],
+            )
+
+        # delete() między odczytem a zapisem: tombstone stoi przed jego
+        # DELETE, więc albo DELETE widzi już nasz wiersz, albo widzimy
+        # tombstone tutaj — po commicie, nie przed nim.
+        with client.pipeline(transaction=False) as pipe:
+            for session in sessions:
+                pipe.exists(cls._tombstone(session.session_key))
+            deleted = [
+                session.session_key
+                for session, tombstone in zip(sessions, pipe.execute())
+                if tombstone
+            ]
+        if deleted:
+            model.objects.using(using).filter(session_key__in=deleted).delete()
+        return len(sessions) - len(deleted)
+
+    @classmethod
+    def clear_expired(cls, batch_size: int | None = None) -> int:
+        """
+        Usuń wygasłe sesje z django_session paczkami.
+
+        Każda paczka to osobne krótkie DELETE po kluczach wybranych z
+        indeksu expire_date — w przeciwieństwie do jednego DELETE na całej
+        tabeli nie trzyma długich blokad. Wpisy w Redis wygasają same (TTL).
+        Używane także przez `manage.py clearsessions`.
+
+        Returns:
+            int: Liczba usuniętych sesji.
+        """
+        batch_size = batch_size or settings.SESSION_SWEEP_BATCH_SIZE
+        objects = cls.get_model_class().objects.using(cls._db_alias())
+        now = timezone.now()
+        deleted = 0
+        while True:
+            session_keys = list(
+                objects.filter(expire_date__lt=now)
+                .order_by("expire_date")
+                .values_list("session_key", flat=True)[:batch_size]
+            )
+            if not session_keys:
+                break
+            objects.filter(session_key__in=session_keys).delete()
+            deleted += len(session_keys)
+            if len(session_keys) < batch_size:
+                break
+        return deleted
+
+    @classmethod
+    def _db_alias(cls) -> str:
+        return router.db_for_write(cls.get_model_class())
+
+    # Wersje async z DBStore odpytują bazę bezpośrednio — kierujemy je
+    # przez ścieżkę z Redisem.
+    async def aload(self):
+        return await sync_to_async(self.load)()
+
+    async def aexists(self, session_key):
+        return await sync_to_async(self.exists)(session_key)
+
+    async def asave(self, must_create=False):
+        return await sync_to_async(self.save)(must_create=must_create)
+
+    async def adelete(self, session_key=None):
+        return await sync_to_async(self.delete)(session_key)
+
+    @classmethod
+    async def aclear_expired(cls):
+        return await sync_to_async(cls.clear_expired)()
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from celery import shared_task
+from pack_logger import log
+
+from core.services.sessions.backend import SessionStore
+
+
+@shared_task(ignore_result=True)
+def persist_dirty_sessions() -> int:
+    count = SessionStore.persist_dirty()
+    if count > 0:
+        log.info(f"Persisted {count} sessions")
+    return count
+
+
+@shared_task(ignore_result=False)
+def sweep_expired_sessions() -> int:
+    count = SessionStore.clear_expired()
+    if count > 0:
+        log.info(f"Deleted {count} expired sessions")
+    return count
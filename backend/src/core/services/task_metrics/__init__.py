@@ -0,0 +1,4 @@
+from .signals import connect_signals, metrics
+from .store import TaskMetrics, export, get_metrics_redis
+
+__all__ = ["TaskMetrics", "connect_signals", "export", "get_metrics_redis", "metrics"]
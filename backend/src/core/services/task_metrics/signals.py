@@ -0,0 +1,95 @@
+"""
+Sygnały Celery zasilające metryki zadań (TaskMetrics).
+
+Przy publikacji zadanie dostaje nagłówek enqueued_at; worker liczy z
+niego czas w kolejce (dla zadań z ETA — od ETA), mierzy czas wykonania
+między task_prerun a task_postrun i zlicza sukcesy, błędy i ponowienia.
+Bufor zrzuca po zadaniu (gdy minął interwał) i wątek w tle startowany
+razem z procesem wykonującym zadania.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+from celery import signals, states
+from django.conf import settings
+
+from .store import TaskMetrics
+
+metrics = TaskMetrics()
+_started: dict[str, float] = {}
+
+
+def _enabled() -> bool:
+    return getattr(settings, "TASK_METRICS_ENABLED", False)
+
+
+def on_before_publish(headers=None, **kwargs) -> None:
+    if headers is not None and _enabled():
+        headers["enqueued_at"] = time.time()
+
+
+def on_prerun(task_id=None, task=None, **kwargs) -> None:
+    if not _enabled():
+        return
+    _started[task_id] = time.perf_counter()
+    enqueued_at = getattr(task.request, "enqueued_at", None)
+    if enqueued_at is None:
+        return
+    start = float(enqueued_at)
+    eta = task.request.eta
+    if eta:
+        eta = datetime.fromisoformat(eta) if isinstance(eta, str) else eta
+        start = max(start, eta.timestamp())
+    metrics.observe(task.name, "wait", time.time() - start)
+
+
+def on_postrun(task_id=None, task=None, state=None, **kwargs) -> None:
+    started = _started.pop(task_id, None)
+    if started is None:
+        return
+    metrics.observe(task.name, "runtime", time.perf_counter() - started)
+    if state == states.SUCCESS:
+        metrics.increment(task.name, "succeeded")
+    metrics.flush_if_due()
+
+
+def on_failure(sender=None, **kwargs) -> None:
+    if _enabled():
+        metrics.increment(sender.name, "failed")
+
+
+def on_retry(sender=None, **kwargs) -> None:
+    if _enabled():
+        metrics.increment(sender.name, "retried")
+
+
+def on_process_start(**kwargs) -> None:
+    if _enabled():
+        metrics.start_flusher()
+
+
+def on_shutdown(**kwargs) -> None:
+    if _enabled():
+        metrics.stop_flusher()
+        metrics.flush()
+
+
+def connect_signals() -> None:
+    """Podłącz instrumentację; wywoływane przy tworzeniu aplikacji Celery."""
+    signals.before_task_publish.connect(on_before_publish, weak=False)
+    signals.task_prerun.connect(on_prerun, weak=False)
+    signals.task_postrun.connect(on_postrun, weak=False)
+    signals.task_failure.connect(on_failure, weak=False)
+    signals.task_retry.connect(on_retry, weak=False)
+    # Wątek zrzutu: w dziecku prefork (worker_process_init) albo w procesie
+    # głównym dla pul solo/threads (worker_init; w rodzicu prefork nie ma
+    # obserwacji, a wątek i tak nie przechodzi do dzieci przez fork()).
+    signals.worker_process_init.connect(on_process_start, weak=False)
+    signals.worker_init.connect(on_process_start, weak=False)
+    # Dzieci prefork zrzucają bufor przy wyjściu; pule solo/threads — proces
+    # główny przy zamknięciu workera.
+    signals.worker_process_shutdown.connect(on_shutdown, weak=False)
+    signals.worker_shutdown.connect(on_shutdown, weak=False)
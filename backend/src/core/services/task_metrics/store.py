@@ -0,0 +1,180 @@
+"""
+Metryki zadań Celery: bufor w procesie i agregacja w Redis.
+
+Każdy proces workera (także dziecko prefork) sumuje obserwacje lokalnie —
+bez I/O na zadanie — i najwyżej co TASK_METRICS_FLUSH_INTERVAL sekund
+dodaje je do Redis jednym pipeline'em (HINCRBY / HINCRBYFLOAT) — po
+zadaniu albo z wątku w tle, gdy proces stoi bezczynnie. Redis
+trzyma więc sumy ze wszystkich procesów i hostów, a /metrics/ czyta je
+bez pytania workerów.
+
+Układ kluczy: zbiór TASKS_KEY z nazwami zadań i hash TASK_KEY_PREFIX +
+nazwa z polami "runtime:<le>", "runtime_sum", "runtime_count", "wait:*",
+"succeeded", "failed", "retried". Histogramy przechowują liczniki per
+kubełek; skumulowane wartości liczy eksport.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+import redis
+from django.conf import settings
+from pack_logger import log
+
+if TYPE_CHECKING:
+    # core.utils ładuje widoki DRF — nie przy starcie aplikacji Celery.
+    from core.utils.metrics import PrometheusWriter
+
+TASKS_KEY = "celery:metrics:tasks"
+TASK_KEY_PREFIX = "celery:metrics:task:"
+
+HISTOGRAMS = {
+    "wait": (
+        "celery_task_queue_wait_seconds",
+        "Time from publishing a task to the start of its execution.",
+    ),
+    "runtime": ("celery_task_runtime_seconds", "Task execution time."),
+}
+COUNTERS = {
+    "succeeded": ("celery_task_succeeded_total", "Tasks finished successfully."),
+    "failed": ("celery_task_failed_total", "Tasks that raised an exception."),
+    "retried": ("celery_task_retried_total", "Task retries."),
+}
+
+_clients: dict[str, redis.Redis] = {}
+
+
+def get_metrics_redis() -> redis.Redis:
+    """Klient Redis metryk (jeden na URL w procesie)."""
+    url = settings.TASK_METRICS_REDIS_URL
+    client = _clients.get(url)
+    if client is None:
+        client = _clients.setdefault(
+            url,
+            redis.Redis.from_url(
+                url,
+                decode_responses=True,
+                socket_connect_timeout=settings.TASK_METRICS_REDIS_TIMEOUT,
+                socket_timeout=settings.TASK_METRICS_REDIS_TIMEOUT,
+            ),
+        )
+    return client
+
+
+def _bucket(value: float) -> str:
+    buckets = settings.TASK_METRICS_BUCKETS
+    index = bisect_left(buckets, value)
+    return "+Inf" if index == len(buckets) else repr(float(buckets[index]))
+
+
+class TaskMetrics:
+    """Bufor obserwacji jednego procesu; bezpieczny dla puli wątków."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buffer: dict[str, dict[str, float]] = {}
+        self._last_flush = time.monotonic()
+        self._flusher: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def _add(self, task: str, fields: dict[str, float]) -> None:
+        with self._lock:
+            target = self._buffer.setdefault(task, {})
+            for field, value in fields.items():
+                target[field] = target.get(field, 0) + value
+
+    def observe(self, task: str, histogram: str, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        self._add(
+            task,
+            {
+                f"{histogram}:{_bucket(seconds)}": 1,
+                f"{histogram}_sum": seconds,
+                f"{histogram}_count": 1,
+            },
+        )
+
+    def increment(self, task: str, counter: str) -> None:
+        self._add(task, {counter: 1})
+
+    def flush_if_due(self) -> None:
+        if time.monotonic() - self._last_flush >= settings.TASK_METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def start_flusher(self) -> None:
+        """
+        Zrzucaj bufor w tle co TASK_METRICS_FLUSH_INTERVAL.
+
+        Bez tego ostatnia paczka bezczynnego procesu (np. dziecka prefork po
+        codziennym sprzątaniu) czekałaby na kolejne zadanie. Wątek nie
+        przeżywa fork(), więc każde dziecko prefork startuje własny.
+        """
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        self._stopped.clear()
+        self._flusher = threading.Thread(
+            target=self._run_flusher, name="task-metrics-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def stop_flusher(self) -> None:
+        self._stopped.set()
+
+    def _run_flusher(self) -> None:
+        while not self._stopped.wait(settings.TASK_METRICS_FLUSH_INTERVAL):
+            self.flush_if_due()
+
+    def flush(self, client: redis.Redis | None = None) -> None:
+        """Dodaj bufor do sum w Redis; przy błędzie zostaje na kolejną próbę."""
+        with self._lock:
+            buffer, self._buffer = self._buffer, {}
+            self._last_flush = time.monotonic()
+        if not buffer:
+            return
+        try:
+            pipe = (client or get_metrics_redis()).pipeline(transaction=False)
+            pipe.sadd(TASKS_KEY, *buffer)
+            for task, fields in buffer.items():
+                key = TASK_KEY_PREFIX + task
+                for field, value in fields.items():
+                    if field.endswith("_sum"):
+                        pipe.hincrbyfloat(key, field, value)
+                    else:
+                        pipe.hincrby(key, field, int(value))
+            pipe.execute()
+        except redis.RedisError as exc:
+            log.warning("Task metrics flush failed", error=str(exc))
+            for task, fields in buffer.items():
+                self._add(task, fields)
+
+
+def export(writer: PrometheusWriter, client: redis.Redis | None = None) -> None:
+    """Dopisz metryki zadań z Redis do eksportu Prometheus."""
+    client = client or get_metrics_redis()
+    try:
+        tasks = sorted(client.smembers(TASKS_KEY))
+        pipe = client.pipeline(transaction=False)
+        for task in tasks:
+            pipe.hgetall(TASK_KEY_PREFIX + task)
+        stats = dict(zip(tasks, pipe.execute(), strict=True))
+    except redis.RedisError as exc:
+        log.warning("Task metrics unavailable", error=str(exc))
+        return
+
+    buckets = settings.TASK_METRICS_BUCKETS
+    labels = [*(repr(float(bound)) for bound in buckets), "+Inf"]
+    for histogram, (name, help_text) in HISTOGRAMS.items():
+        writer.family(name, "histogram", help_text)
+        for task, fields in stats.items():
+            counts = [int(fields.get(f"{histogram}:{le}", 0)) for le in labels]
+            total = float(fields.get(f"{histogram}_sum", 0))
+            writer.histogram(name, {"task": task}, buckets, counts, total)
+    for counter, (name, help_text) in COUNTERS.items():
+        writer.family(name, "counter", help_text)
+        for task, fields in stats.items():
+            writer.sample(name, {"task": task}, int(fields.get(counter, 0)))
+
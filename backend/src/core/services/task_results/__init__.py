@@ -0,0 +1,3 @@
+from .cleanup import prune_task_results
+
+__all__ = ["prune_task_results"]
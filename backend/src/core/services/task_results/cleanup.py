@@ -0,0 +1,54 @@
+"""
+Czyszczenie historycznych wyników zadań Celery (django_celery_results).
+
+Wbudowany celery.backend_cleanup usuwa wszystkie przeterminowane wiersze
+jednym DELETE w jednej transakcji. Tutaj — jak przy sesjach — każda
+paczka to osobne krótkie DELETE po kluczach wybranych z indeksu
+date_done.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+from django_celery_results.models import GroupResult, TaskResult
+
+
+def prune_task_results(
+    older_than: int | None = None, batch_size: int | None = None
+) -> int:
+    """
+    Usuń wyniki zadań i grup starsze niż older_than sekund.
+
+    Returns:
+        int: Liczba usuniętych wierszy.
+    """
+    if older_than is None:
+        older_than = settings.CELERY_RESULT_TTL
+    batch_size = batch_size or settings.CELERY_RESULT_PRUNE_BATCH_SIZE
+    cutoff = timezone.now() - timedelta(seconds=older_than)
+    return sum(
+        _prune(model, cutoff, batch_size) for model in (TaskResult, GroupResult)
+    )
+
+
+def _prune(model: type[models.Model], cutoff, batch_size: int) -> int:
+    objects = model._default_manager
+    deleted = 0
+    while True:
+        pks = list(
+            objects.filter(date_done__lt=cutoff)
+            .order_by("date_done")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            break
+        with transaction.atomic(using=objects.db):
+            objects.filter(pk__in=pks).delete()
+        deleted += len(pks)
+        if len(pks) < batch_size:
+            break
+    return deleted
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from celery import shared_task
+from pack_logger import log
+
+from core.services.task_results.cleanup import prune_task_results
+
+
+@shared_task(ignore_result=False)
+def prune_task_results_task() -> int:
+    count = prune_task_results()
+    if count > 0:
+        log.info(f"Pruned {count} task results")
+    return count
@@ -6,12 +6,14 @@ base_settings = [
     "components/apps.py",
     "components/middleware.py",
     "components/database.py",
+    "components/cache.py",
     "components/auth.py",
     "components/storage.py",
     "components/celery.py",
     "components/email.py",
     "components/security.py",
     "components/session.py",
+    "components/metrics.py",
     "components/allauth/__init__.py",
     "base.py",
 ]
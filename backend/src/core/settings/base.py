@@ -56,3 +56,12 @@ DJANGO_SUPERUSER_PASSWORD = str(os.environ.get("DJANGO_SUPERUSER_PASSWORD", "adm
 COUNTRIES_FIRST = ["PL", "US", "GB", "DE", "FR", "IT", "ES"]
 PHONENUMBER_DEFAULT_REGION = "PL"
 PHONENUMBER_DEFAULT_FORMAT = "INTERNATIONAL"
+
+# Health check (core.utils.health): czas życia wyniku readiness w pamięci
+# procesu i deadline'y probe'ów zależności (sekundy).
+HEALTH_CHECK_CACHE_TTL = float(os.environ.get("HEALTH_CHECK_CACHE_TTL", 5))
+HEALTH_CHECK_TIMEOUTS = {
+    "database": float(os.environ.get("HEALTH_CHECK_DATABASE_TIMEOUT", 2)),
+    "redis": float(os.environ.get("HEALTH_CHECK_REDIS_TIMEOUT", 1)),
+    "storage": float(os.environ.get("HEALTH_CHECK_STORAGE_TIMEOUT", 3)),
+}
@@ -1,3 +1,5 @@
+import os
+
 ACCOUNT_LOGIN_METHODS = {"email"}
 ACCOUNT_SIGNUP_FIELDS = ["email*", "password1*", "password2*"]
 
@@ -29,3 +31,15 @@ ACCOUNT_RATE_LIMITS = {
     "webauthn_setup_request": "10/m/user",
     "webauthn_setup_confirm": "10/m/user",
 }
+
+# Sprzątanie nieaktywowanych kont: rozmiar paczki, limit czasu jednego
+# uruchomienia (s) i przerwa (s) przed dokończeniem od kursora.
+STALE_USERS_CLEANUP_BATCH_SIZE = int(
+    os.environ.get("STALE_USERS_CLEANUP_BATCH_SIZE", 500)
+)
+STALE_USERS_CLEANUP_TIME_BUDGET = float(
+    os.environ.get("STALE_USERS_CLEANUP_TIME_BUDGET", 60)
+)
+STALE_USERS_CLEANUP_RESUME_DELAY = int(
+    os.environ.get("STALE_USERS_CLEANUP_RESUME_DELAY", 60)
+)
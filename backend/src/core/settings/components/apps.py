@@ -44,6 +44,7 @@ APPLICATION_APPS = [
     "apps.analytics",
     "apps.categories",
     "apps.products",
+    "apps.uploads",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + APPLICATION_APPS
@@ -5,7 +5,13 @@ Authentication and authorization configuration.
 import os
 from datetime import timedelta
 
+# Logowanie emailem jednym zapytaniem, semantyka allauth i uprawnienia z
+# ModelBackend (apps.accounts.backends). Poprzednie backendy zostają na liście,
+# bo ich ścieżki są zapisane w istniejących sesjach (_auth_user_backend) —
+# bez nich wszyscy zostaliby wylogowani. Nie biorą udziału w logowaniu:
+# EmailAuthenticationBackend kończy łańcuch przy błędnych danych.
 AUTHENTICATION_BACKENDS = [
+    "apps.accounts.backends.EmailAuthenticationBackend",
     "django.contrib.auth.backends.ModelBackend",
     "allauth.account.auth_backends.AuthenticationBackend",
 ]
@@ -33,14 +39,16 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_RENDERER_CLASSES": (
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
+        "common.renderers.CamelCaseJSONRenderer",
         "djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
-        "djangorestframework_camel_case.parser.CamelCaseJSONParser",
+        "common.parsers.CamelCaseJSONParser",
         "djangorestframework_camel_case.parser.CamelCaseFormParser",
         "djangorestframework_camel_case.parser.CamelCaseMultiPartParser",
     ),
+    "DEFAULT_PAGINATION_CLASS": "common.pagination.TimestampedCursorPagination",
+    "PAGE_SIZE": int(os.environ.get("API_PAGE_SIZE", 20)),
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
     "DEFAULT_VERSION": os.environ.get("EXPO_PUBLIC_VERSION", "v1"),
     "ALLOWED_VERSIONS": tuple(os.environ.get("EXPO_PUBLIC_VERSIONS", "v1").split(",")),
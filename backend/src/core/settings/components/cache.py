@@ -0,0 +1,35 @@
+"""
+Cache configuration.
+"""
+
+import os
+
+# Współdzielony cache (Redis) — wymagany, żeby unieważnianie z sygnałów
+# docierało do wszystkich procesów aplikacji, a nie tylko do lokalnego LocMem.
+CACHES = {
+    "default": {
+        # RedisCache zliczający trafienia na potrzeby metryk żądań.
+        "BACKEND": "core.services.request_metrics.cache.MeteredRedisCache",
+        "LOCATION": str(os.environ.get("CACHE_URL", "redis://olivin-redis:6379/1")),
+        "TIMEOUT": 300,
+        "OPTIONS": {
+            # Krótkie timeouty: niedostępny Redis ma degradować do bazy,
+            # a nie blokować requestu.
+            "socket_connect_timeout": float(
+                os.environ.get("CACHE_CONNECT_TIMEOUT", 0.5)
+            ),
+            "socket_timeout": float(os.environ.get("CACHE_SOCKET_TIMEOUT", 0.5)),
+        },
+    }
+}
+
+# Czas życia zserializowanego profilu w cache (sekundy).
+ACCOUNTS_PROFILE_CACHE_TIMEOUT = int(
+    os.environ.get("ACCOUNTS_PROFILE_CACHE_TIMEOUT", 60 * 15)
+)
+
+# Jak długo pamiętać, że email nie należy do żadnego konta (sekundy).
+# Tłumi serie logowań na nieistniejące konta; 0 wyłącza.
+ACCOUNTS_AUTH_NEGATIVE_CACHE_TIMEOUT = int(
+    os.environ.get("ACCOUNTS_AUTH_NEGATIVE_CACHE_TIMEOUT", 30)
+)
@@ -6,27 +6,69 @@ import os
 from datetime import timedelta
 
 from celery.schedules import crontab, schedule
+from kombu import Queue
 
 # Celery
 CELERY_BROKER_URL = str(
     os.environ.get("CELERY_BROKER_URL", "redis://olivin-redis:6379/0")
 )
-CELERY_RESULT_BACKEND = str(
-    os.environ.get("CELERY_RESULT_BACKEND", "redis://olivin-redis:6379/0")
-)
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Europe/Warsaw"
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
-# Django celery results
-CELERY_RESULT_BACKEND = "django-db"
-CELERY_RESULT_SERIALIZER = "json"
+# Wyniki zadań: domyślnie django-db (podgląd w adminie), opcjonalnie Redis
+# (np. redis://olivin-redis:6379/2) — klucze wygasają wtedy same po TTL.
+CELERY_RESULT_BACKEND = str(os.environ.get("CELERY_RESULT_BACKEND", "django-db"))
 CELERY_CACHE_BACKEND = "django-cache"
+# Wynik zapisują tylko zadania z ignore_result=False; błędy — zawsze.
+CELERY_TASK_IGNORE_RESULT = (
+    os.environ.get("CELERY_TASK_IGNORE_RESULT", "true").lower() == "true"
+)
+CELERY_TASK_STORE_ERRORS_EVEN_IF_IGNORED = True
+# Czas życia wyników (s). Redis wygasza je sam; wiersze django-db usuwa
+# paczkami prune_task_results_task — bez result_expires beat nie dodaje
+# celery.backend_cleanup, który kasuje wszystko jednym DELETE.
+CELERY_RESULT_TTL = int(os.environ.get("CELERY_RESULT_TTL", 86400))
+CELERY_RESULT_EXPIRES = (
+    CELERY_RESULT_TTL if CELERY_RESULT_BACKEND.startswith("redis") else None
+)
+CELERY_RESULT_PRUNE_BATCH_SIZE = int(
+    os.environ.get("CELERY_RESULT_PRUNE_BATCH_SIZE", 1000)
+)
+
+# Kolejki i routing (core.services.queues). Priorytet wiadomości w Redis:
+# 0 — najwyższy, 9 — najniższy. acks_late: zadanie potwierdzane po
+# wykonaniu, więc przerwane przez padnięty worker wraca do kolejki.
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_QUEUE_PROFILES = {
+    "critical": {"priority": 0, "acks_late": True},
+    "default": {"priority": 3, "acks_late": False},
+    "media": {"priority": 6, "acks_late": True},
+    "mail": {"priority": 6, "acks_late": True},
+}
+CELERY_TASK_QUEUE_MAP = {
+    "core.services.sessions.tasks.*": "critical",
+    "core.services.allauth.tasks.*": "default",
+    "core.services.task_results.tasks.*": "default",
+    "core.services.mail.tasks.*": "mail",
+    "apps.uploads.tasks.*": "media",
+}
+CELERY_TASK_QUEUES = [Queue(name) for name in CELERY_QUEUE_PROFILES]
+CELERY_TASK_ROUTES = ("core.services.queues.route_task",)
+CELERY_TASK_ANNOTATIONS = ("core.services.queues.QueueAnnotations",)
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "priority_steps": list(range(10)),
+    # Worker z kilkoma kolejkami (-Q critical,default) opróżnia je po kolei.
+    "queue_order_strategy": "priority",
+}
+
 CELERY_IMPORTS = (
     "core.services.mail.tasks",
     "core.services.allauth.tasks",
+    "core.services.sessions.tasks",
+    "core.services.task_results.tasks",
 )
 
 CELERY_BEAT_SCHEDULE = {
@@ -34,4 +76,16 @@ CELERY_BEAT_SCHEDULE = {
         "task": "core.services.allauth.tasks.cleanup_stale_unverified_users",
         "schedule": schedule(run_every=timedelta(days=1)), # 1 day
     },
+    "persist-dirty-sessions": {
+        "task": "core.services.sessions.tasks.persist_dirty_sessions",
+        "schedule": schedule(run_every=timedelta(seconds=10)),
+    },
+    "sweep-expired-sessions": {
+        "task": "core.services.sessions.tasks.sweep_expired_sessions",
+        "schedule": schedule(run_every=timedelta(hours=1)),
+    },
+    "prune-task-results": {
+        "task": "core.services.task_results.tasks.prune_task_results_task",
+        "schedule": schedule(run_every=timedelta(hours=1)),
+    },
 }
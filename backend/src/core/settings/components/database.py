@@ -13,3 +13,9 @@ DATABASES = {
         "PORT": int(os.environ.get("POSTGRES_PORT", 5433)),
     }
 }
+
+# Klucze główne TimestampedModel jako UUIDv7 (uporządkowane czasowo) zamiast
+# losowych uuid4 — nowe wiersze trafiają na koniec indeksu PK.
+TIMESTAMPED_MODEL_UUID7 = (
+    os.environ.get("TIMESTAMPED_MODEL_UUID7", "False").lower() == "true"
+)
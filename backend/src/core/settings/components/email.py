@@ -17,3 +17,23 @@ EMAIL_HOST_USER = str(os.environ.get("EMAIL_HOST_USER", ""))
 EMAIL_HOST_PASSWORD = str(os.environ.get("EMAIL_HOST_PASSWORD", ""))
 EMAIL_USE_TLS = bool(int(os.environ.get("EMAIL_USE_TLS", 0)))
 DEFAULT_FROM_EMAIL = str(os.environ.get("DEFAULT_FROM_EMAIL", "noreply@example.com"))
+
+# Maks. liczba maili w jednym zadaniu send_email_payloads_task (outbox żądania).
+MAIL_OUTBOX_MAX_BATCH = int(os.environ.get("MAIL_OUTBOX_MAX_BATCH", "50"))
+
+# Renderowanie szablonów maili allauth w workerze Celery zamiast w żądaniu.
+MAIL_RENDER_IN_WORKER = (
+    os.environ.get("MAIL_RENDER_IN_WORKER", "True").lower() == "true"
+)
+
+# Rejestr doręczeń maili (core.services.mail.ledger) i ponowienia pojedynczych
+# maili: opóźnienie MAIL_RETRY_BACKOFF × 2^(próba - 1), najwyżej
+# MAIL_RETRY_BACKOFF_MAX sekund, do MAIL_MAX_ATTEMPTS prób.
+MAIL_LEDGER_REDIS_URL = str(
+    os.environ.get("MAIL_LEDGER_REDIS_URL", "redis://olivin-redis:6379/3")
+)
+MAIL_LEDGER_REDIS_TIMEOUT = float(os.environ.get("MAIL_LEDGER_REDIS_TIMEOUT", 0.5))
+MAIL_LEDGER_TTL = int(os.environ.get("MAIL_LEDGER_TTL", str(60 * 60 * 24 * 7)))
+MAIL_MAX_ATTEMPTS = int(os.environ.get("MAIL_MAX_ATTEMPTS", 5))
+MAIL_RETRY_BACKOFF = int(os.environ.get("MAIL_RETRY_BACKOFF", 30))
+MAIL_RETRY_BACKOFF_MAX = int(os.environ.get("MAIL_RETRY_BACKOFF_MAX", 60 * 60))
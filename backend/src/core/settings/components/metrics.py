@@ -0,0 +1,45 @@
+"""
+Metrics configuration (eksport w formacie Prometheus pod /metrics/).
+"""
+
+import os
+
+# Token wymagany w nagłówku "Authorization: Bearer <token>". Pusty (bez
+# autoryzacji) tylko w development/testing — production.py wymaga tokenu.
+METRICS_AUTH_TOKEN = os.environ.get("METRICS_AUTH_TOKEN", "")
+# Funkcje (writer) -> None dopisujące metryki do eksportu.
+METRICS_EXPORTERS = [
+    "core.services.request_metrics.export",
+    "core.services.task_metrics.export",
+]
+
+# Metryki żądań (core.services.request_metrics): per widok, w pamięci procesu.
+REQUEST_METRICS_ENABLED = (
+    os.environ.get("REQUEST_METRICS_ENABLED", "True").lower() == "true"
+)
+REQUEST_METRICS_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+)
+REQUEST_METRICS_QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+REQUEST_METRICS_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Metryki zadań Celery (core.services.task_metrics): bufor w procesie
+# workera, zrzucany do Redis najwyżej co TASK_METRICS_FLUSH_INTERVAL sekund.
+TASK_METRICS_ENABLED = (
+    os.environ.get("TASK_METRICS_ENABLED", "True").lower() == "true"
+)
+TASK_METRICS_REDIS_URL = str(
+    os.environ.get("TASK_METRICS_REDIS_URL", "redis://olivin-redis:6379/4")
+)
+TASK_METRICS_REDIS_TIMEOUT = float(os.environ.get("TASK_METRICS_REDIS_TIMEOUT", 0.5))
+TASK_METRICS_FLUSH_INTERVAL = float(
+    os.environ.get("TASK_METRICS_FLUSH_INTERVAL", 5)
+)
+# Górne granice kubełków histogramów (sekundy).
+TASK_METRICS_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300,
+)
+
+# Budżety zapytań akcji viewsetów (common.query_budget): "off", "log" —
+# przekroczenie logowane z fingerprintami SQL, "raise" — wyjątek.
+QUERY_BUDGET_MODE = os.environ.get("QUERY_BUDGET_MODE", "log")
@@ -3,7 +3,10 @@ Django middleware configuration.
 """
 
 MIDDLEWARE = [
+    # Pierwsze — mierzy czas całego stosu (core.services.request_metrics).
+    "core.services.request_metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.services.mail.middleware.MailOutboxMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -2,13 +2,34 @@ import os
 
 # Trwałość sesji web: domyślnie 14 dni.
 # - Nie wygaszaj przy zamknięciu przeglądarki.
-# - Przedłużaj TTL przy każdej aktywności (sliding session).
+# - Przedłużaj TTL przy aktywności (sliding session) — silnik sesji robi to
+#   sam, gdy zostało mniej niż SESSION_REFRESH_THRESHOLD.
 SESSION_COOKIE_AGE = int(
     os.environ.get("SESSION_COOKIE_AGE", str(60 * 60 * 24 * 14))
 )  # 14 dni
 SESSION_EXPIRE_AT_BROWSER_CLOSE = os.environ.get(
     "SESSION_EXPIRE_AT_BROWSER_CLOSE", False
 )
-SESSION_SAVE_EVERY_REQUEST = os.environ.get("SESSION_SAVE_EVERY_REQUEST", True)
+SESSION_SAVE_EVERY_REQUEST = (
+    os.environ.get("SESSION_SAVE_EVERY_REQUEST", "False").lower() == "true"
+)
+
+# Sesje w Redis, trwała kopia w django_session (core.services.sessions).
+SESSION_ENGINE = "core.services.sessions.backend"
+SESSION_REDIS_URL = str(
+    os.environ.get("SESSION_REDIS_URL", "redis://olivin-redis:6379/2")
+)
+SESSION_REDIS_TIMEOUT = float(os.environ.get("SESSION_REDIS_TIMEOUT", 0.5))
+# Przesuń TTL, gdy do wygaśnięcia zostało mniej niż tyle sekund — przy
+# 14 dniach i progu 13 dni sesja jest zapisywana najwyżej raz na dobę.
+SESSION_REFRESH_THRESHOLD = int(
+    os.environ.get("SESSION_REFRESH_THRESHOLD", SESSION_COOKIE_AGE - 60 * 60 * 24)
+)
+# Jak długo po wylogowaniu zrzut pamięta, że sesji nie wolno zapisać w bazie.
+# Musi przekraczać czas zrzutu jednej paczki.
+SESSION_TOMBSTONE_TTL = int(os.environ.get("SESSION_TOMBSTONE_TTL", 300))
+# Rozmiary paczek zrzutu do bazy i sprzątania wygasłych sesji.
+SESSION_PERSIST_BATCH_SIZE = int(os.environ.get("SESSION_PERSIST_BATCH_SIZE", 500))
+SESSION_SWEEP_BATCH_SIZE = int(os.environ.get("SESSION_SWEEP_BATCH_SIZE", 1000))
 
 
@@ -26,9 +26,9 @@ USE_AWS = bool(os.environ.get("USE_AWS", "False").lower() == "true")
 
 if USE_AWS:
     # S3/MinIO storage configuration
-    STATICFILES_STORAGE = "core.storages.StaticStorage"
-    DEFAULT_FILE_STORAGE = "core.storages.PublicMediaStorage"
-    PRIVATE_FILE_STORAGE = "core.storages.PrivateMediaStorage"
+    STATICFILES_STORAGE = "core.storage.storages.StaticStorage"
+    DEFAULT_FILE_STORAGE = "core.storage.storages.PublicMediaStorage"
+    PRIVATE_FILE_STORAGE = "core.storage.storages.PrivateMediaStorage"
 
     STORAGES = {
         "staticfiles": {"BACKEND": STATICFILES_STORAGE},
@@ -70,3 +70,38 @@ else:
     )
     AWS_S3_CUSTOM_DOMAIN = str(os.environ.get("AWS_S3_CUSTOM_DOMAIN", "localhost:9000"))
     AWS_STORAGE_BUCKET_NAME = str(os.environ.get("AWS_STORAGE_BUCKET_NAME", "static"))
+
+# Pula połączeń współdzielonych klientów S3 (core.storage.clients) —
+# jeden klient na proces i zestaw poświadczeń, wątki dzielą połączenia.
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.environ.get("AWS_S3_MAX_POOL_CONNECTIONS", "20"))
+AWS_S3_TCP_KEEPALIVE = os.environ.get("AWS_S3_TCP_KEEPALIVE", "True").lower() == "true"
+AWS_S3_CONNECT_TIMEOUT = float(os.environ.get("AWS_S3_CONNECT_TIMEOUT", "5"))
+AWS_S3_READ_TIMEOUT = float(os.environ.get("AWS_S3_READ_TIMEOUT", "30"))
+
+# Bezpośrednie uploady do S3/MinIO (apps.uploads). Presigned URL musi
+# wskazywać adres osiągalny dla klienta — wewnętrzny endpoint kontenera
+# (http://minio:9000) nie jest widoczny z aplikacji mobilnej.
+AWS_S3_PUBLIC_ENDPOINT_URL = os.environ.get("AWS_S3_PUBLIC_ENDPOINT_URL") or None
+UPLOADS_URL_EXPIRES = int(os.environ.get("UPLOADS_URL_EXPIRES", "900"))
+UPLOADS_MULTIPART_THRESHOLD = int(
+    os.environ.get("UPLOADS_MULTIPART_THRESHOLD", str(16 * 1024 * 1024))
+)
+UPLOADS_PART_SIZE = int(os.environ.get("UPLOADS_PART_SIZE", str(8 * 1024 * 1024)))
+
+# Przyrostowy collectstatic (StaticStorage): liczba równoległych uploadów i
+# wymuszenie wysłania wszystkich plików mimo zgodnego manifestu.
+STATICFILES_UPLOAD_WORKERS = int(os.environ.get("STATICFILES_UPLOAD_WORKERS", "16"))
+STATICFILES_FORCE_UPLOAD = (
+    os.environ.get("STATICFILES_FORCE_UPLOAD", "False").lower() == "true"
+)
+
+# Warianty obrazów z uploadów (ImageVariantService) — klucze adresowane
+# treścią, więc odpowiedzi mogą być cache'owane bezterminowo.
+IMAGE_VARIANT_WIDTHS = tuple(
+    int(width)
+    for width in os.environ.get("IMAGE_VARIANT_WIDTHS", "160,480,1080").split(",")
+    if width.strip()
+)
+IMAGE_VARIANT_QUALITY = int(os.environ.get("IMAGE_VARIANT_QUALITY", "80"))
+IMAGE_VARIANT_MAX_PIXELS = int(os.environ.get("IMAGE_VARIANT_MAX_PIXELS", "40000000"))
+IMAGE_VARIANT_CACHE_CONTROL = "public, max-age=31536000, immutable"
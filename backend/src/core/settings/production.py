@@ -4,8 +4,15 @@ Production settings for Olivin project.
 
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 DEBUG = False
 
+# /metrics/ jest w publicznym URLconf — bez tokenu każdy widziałby ścieżki,
+# latencje i kolejki, więc produkcja nie startuje bez METRICS_AUTH_TOKEN.
+if not os.environ.get("METRICS_AUTH_TOKEN"):
+    raise ImproperlyConfigured("METRICS_AUTH_TOKEN is required in production")
+
 # Security settings
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
@@ -34,10 +34,19 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 # --- Cache ---
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "BACKEND": "core.services.request_metrics.cache.MeteredLocMemCache",
     }
 }
 
+# --- Sesje: bez Redisa (silnik z Redisem testowany na fakeredis) ---
+SESSION_ENGINE = "django.contrib.sessions.backends.db"
+
+# --- Health check: bez cache wyniku między testami ---
+HEALTH_CHECK_CACHE_TTL = 0
+
+# --- Budżety zapytań: przekroczenie w dowolnym teście API to błąd ---
+QUERY_BUDGET_MODE = "raise"
+
 # --- Celery ---
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
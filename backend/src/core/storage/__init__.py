@@ -1,5 +1,8 @@
 from .bucket_manager import S3BucketManager
+from .clients import S3ClientOptions, get_s3_client
 
 __all__ = [
     "S3BucketManager",
+    "S3ClientOptions",
+    "get_s3_client",
 ]
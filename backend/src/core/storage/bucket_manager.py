@@ -1,71 +1,22 @@
+import json
 import os
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 
+from .clients import get_s3_client
 
-class S3BucketManager:
-    def __init__(self) -> None:
-        self.config = self._build_config()
-        self.client = self._build_client()
-
-    def _build_config(self) -> Config:
-        addressing_style = os.environ.get("AWS_S3_ADDRESSING_STYLE", "path")
-        return Config(
-            signature_version="s3v4",
-            s3={"addressing_style": addressing_style},
-        )
-
-    def _build_client(self):
-        aws_access_key_id = getattr(
-            settings,
-            "AWS_ACCESS_KEY_ID",
-            os.environ.get("AWS_ACCESS_KEY_ID", "minioadmin"),
-        )
-        aws_secret_access_key = getattr(
-            settings,
-            "AWS_SECRET_ACCESS_KEY",
-            os.environ.get("AWS_SECRET_ACCESS_KEY", "minioadmin"),
-        )
-        region_name = getattr(
-            settings,
-            "AWS_S3_REGION_NAME",
-            os.environ.get("AWS_S3_REGION_NAME", "us-east-1"),
-        )
-        endpoint_url = getattr(
-            settings,
-            "AWS_S3_ENDPOINT_URL",
-            os.environ.get("AWS_S3_ENDPOINT_URL", "http://minio:9000"),
-        )
-        use_ssl = getattr(
-            settings,
-            "AWS_S3_USE_SSL",
-            os.environ.get("AWS_S3_USE_SSL", "False").lower() == "true",
-        )
 
-        # Opcjonalne: pomijamy endpoint_url jeśli łączymy się oryginalnie z AWS bez nadpisania
-        use_aws = getattr(
-            settings, "USE_AWS", os.environ.get("USE_AWS", "False").lower() == "true"
-        )
-        client_kwargs = {
-            "aws_access_key_id": aws_access_key_id,
-            "aws_secret_access_key": aws_secret_access_key,
-            "region_name": region_name,
-            "use_ssl": use_ssl,
-            "config": self.config,
-        }
-
-        # Jeśli nie używamy czystego AWS'a lub wyraźnie jest podany inny endpoint, dodajemy endpoint_url
-        if endpoint_url and not (use_aws and "amazonaws.com" not in endpoint_url):
-            client_kwargs["endpoint_url"] = endpoint_url
+class S3BucketManager:
+    """
+    Operacje na bucketach S3/MinIO.
 
-        # Upewniamy się, że w trybie AWS pominie lokalny endpoint
-        if use_aws and ("localhost" in endpoint_url or "minio" in endpoint_url):
-            client_kwargs.pop("endpoint_url", None)
+    Klient pochodzi ze współdzielonego rejestru (core.storage.clients),
+    więc utworzenie managera nie buduje nowego klienta boto3.
+    """
 
-        return boto3.client("s3", **client_kwargs)
+    def __init__(self) -> None:
+        self.client = get_s3_client()
 
     def bucket_exists(self, bucket_name: str) -> bool:
         """
@@ -132,3 +83,131 @@ class S3BucketManager:
         """
         response = self.client.list_buckets()
         return [bucket["Name"] for bucket in response.get("Buckets", [])]
+
+    def get_bucket_policy(self, bucket_name: str) -> dict | None:
+        """Zwróć politykę bucketu albo None, jeśli bucket jej nie ma.
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+        """
+        try:
+            response = self.client.get_bucket_policy(Bucket=bucket_name)
+        except ClientError as exc:
+            if _error_code(exc) in MISSING_CONFIGURATION_CODES:
+                return None
+            raise
+        return json.loads(response["Policy"])
+
+    def put_bucket_policy(self, bucket_name: str, policy: dict) -> None:
+        """Ustaw politykę bucketu; pusta polityka usuwa istniejącą.
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+            policy (dict): Dokument polityki (IAM JSON).
+        """
+        if not policy:
+            self.client.delete_bucket_policy(Bucket=bucket_name)
+            return
+        self.client.put_bucket_policy(Bucket=bucket_name, Policy=json.dumps(policy))
+
+    def get_bucket_cors(self, bucket_name: str) -> list | None:
+        """Zwróć reguły CORS bucketu albo None, jeśli nie są ustawione.
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+        """
+        try:
+            response = self.client.get_bucket_cors(Bucket=bucket_name)
+        except ClientError as exc:
+            if _error_code(exc) in MISSING_CONFIGURATION_CODES:
+                return None
+            raise
+        return response.get("CORSRules", [])
+
+    def put_bucket_cors(self, bucket_name: str, rules: list) -> None:
+        """Ustaw reguły CORS bucketu; pusta lista usuwa konfigurację.
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+            rules (list): Reguły w formacie CORSRules z API S3.
+        """
+        if not rules:
+            self.client.delete_bucket_cors(Bucket=bucket_name)
+            return
+        self.client.put_bucket_cors(
+            Bucket=bucket_name, CORSConfiguration={"CORSRules": rules}
+        )
+
+    def get_bucket_lifecycle(self, bucket_name: str) -> list | None:
+        """Zwróć reguły cyklu życia bucketu albo None, jeśli nie są ustawione.
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+        """
+        try:
+            response = self.client.get_bucket_lifecycle_configuration(
+                Bucket=bucket_name
+            )
+        except ClientError as exc:
+            if _error_code(exc) in MISSING_CONFIGURATION_CODES:
+                return None
+            raise
+        return response.get("Rules", [])
+
+    def put_bucket_lifecycle(self, bucket_name: str, rules: list) -> None:
+        """Ustaw reguły cyklu życia bucketu; pusta lista usuwa konfigurację.
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+            rules (list): Reguły w formacie Rules z API S3.
+        """
+        if not rules:
+            self.client.delete_bucket_lifecycle(Bucket=bucket_name)
+            return
+        self.client.put_bucket_lifecycle_configuration(
+            Bucket=bucket_name, LifecycleConfiguration={"Rules": rules}
+        )
+
+    def get_bucket_tags(self, bucket_name: str) -> dict[str, str]:
+        """Zwróć tagi bucketu jako słownik (pusty, jeśli brak tagów).
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+        """
+        try:
+            response = self.client.get_bucket_tagging(Bucket=bucket_name)
+        except ClientError as exc:
+            if _error_code(exc) in MISSING_CONFIGURATION_CODES:
+                return {}
+            raise
+        return {tag["Key"]: tag["Value"] for tag in response.get("TagSet", [])}
+
+    def put_bucket_tags(self, bucket_name: str, tags: dict[str, str]) -> None:
+        """Zastąp tagi bucketu podanym słownikiem.
+
+        Args:
+            bucket_name (str): Nazwa bucketu.
+            tags (dict[str, str]): Tagi do ustawienia.
+        """
+        self.client.put_bucket_tagging(
+            Bucket=bucket_name,
+            Tagging={
+                "TagSet": [{"Key": key, "Value": value} for key, value in tags.items()]
+            },
+        )
+
+
+# Kody błędów S3/MinIO oznaczające brak danej konfiguracji bucketu.
+MISSING_CONFIGURATION_CODES = frozenset(
+    {
+        "NoSuchBucketPolicy",
+        "NoSuchCORSConfiguration",
+        "NoSuchLifecycleConfiguration",
+        "NoSuchTagSet",
+        "NoSuchTagSetError",
+    }
+)
+
+
+def _error_code(exc: ClientError) -> str:
+    return exc.response.get("Error", {}).get("Code", "")
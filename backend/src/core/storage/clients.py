@@ -0,0 +1,205 @@
+"""
+Współdzielone klienty S3 na poziomie procesu.
+
+boto3.client ładuje model usługi, rozwiązuje endpoint i zakłada własną
+pulę połączeń — tworzenie go przy każdym S3BucketManager() czy w każdym
+wątku storage'u to kilka-kilkanaście ms i nowe połączenie TCP/TLS na
+każde żądanie. Rejestr trzyma jeden klient na zestaw (endpoint,
+poświadczenia, opcje), tworzony leniwie przy pierwszym użyciu. Klienty
+boto3 są bezpieczne wątkowo, więc wątki procesu dzielą pulę połączeń.
+
+Po fork() (gunicorn, Celery prefork) rejestr w procesie potomnym jest
+czyszczony — gniazda z puli rodzica nie mogą być współdzielone.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, replace
+
+import boto3
+import botocore
+from botocore.config import Config
+from django.conf import settings
+
+
+@dataclass(frozen=True)
+class S3ClientOptions:
+    """Klucz rejestru — wszystko, co odróżnia od siebie dwa klienty S3."""
+
+    endpoint_url: str | None = None
+    region_name: str | None = None
+    access_key: str | None = None
+    secret_key: str | None = None
+    session_token: str | None = None
+    use_ssl: bool = True
+    verify: bool | str | None = None
+    addressing_style: str | None = "path"
+    signature_version: str | None = "s3v4"
+    unsigned: bool = False
+    proxies: tuple[tuple[str, str], ...] = ()
+    max_pool_connections: int = 10
+    tcp_keepalive: bool = True
+    connect_timeout: float = 60
+    read_timeout: float = 60
+
+    @classmethod
+    def from_settings(cls, **overrides) -> S3ClientOptions:
+        """
+        Opcje klienta z ustawień Django (z fallbackiem do zmiennych środowiskowych).
+
+        Przy USE_AWS lokalny endpoint (MinIO) jest pomijany, żeby boto3
+        rozwiązał endpoint AWS dla regionu.
+        """
+        endpoint_url = getattr(
+            settings,
+            "AWS_S3_ENDPOINT_URL",
+            os.environ.get("AWS_S3_ENDPOINT_URL", "http://minio:9000"),
+        )
+        use_aws = getattr(
+            settings, "USE_AWS", os.environ.get("USE_AWS", "False").lower() == "true"
+        )
+        if use_aws and endpoint_url and "amazonaws.com" not in endpoint_url:
+            endpoint_url = None
+
+        options = cls(
+            endpoint_url=endpoint_url or None,
+            region_name=getattr(
+                settings,
+                "AWS_S3_REGION_NAME",
+                os.environ.get("AWS_S3_REGION_NAME", "us-east-1"),
+            ),
+            access_key=getattr(
+                settings,
+                "AWS_ACCESS_KEY_ID",
+                os.environ.get("AWS_ACCESS_KEY_ID", "minioadmin"),
+            ),
+            secret_key=getattr(
+                settings,
+                "AWS_SECRET_ACCESS_KEY",
+                os.environ.get("AWS_SECRET_ACCESS_KEY", "minioadmin"),
+            ),
+            use_ssl=getattr(
+                settings,
+                "AWS_S3_USE_SSL",
+                os.environ.get("AWS_S3_USE_SSL", "False").lower() == "true",
+            ),
+            addressing_style=os.environ.get("AWS_S3_ADDRESSING_STYLE", "path"),
+            **pool_options(),
+        )
+        return replace(options, **overrides)
+
+    def build_config(self) -> Config:
+        return Config(
+            signature_version=(
+                botocore.UNSIGNED if self.unsigned else self.signature_version
+            ),
+            s3={"addressing_style": self.addressing_style},
+            proxies=dict(self.proxies) or None,
+            max_pool_connections=self.max_pool_connections,
+            tcp_keepalive=self.tcp_keepalive,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+        )
+
+
+def pool_options() -> dict:
+    """Ustawienia puli połączeń wspólne dla wszystkich klientów S3."""
+    return {
+        "max_pool_connections": getattr(settings, "AWS_S3_MAX_POOL_CONNECTIONS", 10),
+        "tcp_keepalive": getattr(settings, "AWS_S3_TCP_KEEPALIVE", True),
+        "connect_timeout": getattr(settings, "AWS_S3_CONNECT_TIMEOUT", 60),
+        "read_timeout": getattr(settings, "AWS_S3_READ_TIMEOUT", 60),
+    }
+
+
+class S3ClientRegistry:
+    """Leniwie tworzone klienty (i klasy zasobów) S3, jeden na S3ClientOptions."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[S3ClientOptions, object] = {}
+        self._resource_classes: dict[S3ClientOptions, type] = {}
+        self._pid = os.getpid()
+
+    def client(self, options: S3ClientOptions):
+        self._check_pid()
+        client = self._clients.get(options)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(options)
+                if client is None:
+                    client = self._create_client(options)
+                    self._clients[options] = client
+        return client
+
+    def resource(self, options: S3ClientOptions):
+        """
+        Zasób boto3 S3 (s3.Bucket, s3.Object) na współdzielonym kliencie.
+
+        Zasoby boto3 nie są bezpieczne wątkowo, więc każde wywołanie zwraca
+        nowy obiekt — ale tani, bo klasa zasobu jest budowana raz, a klient
+        pochodzi z rejestru.
+        """
+        resource_class = self._resource_classes.get(options)
+        if resource_class is None:
+            with self._lock:
+                resource_class = self._resource_classes.get(options)
+                if resource_class is None:
+                    # Pierwszy zasób tworzy boto3 — jego klient trafia do
+                    # rejestru, żeby nie budować drugiego.
+                    prototype = self._session(options).resource(
+                        "s3", **self._client_kwargs(options)
+                    )
+                    resource_class = type(prototype)
+                    self._resource_classes[options] = resource_class
+                    self._clients.setdefault(options, prototype.meta.client)
+        return resource_class(client=self.client(options))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._resource_classes.clear()
+
+    def reset_after_fork(self) -> None:
+        # Lock mógł zostać skopiowany w stanie zajętym — w dziecku zawsze nowy.
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._resource_classes = {}
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        # Zabezpieczenie dla forków, które omijają os.register_at_fork.
+        if self._pid != os.getpid():
+            self.reset_after_fork()
+
+    def _create_client(self, options: S3ClientOptions):
+        return self._session(options).client("s3", **self._client_kwargs(options))
+
+    @staticmethod
+    def _session(options: S3ClientOptions) -> boto3.Session:
+        return boto3.Session(
+            aws_access_key_id=options.access_key,
+            aws_secret_access_key=options.secret_key,
+            aws_session_token=options.session_token,
+        )
+
+    @staticmethod
+    def _client_kwargs(options: S3ClientOptions) -> dict:
+        return {
+            "region_name": options.region_name,
+            "endpoint_url": options.endpoint_url,
+            "use_ssl": options.use_ssl,
+            "verify": options.verify,
+            "config": options.build_config(),
+        }
+
+
+registry = S3ClientRegistry()
+os.register_at_fork(after_in_child=registry.reset_after_fork)
+
+
+def get_s3_client(options: S3ClientOptions | None = None):
+    """Współdzielony klient S3 — domyślnie skonfigurowany z ustawień Django."""
+    return registry.client(options or S3ClientOptions.from_settings())
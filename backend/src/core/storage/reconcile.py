@@ -0,0 +1,256 @@
+"""
+Deklaratywna synchronizacja bucketów S3/MinIO: plan → apply.
+
+1. Odcisk (sha256) stanu docelowego jest porównywany z tagiem zapisanym
+   na pierwszym buckecie z listy — zgodny odcisk to jeden request i koniec.
+2. plan_buckets() odczytuje stan faktyczny (lista bucketów + zadeklarowane
+   polityki/CORS/lifecycle, odczyty równolegle) i zwraca listę operacji.
+3. apply_plan() wykonuje operacje w ograniczonej puli wątków: operacje
+   jednego bucketu po kolei (utworzenie przed konfiguracją), różne buckety
+   równolegle. Po udanym apply odcisk trafia do tagów bucketu.
+
+Atrybut spec ustawiony na None oznacza „nie zarządzaj” — istniejąca
+konfiguracja zostaje. Pusta wartość ({} / []) oznacza „usuń”.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from .bucket_manager import S3BucketManager
+
+FINGERPRINT_TAG = "olivin-reconcile-fingerprint"
+DEFAULT_MAX_WORKERS = 8
+
+# Atrybut spec → (odczyt, zapis) w S3BucketManager.
+CONFIG_ATTRIBUTES = {
+    "policy": ("get_bucket_policy", "put_bucket_policy"),
+    "cors": ("get_bucket_cors", "put_bucket_cors"),
+    "lifecycle": ("get_bucket_lifecycle", "put_bucket_lifecycle"),
+}
+
+
+@dataclass(frozen=True)
+class BucketSpec:
+    """Stan docelowy jednego bucketu."""
+
+    name: str
+    policy: dict | str | None = None
+    cors: list | None = None
+    lifecycle: list | None = None
+
+    def resolved_policy(self) -> dict | None:
+        """Polityka jako dokument IAM ("public-read" → GetObject dla wszystkich)."""
+        if self.policy == "public-read":
+            return {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Principal": {"AWS": ["*"]},
+                        "Action": ["s3:GetObject"],
+                        "Resource": [f"arn:aws:s3:::{self.name}/*"],
+                    }
+                ],
+            }
+        return self.policy
+
+    def desired(self) -> dict:
+        """Zarządzane atrybuty konfiguracji (bez tych ustawionych na None)."""
+        values = {
+            "policy": self.resolved_policy(),
+            "cors": self.cors,
+            "lifecycle": self.lifecycle,
+        }
+        return {key: value for key, value in values.items() if value is not None}
+
+
+@dataclass(frozen=True)
+class BucketOperation:
+    """Pojedyncza zmiana do wykonania na buckecie."""
+
+    bucket: str
+    action: str
+    value: object = None
+
+    @property
+    def label(self) -> str:
+        if self.action in ("create", "delete"):
+            return self.bucket
+        return f"{self.bucket}:{self.action}"
+
+
+@dataclass
+class BucketPlan:
+    """Różnica między stanem docelowym a faktycznym."""
+
+    operations: list[BucketOperation] = field(default_factory=list)
+    fingerprint: str = ""
+    anchor: str | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.operations
+
+    def by_bucket(self) -> dict[str, list[BucketOperation]]:
+        grouped: dict[str, list[BucketOperation]] = {}
+        for operation in self.operations:
+            grouped.setdefault(operation.bucket, []).append(operation)
+        return grouped
+
+
+def fingerprint(specs: list[BucketSpec]) -> str:
+    """Odcisk stanu docelowego — zmienia się przy zmianie listy lub konfiguracji."""
+    payload = [
+        {"name": spec.name, **spec.desired()}
+        for spec in sorted(specs, key=lambda spec: spec.name)
+    ]
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def is_up_to_date(manager: S3BucketManager, specs: list[BucketSpec]) -> bool:
+    """Czy stan docelowy był już zastosowany (jeden request: tagi bucketu)."""
+    if not specs:
+        return False
+    try:
+        tags = manager.get_bucket_tags(specs[0].name)
+    except Exception:
+        return False
+    return tags.get(FINGERPRINT_TAG) == fingerprint(specs)
+
+
+def plan_buckets(
+    manager: S3BucketManager,
+    specs: list[BucketSpec],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> BucketPlan:
+    """
+    Wylicz operacje sprowadzające buckety do stanu docelowego.
+
+    - bucket z listy, którego nie ma → create + cała zadeklarowana konfiguracja,
+    - bucket z listy, który istnieje → tylko różniące się atrybuty,
+    - bucket spoza listy → delete.
+    """
+    plan = BucketPlan(
+        fingerprint=fingerprint(specs), anchor=specs[0].name if specs else None
+    )
+    existing = set(manager.list_buckets())
+    desired_names = {spec.name for spec in specs}
+
+    reads = [
+        (spec, attribute)
+        for spec in specs
+        if spec.name in existing
+        for attribute in spec.desired()
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        actual = list(executor.map(lambda read: _read(manager, *read), reads))
+    current = {
+        (spec.name, attribute): value
+        for (spec, attribute), value in zip(reads, actual)
+    }
+
+    for spec in specs:
+        exists = spec.name in existing
+        if not exists:
+            plan.operations.append(BucketOperation(spec.name, "create"))
+        for attribute, value in spec.desired().items():
+            if exists and _same(current[(spec.name, attribute)], value):
+                continue
+            if not exists and not value:
+                continue
+            plan.operations.append(BucketOperation(spec.name, attribute, value))
+
+    for name in sorted(existing - desired_names):
+        plan.operations.append(BucketOperation(name, "delete"))
+    return plan
+
+
+def apply_plan(
+    manager: S3BucketManager,
+    plan: BucketPlan,
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> tuple[list[BucketOperation], list[str]]:
+    """
+    Wykonaj plan: buckety równolegle, operacje jednego bucketu po kolei.
+
+    Błąd operacji przerywa tylko dalsze operacje tego samego bucketu.
+    Odcisk jest zapisywany wyłącznie, gdy cały plan się powiódł.
+
+    Returns:
+        tuple: (wykonane operacje, komunikaty błędów).
+    """
+    groups = list(plan.by_bucket().values())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(lambda ops: _apply_bucket(manager, ops), groups))
+
+    done = [operation for applied, _ in outcomes for operation in applied]
+    errors = [error for _, error in outcomes if error]
+    if not errors and plan.anchor:
+        try:
+            _store_fingerprint(manager, plan.anchor, plan.fingerprint)
+        except Exception as exc:
+            errors.append(f"Nie udało się zapisać odcisku stanu: {exc}")
+    return done, errors
+
+
+def _apply_bucket(
+    manager: S3BucketManager, operations: list[BucketOperation]
+) -> tuple[list[BucketOperation], str | None]:
+    applied = []
+    for operation in operations:
+        try:
+            _apply(manager, operation)
+        except Exception as exc:
+            return applied, _describe_error(operation, exc)
+        applied.append(operation)
+    return applied, None
+
+
+def _read(manager: S3BucketManager, spec: BucketSpec, attribute: str):
+    getter = CONFIG_ATTRIBUTES[attribute][0]
+    return getattr(manager, getter)(spec.name)
+
+
+def _apply(manager: S3BucketManager, operation: BucketOperation) -> None:
+    if operation.action == "create":
+        manager.create_bucket(operation.bucket)
+    elif operation.action == "delete":
+        manager.delete_bucket(operation.bucket)
+    else:
+        setter = CONFIG_ATTRIBUTES[operation.action][1]
+        getattr(manager, setter)(operation.bucket, operation.value)
+
+
+def _describe_error(operation: BucketOperation, exc: Exception) -> str:
+    if operation.action == "create":
+        return f"Nie udało się utworzyć bucketu '{operation.bucket}': {exc}"
+    if operation.action == "delete":
+        return f"Nie udało się usunąć bucketu '{operation.bucket}': {exc}"
+    return (
+        f"Nie udało się ustawić {operation.action} bucketu "
+        f"'{operation.bucket}': {exc}"
+    )
+
+
+def _store_fingerprint(manager: S3BucketManager, bucket: str, value: str) -> None:
+    tags = manager.get_bucket_tags(bucket)
+    if tags.get(FINGERPRINT_TAG) != value:
+        manager.put_bucket_tags(bucket, {**tags, FINGERPRINT_TAG: value})
+
+
+def _same(actual, desired) -> bool:
+    """Porównanie konfiguracji niezależne od kolejności kluczy."""
+    if not desired:
+        return not actual
+    return _canonical(actual) == _canonical(desired)
+
+
+def _canonical(value) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
@@ -0,0 +1,113 @@
+"""
+Przyrostowy collectstatic dla storage'u S3/MinIO.
+
+Zwykły collectstatic na S3 robi dla każdego pliku HEAD (exists), drugi
+HEAD (data modyfikacji), często DELETE i PUT — po kolei, także dla
+plików, które się nie zmieniły. Tutaj:
+
+1. Przy pierwszym zapisie pobierany jest manifest z bucketu
+   (ścieżka → sha256 treści z poprzedniego deployu) — jeden GET.
+2. save() liczy sha256 pliku; zgodny z manifestem jest pomijany, zmieniony
+   trafia do puli wątków i jest wysyłany równolegle.
+3. post_process() (wołane przez collectstatic na końcu) czeka na wszystkie
+   uploady i zapisuje nowy manifest — tylko gdy wszystkie się powiodły.
+
+exists() zwraca False, żeby collectstatic przekazywał każdy plik do
+save() bez HEAD-ów i kasowania; o pominięciu decyduje manifest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.files.base import ContentFile
+from pack_logger import log
+from storages.utils import clean_name
+
+STATIC_MANIFEST_NAME = "staticfiles-manifest.json"
+
+
+class IncrementalStaticMixin:
+    """Mixin dla S3Boto3Storage: wysyła tylko zmienione pliki, równolegle."""
+
+    manifest_name = STATIC_MANIFEST_NAME
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._remote_manifest: dict[str, str] | None = None
+        self._manifest: dict[str, str] = {}
+        self._pending: dict[str, Future] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+
+    def exists(self, name):
+        return False
+
+    def save(self, name, content, max_length=None):
+        name = clean_name(name)
+        data = content.read()
+        digest = hashlib.sha256(data).hexdigest()
+        self._manifest[name] = digest
+        force = settings.STATICFILES_FORCE_UPLOAD
+        if not force and self.remote_manifest().get(name) == digest:
+            return name
+        self._submit(name, data)
+        return name
+
+    def remote_manifest(self) -> dict[str, str]:
+        """Manifest z poprzedniego deployu (pusty, gdy go nie ma)."""
+        if self._remote_manifest is None:
+            try:
+                with self.open(self.manifest_name) as manifest:
+                    self._remote_manifest = json.loads(manifest.read())
+            except (FileNotFoundError, ClientError, ValueError):
+                self._remote_manifest = {}
+        return self._remote_manifest
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+        failed = False
+        for name, future in self._pending.items():
+            error = future.exception()
+            if error is not None:
+                failed = True
+                yield name, None, error
+        uploaded = len(self._pending)
+        self._shutdown()
+        if failed:
+            return
+        super()._save(
+            self.manifest_name,
+            ContentFile(json.dumps(self._manifest, sort_keys=True).encode()),
+        )
+        log.info(
+            "Static files synced",
+            uploaded=uploaded,
+            unchanged=len(self._manifest) - uploaded,
+        )
+        self._remote_manifest, self._manifest = self._manifest, {}
+
+    def _submit(self, name: str, data: bytes) -> None:
+        if self._executor is None:
+            workers = settings.STATICFILES_UPLOAD_WORKERS
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="collectstatic"
+            )
+            # Limit plików w pamięci: czekające + wysyłane.
+            self._slots = threading.BoundedSemaphore(workers * 4)
+        self._slots.acquire()
+        future = self._executor.submit(super()._save, name, ContentFile(data))
+        future.add_done_callback(lambda _: self._slots.release())
+        self._pending[name] = future
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._pending = {}
@@ -1,10 +1,23 @@
 import os
+from dataclasses import replace
 
 from django.conf import settings
 from storages.backends.s3boto3 import S3Boto3Storage
 
+from .clients import S3ClientOptions, pool_options, registry
+from .static import IncrementalStaticMixin
+
 
 class DefaultStorage(S3Boto3Storage):
+    """
+    Bazowy storage S3/MinIO projektu.
+
+    Połączenia (zasoby boto3) budowane są na klientach ze wspólnego
+    rejestru procesu zamiast na nowej sesji boto3 w każdej instancji i
+    każdym wątku. Przy AWS_S3_SESSION_PROFILE albo własnym
+    AWS_S3_CLIENT_CONFIG zostaje zachowanie django-storages.
+    """
+
     bucket_name = ""
 
     @classmethod
@@ -38,6 +51,48 @@ class DefaultStorage(S3Boto3Storage):
             self.custom_domain = f"{domain}/{bucket}/"
         super().__init__(**kwargs)
 
+    @property
+    def connection(self):
+        connection = getattr(self._connections, "connection", None)
+        if connection is None:
+            if not self._uses_shared_clients():
+                return super().connection
+            connection = registry.resource(self.client_options())
+            self._connections.connection = connection
+        return connection
+
+    @property
+    def unsigned_connection(self):
+        connection = getattr(self._unsigned_connections, "connection", None)
+        if connection is None:
+            if not self._uses_shared_clients():
+                return super().unsigned_connection
+            connection = registry.resource(self.client_options(unsigned=True))
+            self._unsigned_connections.connection = connection
+        return connection
+
+    def _uses_shared_clients(self) -> bool:
+        return not self.session_profile and (
+            getattr(settings, "AWS_S3_CLIENT_CONFIG", None) is None
+        )
+
+    def client_options(self, **overrides) -> S3ClientOptions:
+        """Opcje klienta S3 tego storage'u — klucz we wspólnym rejestrze."""
+        options = S3ClientOptions(
+            endpoint_url=self.endpoint_url or None,
+            region_name=self.region_name,
+            access_key=self.access_key,
+            secret_key=self.secret_key,
+            session_token=self.security_token,
+            use_ssl=self.use_ssl,
+            verify=self.verify,
+            addressing_style=self.addressing_style,
+            signature_version=self.signature_version,
+            proxies=tuple(sorted((self.proxies or {}).items())),
+            **pool_options(),
+        )
+        return replace(options, **overrides)
+
 
 class PublicStorage(DefaultStorage):
     default_acl = "public-read"
@@ -63,7 +118,12 @@ class PrivateStorage(DefaultStorage):
         return False
 
 
-class StaticStorage(PublicStorage):
+class StaticStorage(IncrementalStaticMixin, PublicStorage):
+    """
+    Pliki statyczne w S3/MinIO — collectstatic wysyła tylko pliki, których
+    sha256 różni się od manifestu w buckecie (core.storage.static).
+    """
+
     location = ""
 
     def __init__(self, **kwargs):
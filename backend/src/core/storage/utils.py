@@ -1,8 +1,16 @@
+import json
 import os
 import sys
 from dataclasses import dataclass, field
 
 from .bucket_manager import S3BucketManager
+from .reconcile import (
+    DEFAULT_MAX_WORKERS,
+    BucketSpec,
+    apply_plan,
+    is_up_to_date,
+    plan_buckets,
+)
 
 
 @dataclass
@@ -10,7 +18,9 @@ class SyncResult:
     success: bool
     created: list[str] = field(default_factory=list)
     deleted: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    skipped: bool = False
 
     def exit_on_failure(self) -> None:
         """Zakończ proces z kodem 1 jeśli synchronizacja nie powiodła się."""
@@ -34,17 +44,56 @@ def get_buckets_names_from_env() -> list[str]:
     return [name.strip() for name in raw_value.split(",") if name.strip()]
 
 
-def sync_buckets(buckets_names: str) -> SyncResult:
+def get_buckets_config_from_env() -> dict:
     """
-    Synchronizuj buckety S3/MinIO z przekazaną listą nazw.
+    Pobierz konfigurację bucketów ze zmiennej środowiskowej S3_BUCKETS_CONFIG.
+
+    Zmienna to JSON: nazwa bucketu → policy / cors / lifecycle, np.:
+        S3_BUCKETS_CONFIG='{"media": {"policy": "public-read"}}'
+
+    Returns:
+        dict: Konfiguracja bucketów (pusta, gdy zmienna nie jest ustawiona).
+    """
+    raw_value = os.getenv("S3_BUCKETS_CONFIG", "").strip()
+    return json.loads(raw_value) if raw_value else {}
+
+
+def build_bucket_specs(
+    buckets_names: str, config: dict | None = None
+) -> list[BucketSpec]:
+    """
+    Zbuduj stan docelowy z listy nazw i opcjonalnej konfiguracji bucketów.
+
+    Kolejność nazw jest zachowana — pierwszy bucket przechowuje odcisk stanu.
+    """
+    config = config or {}
+    names = dict.fromkeys(
+        name.strip() for name in buckets_names.split(",") if name.strip()
+    )
+    return [BucketSpec(name=name, **config.get(name, {})) for name in names]
+
+
+def sync_buckets(
+    buckets_names: str,
+    config: dict | None = None,
+    *,
+    force: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> SyncResult:
+    """
+    Synchronizuj buckety S3/MinIO z przekazaną listą nazw i konfiguracją.
 
     Args:
         buckets_names (str): Nazwy bucketów oddzielone przecinkami, np. "static,public,products".
                              Wartość powinna pochodzić z zewnątrz (np. ze zmiennej S3_BUCKETS_NAMES).
+        config (dict | None): Polityka / CORS / lifecycle per bucket (np. z S3_BUCKETS_CONFIG).
+        force (bool): Pomiń sprawdzenie odcisku i zawsze porównaj pełny stan.
+        max_workers (int): Limit równoległych operacji na S3.
 
     Logika:
-    - Jeśli bucket z listy istnieje → nic nie robi.
-    - Jeśli bucket z listy nie istnieje → tworzy go.
+    - Jeśli odcisk stanu docelowego zgadza się z zapisanym → nic nie robi (jeden request).
+    - Jeśli bucket z listy nie istnieje → tworzy go wraz z konfiguracją.
+    - Jeśli bucket z listy istnieje → aktualizuje tylko różniącą się konfigurację.
     - Jeśli bucket istnieje w S3, ale nie ma go na liście → kasuje go.
 
     Returns:
@@ -54,31 +103,25 @@ def sync_buckets(buckets_names: str) -> SyncResult:
 
     try:
         manager = S3BucketManager()
-        expected_buckets = set(
-            name.strip() for name in buckets_names.split(",") if name.strip()
-        )
-        existing_buckets = set(manager.list_buckets())
+        specs = build_bucket_specs(buckets_names, config)
+        if not force and is_up_to_date(manager, specs):
+            result.skipped = True
+            return result
+        plan = plan_buckets(manager, specs, max_workers=max_workers)
     except Exception as exc:
         result.success = False
         result.errors.append(f"Nie udało się połączyć z S3: {exc}")
         return result
 
-    # Utwórz brakujące buckety
-    for bucket_name in expected_buckets - existing_buckets:
-        try:
-            manager.create_bucket(bucket_name)
-            result.created.append(bucket_name)
-        except Exception as exc:
-            result.success = False
-            result.errors.append(f"Nie udało się utworzyć bucketu '{bucket_name}': {exc}")
-
-    # Usuń buckety których nie ma na liście
-    for bucket_name in existing_buckets - expected_buckets:
-        try:
-            manager.delete_bucket(bucket_name)
-            result.deleted.append(bucket_name)
-        except Exception as exc:
-            result.success = False
-            result.errors.append(f"Nie udało się usunąć bucketu '{bucket_name}': {exc}")
-
+    applied, errors = apply_plan(manager, plan, max_workers=max_workers)
+    for operation in applied:
+        if operation.action == "create":
+            result.created.append(operation.bucket)
+        elif operation.action == "delete":
+            result.deleted.append(operation.bucket)
+        else:
+            result.updated.append(operation.label)
+    if errors:
+        result.success = False
+        result.errors.extend(errors)
     return result
@@ -29,14 +29,21 @@ from core.utils import (
     AllauthSwaggerView,
     CsrfViewSet,
     HealthCheckView,
+    LivenessView,
+    MetricsView,
+    ReadinessView,
 )
 
 urlpatterns = [
     # Admin
     path("admin/", admin.site.urls),
     path("health/", HealthCheckView.as_view(), name="health_check"),
+    path("health/live/", LivenessView.as_view(), name="health_live"),
+    path("health/ready/", ReadinessView.as_view(), name="health_ready"),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
     # API
     path("customers/", include("apps.accounts.urls")),
+    path("uploads/", include("apps.uploads.urls")),
     # Headless API
     path("accounts/", include("allauth.urls")),
     path("_allauth/", include("allauth.headless.urls")),
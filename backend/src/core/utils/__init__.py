@@ -1,5 +1,14 @@
 from .allauth import AllauthRedocView, AllauthSwaggerView
 from .auth import CsrfViewSet
-from .health import HealthCheckView
+from .health import HealthCheckView, LivenessView, ReadinessView
+from .metrics import MetricsView
 
-__all__ = ["HealthCheckView", "AllauthRedocView", "AllauthSwaggerView", "CsrfViewSet"]
+__all__ = [
+    "HealthCheckView",
+    "LivenessView",
+    "ReadinessView",
+    "MetricsView",
+    "AllauthRedocView",
+    "AllauthSwaggerView",
+    "CsrfViewSet",
+]
@@ -1,3 +1,3 @@
-from .views import HealthCheckView
+from .views import HealthCheckView, LivenessView, ReadinessView
 
-__all__ = ["HealthCheckView"]
+__all__ = ["HealthCheckView", "LivenessView", "ReadinessView"]
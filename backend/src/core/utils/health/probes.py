@@ -0,0 +1,137 @@
+"""
+Współbieżne uruchamianie probe'ów zależności z deadline'ami i krótkim cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+
+from pack_logger import log
+
+HEALTHY = "healthy"
+SKIPPED = "skipped: previous probe still running"
+
+# Wątki tworzone leniwie przy pierwszym probe, więc pula jest bezpieczna
+# przy fork() workerów.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+_in_flight: dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    status: str
+    latency_ms: float
+
+    @property
+    def healthy(self) -> bool:
+        return self.status == HEALTHY
+
+
+def timed(name: str, probe: Callable[[], None]) -> ProbeResult:
+    """Wykonaj probe i zmierz czas; wyjątek oznacza niezdrową zależność."""
+    started = time.perf_counter()
+    try:
+        probe()
+        status = HEALTHY
+    except Exception as exc:
+        status = f"unhealthy: {exc}"
+        log.error(f"{name} health check failed", error=str(exc))
+    return ProbeResult(status, round((time.perf_counter() - started) * 1000, 2))
+
+
+def reset() -> None:
+    """Zapomnij probe'y w toku (np. między testami); wątki kończą się same."""
+    with _in_flight_lock:
+        _in_flight.clear()
+
+
+def _submit(name: str, probe: Callable[[], None]) -> Future | None:
+    # Co najwyżej jeden probe danej zależności naraz: zawieszona zależność
+    # blokuje jeden wątek, a nie całą pulę przy każdym odpytaniu.
+    with _in_flight_lock:
+        running = _in_flight.get(name)
+        if running is not None and not running.done():
+            return None
+        future = _executor.submit(timed, name, probe)
+        _in_flight[name] = future
+        return future
+
+
+def run_probes(
+    probes: Mapping[str, Callable[[], None]],
+    timeouts: Mapping[str, float],
+) -> dict[str, ProbeResult]:
+    """
+    Uruchom probe'y równolegle w puli, każdy z własnym deadline'em.
+
+    Zależność, której poprzedni probe jeszcze się nie skończył, dostaje
+    status SKIPPED — odrębny od błędu probe'a, ale nadal niezdrowy.
+
+    Args:
+        probes: Nazwa zależności → funkcja rzucająca wyjątek przy awarii.
+        timeouts: Deadline (sekundy) per zależność, liczony od startu.
+
+    Returns:
+        dict[str, ProbeResult]: Wynik per zależność, w kolejności `probes`.
+    """
+    started = time.monotonic()
+    futures = {name: _submit(name, probe) for name, probe in probes.items()}
+    results: dict[str, ProbeResult] = {}
+
+    for name, future in futures.items():
+        timeout = timeouts[name]
+        if future is None:
+            results[name] = ProbeResult(SKIPPED, timeout * 1000)
+            continue
+        remaining = max(0.0, started + timeout - time.monotonic())
+        try:
+            results[name] = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            log.error(f"{name} health check timed out", timeout=timeout)
+            results[name] = ProbeResult(
+                f"unhealthy: timed out after {timeout}s", timeout * 1000
+            )
+    return results
+
+
+class ResultCache:
+    """Wynik ostatniego sprawdzenia w pamięci procesu, ważny przez `ttl` sekund."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, dict]] = {}
+
+    def get_or_compute(
+        self, key: str, ttl: float, compute: Callable[[], dict]
+    ) -> dict:
+        now = time.monotonic()
+        if ttl > 0:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        value = compute()
+        if ttl > 0:
+            with self._lock:
+                self._entries[key] = (now + ttl, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def summarize(results: Mapping[str, ProbeResult]) -> dict:
+    """Payload odpowiedzi: status ogólny, status i latencja per zależność."""
+    healthy = all(result.healthy for result in results.values())
+    return {
+        "status": HEALTHY if healthy else "unhealthy",
+        "services": {name: r.status for name, r in results.items()},
+        "latency_ms": {name: r.latency_ms for name, r in results.items()},
+    }
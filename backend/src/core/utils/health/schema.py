@@ -1,24 +1,54 @@
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import serializers
 
-health_schema = extend_schema(
-    responses={
-        200: inline_serializer(
-            name="HealthCheckResponse",
+HEALTH_CHECK_RESPONSE = inline_serializer(
+    name="HealthCheckResponse",
+    fields={
+        "status": serializers.ChoiceField(choices=["healthy", "unhealthy"]),
+        "services": inline_serializer(
+            name="HealthCheckServices",
             fields={
-                "status": serializers.ChoiceField(choices=["healthy", "unhealthy"]),
-                "services": inline_serializer(
-                    name="HealthCheckServices",
-                    fields={
-                        "database": serializers.CharField(),
-                        "redis": serializers.CharField(),
-                        "storage": serializers.CharField(),
-                    },
-                ),
+                "database": serializers.CharField(),
+                "redis": serializers.CharField(),
+                "storage": serializers.CharField(),
             },
-        )
+        ),
+        "latency_ms": inline_serializer(
+            name="HealthCheckLatency",
+            fields={
+                "database": serializers.FloatField(),
+                "redis": serializers.FloatField(),
+                "storage": serializers.FloatField(),
+            },
+        ),
     },
+)
+
+health_schema = extend_schema(
+    responses={200: HEALTH_CHECK_RESPONSE},
     summary="Health check",
     description="Sprawdza stan wszystkich serwisów (DB, Redis, MinIO).",
     tags=["Health"],
 )
+
+readiness_schema = extend_schema(
+    responses={200: HEALTH_CHECK_RESPONSE, 503: HEALTH_CHECK_RESPONSE},
+    summary="Readiness probe",
+    description=(
+        "Sprawdza równolegle DB, Redis i MinIO; 503 gdy któryś serwis "
+        "nie działa. Wynik jest cache'owany przez kilka sekund."
+    ),
+    tags=["Health"],
+)
+
+liveness_schema = extend_schema(
+    responses={
+        200: inline_serializer(
+            name="LivenessResponse",
+            fields={"status": serializers.CharField()},
+        )
+    },
+    summary="Liveness probe",
+    description="Proces odpowiada — bez sprawdzania zależności.",
+    tags=["Health"],
+)
@@ -1,67 +1,123 @@
 """
 Health check endpoints for Docker.
+
+- /health/live/  — liveness: proces odpowiada, bez sprawdzania zależności.
+- /health/ready/ — readiness: DB, Redis i S3 sprawdzane równolegle, każdy
+  z własnym deadline'em; 503 gdy któraś zależność nie działa.
+- /health/       — to samo co readiness, zawsze 200 (zgodność wsteczna).
+
+Wynik readiness jest trzymany w pamięci procesu przez
+HEALTH_CHECK_CACHE_TTL sekund, więc częste odpytywanie przez orkiestrator
+nie dotyka zależności.
 """
 
+import math
+
 from django.conf import settings
 from django.core.cache import cache
-from django.db import connection
+from django.db import DEFAULT_DB_ALIAS, connections
 from pack_logger import log
 from rest_framework import status
-from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.storage.bucket_manager import S3BucketManager
 
-from .schema import health_schema
+from .probes import ResultCache, run_probes, summarize
+from .schema import health_schema, liveness_schema, readiness_schema
+
+
+def probe_database() -> None:
+    # Osobne połączenie, zamykane w wątku puli, który je otworzył. Na
+    # PostgreSQL connect_timeout i statement_timeout zwalniają wątek po
+    # deadline'ie także wtedy, gdy baza wisi.
+    timeout = settings.HEALTH_CHECK_TIMEOUTS["database"]
+    db = connections.create_connection(DEFAULT_DB_ALIAS)
+    try:
+        if db.vendor == "postgresql":
+            db.settings_dict = {
+                **db.settings_dict,
+                "OPTIONS": {
+                    **db.settings_dict["OPTIONS"],
+                    "connect_timeout": max(1, math.ceil(timeout)),
+                },
+            }
+        with db.cursor() as cursor:
+            if db.vendor == "postgresql":
+                cursor.execute("SET statement_timeout = %s", [int(timeout * 1000)])
+            cursor.execute("SELECT 1")
+    finally:
+        db.close()
+
+
+def probe_redis() -> None:
+    cache.set("health_check", "ok", 10)
+    if cache.get("health_check") != "ok":
+        raise RuntimeError("cache read-back mismatch")
 
 
-class HealthCheckView(APIView):
+def probe_storage() -> None:
+    bucket_manager = S3BucketManager()
+    bucket_manager.client.head_bucket(Bucket=settings.AWS_STORAGE_BUCKET_NAME)
+
+
+class LivenessView(APIView):
     """
-    Comprehensive health check for all services (Docker-ready).
+    Liveness probe — proces Django obsługuje requesty.
     """
 
     permission_classes = [AllowAny]
+    authentication_classes = []
 
-    @health_schema
+    @liveness_schema
     def get(self, request):
-        health_status = {"status": "healthy", "services": {}}
-
-        # Database
-        try:
-            with connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-            health_status["services"]["database"] = "healthy"
-        except Exception as e:
-            health_status["services"]["database"] = f"unhealthy: {str(e)}"
-            health_status["status"] = "unhealthy"
-            log.error("Database health check failed", error=str(e))
-
-        # Redis
-        try:
-            cache.set("health_check", "ok", 10)
-            if cache.get("health_check") == "ok":
-                health_status["services"]["redis"] = "healthy"
-            else:
-                health_status["services"]["redis"] = "unhealthy"
-                health_status["status"] = "unhealthy"
-                log.warning("Redis health check failed")
-        except Exception as e:
-            health_status["services"]["redis"] = f"unhealthy: {str(e)}"
-            health_status["status"] = "unhealthy"
-            log.error("Redis health check failed", error=str(e))
-
-        # MinIO/S3
-        try:
-            bucket_manager = S3BucketManager()
-            bucket_manager.client.head_bucket(Bucket=settings.AWS_STORAGE_BUCKET_NAME)
-            health_status["services"]["storage"] = "healthy"
-        except Exception as e:
-            health_status["services"]["storage"] = f"unhealthy: {str(e)}"
-            health_status["status"] = "unhealthy"
-            log.error("Storage health check failed", error=str(e))
+        return Response({"status": "alive"}, status=status.HTTP_200_OK)
+
+
+class ReadinessView(APIView):
+    """
+    Readiness probe — stan zależności (DB, Redis, MinIO/S3).
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    probes = {
+        "database": probe_database,
+        "redis": probe_redis,
+        "storage": probe_storage,
+    }
+    unhealthy_status = status.HTTP_503_SERVICE_UNAVAILABLE
+    results = ResultCache()
 
+    def check(self) -> dict:
+        results = run_probes(self.probes, settings.HEALTH_CHECK_TIMEOUTS)
+        health_status = summarize(results)
         if health_status["status"] != "healthy":
             log.warning("Health check unhealthy", status=health_status["status"])
+        return health_status
+
+    @readiness_schema
+    def get(self, request):
+        health_status = self.results.get_or_compute(
+            "readiness", settings.HEALTH_CHECK_CACHE_TTL, self.check
+        )
+        code = (
+            status.HTTP_200_OK
+            if health_status["status"] == "healthy"
+            else self.unhealthy_status
+        )
+        return Response(health_status, status=code)
+
 
-        return Response(health_status, status=status.HTTP_200_OK)
+class HealthCheckView(ReadinessView):
+    """
+    Comprehensive health check for all services (Docker-ready).
+    """
+
+    unhealthy_status = status.HTTP_200_OK
+
+    @health_schema
+    def get(self, request):
+        return super().get(request)
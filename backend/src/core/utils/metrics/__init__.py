@@ -0,0 +1,4 @@
+from .prometheus import CONTENT_TYPE, PrometheusWriter
+from .views import MetricsView
+
+__all__ = ["CONTENT_TYPE", "MetricsView", "PrometheusWriter"]
@@ -0,0 +1,73 @@
+"""
+Minimalny zapis metryk w formacie tekstowym Prometheus (exposition 0.0.4).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class PrometheusWriter:
+    """Bufor linii eksportu; każda rodzina metryk z nagłówkiem HELP/TYPE."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self._families: set[str] = set()
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        if name in self._families:
+            return
+        self._families.add(name)
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        self.lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        labels: Mapping[str, str],
+        buckets: Sequence[float],
+        counts: Sequence[int],
+        total: float,
+    ) -> None:
+        """
+        Histogram z liczników per kubełek (nieskumulowanych).
+
+        Args:
+            buckets: Górne granice kubełków, rosnąco (bez +Inf).
+            counts: Liczba obserwacji per kubełek; ostatni element — ponad
+                najwyższą granicą (+Inf).
+            total: Suma obserwacji.
+        """
+        cumulative = 0
+        for bound, count in zip([*buckets, math.inf], counts, strict=True):
+            cumulative += count
+            le = "+Inf" if math.isinf(bound) else _number(float(bound))
+            self.sample(f"{name}_bucket", {**labels, "le": le}, cumulative)
+        self.sample(f"{name}_sum", labels, total)
+        self.sample(f"{name}_count", labels, cumulative)
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
@@ -0,0 +1,36 @@
+"""
+Endpoint /metrics/ w formacie tekstowym Prometheus.
+
+Zawartość składają eksportery z METRICS_EXPORTERS — funkcje dopisujące
+swoje rodziny metryk do wspólnego PrometheusWriter.
+"""
+
+from __future__ import annotations
+
+import hmac
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils.module_loading import import_string
+from django.views import View
+
+from .prometheus import CONTENT_TYPE, PrometheusWriter
+
+
+class MetricsView(View):
+    """Eksport metryk dla Prometheusa; opcjonalnie chroniony tokenem."""
+
+    def authorized(self, request: HttpRequest) -> bool:
+        token = settings.METRICS_AUTH_TOKEN
+        if not token:
+            return True
+        header = request.headers.get("Authorization", "")
+        return hmac.compare_digest(header, f"Bearer {token}")
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        if not self.authorized(request):
+            return HttpResponse(status=401)
+        writer = PrometheusWriter()
+        for path in settings.METRICS_EXPORTERS:
+            import_string(path)(writer)
+        return HttpResponse(writer.render(), content_type=CONTENT_TYPE)
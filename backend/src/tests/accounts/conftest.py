@@ -1,10 +1,21 @@
 from __future__ import annotations
 
 import pytest
+from django.core.cache import cache
 
+from apps.accounts.services import ProfileCacheService
 from tests.factories.accounts import AdminUserFactory, ProfileFactory, UserFactory
 
 
+@pytest.fixture(autouse=True)
+def clear_profile_cache():
+    """Czyści cache i liczniki profilu między testami (LocMem żyje w procesie)."""
+    cache.clear()
+    ProfileCacheService.stats.reset()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user_factory(db):
     """Fabryka użytkowników dostępna w testach accounts."""
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import pytest
+from allauth.account.models import EmailAddress
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    authenticate,
+    get_user,
+)
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+
+from apps.accounts.backends import EmailAuthenticationBackend
+from tests.factories.accounts import UserFactory
+
+PASSWORD = "testpass123!"
+
+
+def _login(**credentials):
+    return authenticate(RequestFactory().post("/"), **credentials)
+
+
+@pytest.mark.django_db
+class TestEmailAuthenticationBackend:
+    """Testy backendu logowania emailem."""
+
+    def test_logowanie_poprawnym_haslem(self):
+        """Poprawny email i hasło zwracają użytkownika."""
+        user = UserFactory(email="jan@test.com")
+        assert _login(email="jan@test.com", password=PASSWORD) == user
+
+    def test_email_bez_rozrozniania_wielkosci_liter(self):
+        """Email w innej wielkości liter nadal pasuje do konta."""
+        user = UserFactory(email="Jan.Kowalski@test.com")
+        assert _login(email="JAN.KOWALSKI@TEST.COM", password=PASSWORD) == user
+
+    def test_username_jako_email(self):
+        """Logowanie z polem username (np. panel admina) działa jak email."""
+        user = UserFactory(email="jan@test.com")
+        assert _login(username="jan@test.com", password=PASSWORD) == user
+
+    def test_bledne_haslo(self):
+        """Błędne hasło nie uwierzytelnia."""
+        UserFactory(email="jan@test.com")
+        assert _login(email="jan@test.com", password="zle-haslo") is None
+
+    def test_jedno_zapytanie(self, django_assert_num_queries):
+        """Wyszukanie użytkownika to jedno zapytanie."""
+        UserFactory(email="jan@test.com")
+        with django_assert_num_queries(1):
+            _login(email="jan@test.com", password="zle-haslo")
+
+    def test_preferuje_zweryfikowany_adres(self):
+        """Zweryfikowany EmailAddress wygrywa z polem email innego konta."""
+        owner = UserFactory(email="inny@test.com")
+        EmailAddress.objects.create(
+            user=owner, email="jan@test.com", verified=True, primary=False
+        )
+        UserFactory(email="JAN@test.com")
+        assert _login(email="jan@test.com", password=PASSWORD) == owner
+
+    def test_bledne_haslo_nie_przechodzi_do_starych_backendow(
+        self, django_assert_num_queries
+    ):
+        """Stare backendy z listy nie powtarzają zapytań po błędnym haśle."""
+        assert "django.contrib.auth.backends.ModelBackend" in (
+            settings.AUTHENTICATION_BACKENDS
+        )
+        UserFactory(email="jan@test.com")
+        with django_assert_num_queries(1):
+            assert _login(username="jan@test.com", password="zle-haslo") is None
+
+    @pytest.mark.parametrize(
+        "backend",
+        [
+            "django.contrib.auth.backends.ModelBackend",
+            "allauth.account.auth_backends.AuthenticationBackend",
+        ],
+    )
+    def test_sesja_ze_starym_backendem(self, backend):
+        """Sesja zapisana przez poprzedni backend nadal jest zalogowana."""
+        user = UserFactory(email="jan@test.com")
+        request = RequestFactory().get("/")
+        request.session = {
+            SESSION_KEY: str(user.pk),
+            BACKEND_SESSION_KEY: backend,
+            HASH_SESSION_KEY: user.get_session_auth_hash(),
+        }
+        assert get_user(request) == user
+
+    def test_nieaktywny_uzytkownik_trafia_do_stasha(self):
+        """Nieaktywne konto nie loguje się, ale allauth może je odczytać."""
+        user = UserFactory(email="jan@test.com", is_active=False)
+        EmailAuthenticationBackend.unstash_authenticated_user()
+        assert _login(email="jan@test.com", password=PASSWORD) is None
+        assert EmailAuthenticationBackend.unstash_authenticated_user() == user
+
+
+@pytest.mark.django_db
+class TestEmailAuthenticationBackendNegativeCache:
+    """Testy cache nieistniejących emaili."""
+
+    def test_powtorka_nie_odpytuje_bazy(self, django_assert_num_queries):
+        """Druga próba na nieistniejący email nie wykonuje zapytań."""
+        _login(email="brak@test.com", password=PASSWORD)
+        with django_assert_num_queries(0):
+            assert _login(email="BRAK@test.com", password=PASSWORD) is None
+
+    def test_nowe_konto_usuwa_wpis(self):
+        """Utworzenie konta z emailem z cache pozwala od razu się zalogować."""
+        _login(email="nowy@test.com", password=PASSWORD)
+        user = UserFactory(email="nowy@test.com")
+        assert _login(email="nowy@test.com", password=PASSWORD) == user
+
+    def test_nowy_emailaddress_usuwa_wpis(self):
+        """Dodanie EmailAddress usuwa negatywny wpis dla tego adresu."""
+        _login(email="drugi@test.com", password=PASSWORD)
+        user = UserFactory(email="jan@test.com")
+        EmailAddress.objects.create(user=user, email="drugi@test.com", verified=True)
+        assert _login(email="drugi@test.com", password=PASSWORD) == user
+
+    @override_settings(ACCOUNTS_AUTH_NEGATIVE_CACHE_TIMEOUT=0)
+    def test_wylaczony_cache(self, django_assert_num_queries):
+        """Timeout 0 wyłącza negatywny cache."""
+        _login(email="brak@test.com", password=PASSWORD)
+        key = EmailAuthenticationBackend.negative_cache_key("brak@test.com")
+        assert cache.get(key) is None
+        with django_assert_num_queries(1):
+            _login(email="brak@test.com", password=PASSWORD)
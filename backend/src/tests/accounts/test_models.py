@@ -3,8 +3,8 @@ from __future__ import annotations
 import pytest
 from django.db import IntegrityError
 
-from apps.accounts.models import CustomUser
-from tests.factories.accounts import UserFactory
+from apps.accounts.models import Address, CustomUser
+from tests.factories.accounts import AddressFactory, ProfileFactory, UserFactory
 
 
 @pytest.mark.django_db
@@ -116,3 +116,46 @@ class TestCustomUserModel:
     def test_required_fields_puste(self):
         """REQUIRED_FIELDS poza emailem powinno być puste."""
         assert CustomUser.REQUIRED_FIELDS == []
+
+
+@pytest.mark.django_db
+class TestAddressDefault:
+    """Testy unikalności i przełączania adresu domyślnego."""
+
+    def test_dwa_domyslne_adresy_lamia_indeks(self):
+        """Drugi domyślny adres tego samego profilu powinien rzucić IntegrityError."""
+        profile = ProfileFactory()
+        AddressFactory(profile=profile, is_default=True)
+        with pytest.raises(IntegrityError):
+            AddressFactory(profile=profile, is_default=True)
+
+    def test_wiele_niedomyslnych_adresow(self):
+        """Indeks jest częściowy — dowolnie wiele adresów z is_default=False."""
+        profile = ProfileFactory()
+        AddressFactory.create_batch(3, profile=profile, is_default=False)
+        assert Address.objects.filter(profile=profile).count() == 3
+
+    def test_set_default_przelacza_flage(self):
+        """set_default powinien zdjąć flagę ze starego adresu i ustawić na nowym."""
+        profile = ProfileFactory()
+        old = AddressFactory(profile=profile, is_default=True)
+        new = AddressFactory(profile=profile)
+
+        assert Address.objects.set_default(new) is True
+        old.refresh_from_db()
+        new.refresh_from_db()
+        assert (old.is_default, new.is_default) == (False, True)
+
+    def test_set_default_nie_rusza_innych_profili(self):
+        """set_default nie powinien zmieniać adresów innych profili."""
+        other = AddressFactory(is_default=True)
+        new = AddressFactory()
+
+        Address.objects.set_default(new)
+        other.refresh_from_db()
+        assert other.is_default is True
+
+    def test_set_default_juz_domyslny(self):
+        """set_default na domyślnym adresie zwraca False."""
+        address = AddressFactory(is_default=True)
+        assert Address.objects.set_default(address) is False
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.accounts.views import AddressViewSet, ProfileViewSet
+from tests.factories.accounts import AddressFactory, ProfileFactory
+
+
+@pytest.fixture
+def profile(user):
+    return ProfileFactory(user=user)
+
+
+@pytest.mark.django_db
+class TestAddressQueryBudgets:
+    """Budżety zapytań AddressViewSet; lista dla 1, 10 i 100 adresów (bez N+1)."""
+
+    def test_list(self, session_client: APIClient, profile, query_budget):
+        url = reverse("address-list")
+        query_budget.check(
+            AddressViewSet,
+            "list",
+            call=lambda: session_client.get(url, {"page_size": 100}),
+            seed=lambda n: AddressFactory.create_batch(n, profile=profile),
+        )
+
+    def test_retrieve(self, session_client: APIClient, profile, query_budget):
+        url = reverse("address-detail", args=[AddressFactory(profile=profile).pk])
+        query_budget.check(
+            AddressViewSet, "retrieve", call=lambda: session_client.get(url)
+        )
+
+    def test_create(self, session_client: APIClient, profile, query_budget):
+        url = reverse("address-list")
+        query_budget.check(
+            AddressViewSet,
+            "create",
+            call=lambda: session_client.post(
+                url, {"city": "Gdańsk", "is_default": True}, format="json"
+            ),
+        )
+
+    def test_update(self, session_client: APIClient, profile, query_budget):
+        # Inne adresy profilu, w tym dotychczasowy domyślny — PUT przełącza flagę.
+        AddressFactory(profile=profile, is_default=True)
+        AddressFactory.create_batch(5, profile=profile)
+        url = reverse("address-detail", args=[AddressFactory(profile=profile).pk])
+        payload = {
+            "street": "Długa 1",
+            "street2": "",
+            "city": "Gdańsk",
+            "state": "pomorskie",
+            "postal_code": "80-001",
+            "country": "PL",
+            "is_default": True,
+        }
+        query_budget.check(
+            AddressViewSet,
+            "update",
+            call=lambda: session_client.put(url, payload, format="json"),
+        )
+
+    def test_partial_update(self, session_client: APIClient, profile, query_budget):
+        url = reverse("address-detail", args=[AddressFactory(profile=profile).pk])
+        query_budget.check(
+            AddressViewSet,
+            "partial_update",
+            call=lambda: session_client.patch(
+                url, {"city": "Gdańsk", "is_default": True}, format="json"
+            ),
+        )
+
+    def test_destroy(self, session_client: APIClient, profile, query_budget):
+        url = reverse("address-detail", args=[AddressFactory(profile=profile).pk])
+        query_budget.check(
+            AddressViewSet, "destroy", call=lambda: session_client.delete(url)
+        )
+
+    def test_set_default(self, session_client: APIClient, profile, query_budget):
+        AddressFactory(profile=profile, is_default=True)
+        url = reverse("address-set-default", args=[AddressFactory(profile=profile).pk])
+        query_budget.check(
+            AddressViewSet, "set_default", call=lambda: session_client.patch(url)
+        )
+
+
+@pytest.mark.django_db
+class TestProfileQueryBudgets:
+    """Budżety zapytań ProfileViewSet; profil jest jeden na użytkownika."""
+
+    def test_list(self, session_client: APIClient, profile, query_budget):
+        url = reverse("profile-list")
+
+        def call():
+            cache.clear()  # odczyt z bazy, nie z cache profilu
+            return session_client.get(url)
+
+        query_budget.check(ProfileViewSet, "list", call=call)
+
+    def test_retrieve(self, session_client: APIClient, profile, query_budget):
+        url = reverse("profile-detail", args=[profile.pk])
+
+        def call():
+            cache.clear()
+            return session_client.get(url)
+
+        query_budget.check(ProfileViewSet, "retrieve", call=call)
+
+    def test_partial_update(self, session_client: APIClient, profile, query_budget):
+        url = reverse("profile-detail", args=[profile.pk])
+        query_budget.check(
+            ProfileViewSet,
+            "partial_update",
+            call=lambda: session_client.patch(url, {"first_name": "Nowe"}, format="json"),
+        )
+
+    def test_update(self, session_client: APIClient, profile, query_budget):
+        url = reverse("profile-detail", args=[profile.pk])
+        payload = {
+            "first_name": "Jan",
+            "last_name": "Kowalski",
+            "date_of_birth": "1990-05-01",
+            "phone_number": "+48601234567",
+        }
+        query_budget.check(
+            ProfileViewSet,
+            "update",
+            call=lambda: session_client.put(url, payload, format="json"),
+        )
+
+    def test_change_role(self, session_client: APIClient, profile, query_budget):
+        url = reverse("profile-change-role", args=[profile.pk])
+        query_budget.check(
+            ProfileViewSet, "change_role", call=lambda: session_client.patch(url)
+        )
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import datetime
 from typing import Any, Dict, cast
 
 import pytest
+from freezegun import freeze_time
 
-from apps.accounts.serializers import ProfileSerializer
+from apps.accounts.models import Profile
+from apps.accounts.serializers import ProfileReadSerializer, ProfileSerializer
 from tests.factories.accounts import ProfileFactory, UserFactory
 
 
@@ -85,3 +88,55 @@ class TestProfileSerializer:
         assert serializer.is_valid(), serializer.errors
         validated_data = cast(Dict[str, Any], serializer.validated_data)
         assert validated_data["first_name"] == "Nowe"
+
+
+@pytest.mark.django_db
+class TestProfileReadSerializer:
+    """Testy szybkiej ścieżki odczytu — zgodność z ProfileSerializer."""
+
+    def _both(self, profile) -> tuple[Dict[str, Any], Dict[str, Any]]:
+        row = Profile.objects.filter(pk=profile.pk).read_rows().get()
+        expected = dict(ProfileSerializer(Profile.objects.get(pk=profile.pk)).data)
+        return ProfileReadSerializer(row).data, expected
+
+    @pytest.mark.parametrize(
+        "dob",
+        [
+            None,
+            datetime.date(1990, 6, 14),
+            datetime.date(1990, 6, 15),
+            datetime.date(1990, 6, 16),
+            datetime.date(1990, 5, 31),
+            datetime.date(1990, 7, 1),
+            datetime.date(2000, 2, 29),
+        ],
+    )
+    @freeze_time("2025-06-15")
+    def test_zgodnosc_wieku(self, dob):
+        """age z SQL powinien być równy Profile.age także wokół urodzin."""
+        fast, expected = self._both(ProfileFactory(date_of_birth=dob))
+        assert fast == expected
+
+    @pytest.mark.parametrize("phone", ["", "+48600100200", "+12025550123"])
+    def test_zgodnosc_telefonu(self, phone):
+        """phone_number powinien mieć ten sam format co PhoneNumberField."""
+        fast, expected = self._both(ProfileFactory(phone_number=phone))
+        assert fast == expected
+
+    @pytest.mark.parametrize(
+        "first_name, last_name", [("Jan", ""), ("", "Nowak"), ("", "")]
+    )
+    def test_zgodnosc_full_name(self, first_name, last_name):
+        """full_name z SQL powinien być przycięty jak Profile.full_name."""
+        fast, expected = self._both(
+            ProfileFactory(first_name=first_name, last_name=last_name)
+        )
+        assert fast == expected
+        assert list(fast) == list(expected)
+
+    def test_jedno_zapytanie(self, django_assert_num_queries):
+        """Wiersz z emailem i annotacjami powinien wymagać jednego zapytania."""
+        profile = ProfileFactory()
+        with django_assert_num_queries(1):
+            row = Profile.objects.filter(pk=profile.pk).read_rows().get()
+        assert ProfileReadSerializer(row).data["email"] == profile.user.email
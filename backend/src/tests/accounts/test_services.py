@@ -1,20 +1,22 @@
 from __future__ import annotations
 
 """
-Warstwa serwisów nie istnieje w apps/accounts — logika biznesowa
-siedzi w modelu Profile (właściwości full_name, age) i managerze CustomUserManager.
-Ten plik testuje logikę domenową modelu Profile.
+Logika domenowa siedzi w modelu Profile (właściwości full_name, age),
+managerze CustomUserManager i warstwie apps.accounts.services.
+Ten plik testuje logikę domenową modelu Profile oraz serwisy accounts.
 """
 
 import datetime
+from unittest.mock import patch
 
 import pytest
 from django.db import IntegrityError
 from freezegun import freeze_time
 
-from apps.accounts.models import Profile
+from apps.accounts.models import Address, Profile
 from apps.accounts.models.roles_model import RoleChoices
-from tests.factories.accounts import ProfileFactory, UserFactory
+from apps.accounts.services import AddressBulkService, ProfileCacheService
+from tests.factories.accounts import AddressFactory, ProfileFactory, UserFactory
 
 
 @pytest.mark.django_db
@@ -102,3 +104,161 @@ class TestProfileOneToOne:
         profile_id = user.profile.pk
         user.delete()
         assert not Profile.objects.filter(pk=profile_id).exists()
+
+
+def _cached_entry(profile: Profile) -> dict:
+    return {"id": str(profile.pk), "data": {"email": profile.user.email}}
+
+
+@pytest.mark.django_db
+class TestProfileCacheService:
+    """Testy read-through cache profilu."""
+
+    def test_drugi_odczyt_z_cache(self):
+        """Drugi odczyt nie powinien wołać buildera."""
+        profile = ProfileFactory()
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return _cached_entry(profile)
+
+        first = ProfileCacheService.get_or_build(profile.user_id, builder)
+        second = ProfileCacheService.get_or_build(profile.user_id, builder)
+
+        assert first == second
+        assert len(calls) == 1
+        assert ProfileCacheService.stats.snapshot()["hits"] == 1
+        assert ProfileCacheService.stats.snapshot()["misses"] == 1
+
+    def test_brak_profilu_tez_jest_cachowany(self):
+        """Wynik None (brak profilu) też powinien trafić do cache."""
+        user = UserFactory()
+        calls = []
+
+        def builder():
+            calls.append(1)
+            return None
+
+        ProfileCacheService.get_or_build(user.pk, builder)
+        assert ProfileCacheService.get_or_build(user.pk, builder) is None
+        assert len(calls) == 1
+
+    def test_zapis_profilu_uniewaznia_cache(self):
+        """post_save Profile powinien unieważnić wpis."""
+        profile = ProfileFactory(first_name="Stare")
+        ProfileCacheService.get_or_build(profile.user_id, lambda: _cached_entry(profile))
+
+        profile.first_name = "Nowe"
+        profile.save()
+
+        calls = []
+        ProfileCacheService.get_or_build(
+            profile.user_id, lambda: calls.append(1) or _cached_entry(profile)
+        )
+        assert calls == [1]
+
+    def test_zmiana_emaila_uzytkownika_uniewaznia_cache(self):
+        """Zmiana emaila użytkownika powinna unieważnić wpis profilu."""
+        profile = ProfileFactory()
+        ProfileCacheService.get_or_build(profile.user_id, lambda: _cached_entry(profile))
+
+        profile.user.email = "nowy@test.com"
+        profile.user.save()
+
+        calls = []
+        ProfileCacheService.get_or_build(
+            profile.user_id, lambda: calls.append(1) or _cached_entry(profile)
+        )
+        assert calls == [1]
+
+    def test_zapis_last_login_nie_uniewaznia_cache(self):
+        """Zapis samego last_login nie powinien kasować cache."""
+        profile = ProfileFactory()
+        ProfileCacheService.get_or_build(profile.user_id, lambda: _cached_entry(profile))
+
+        profile.user.save(update_fields=["last_login"])
+
+        calls = []
+        ProfileCacheService.get_or_build(
+            profile.user_id, lambda: calls.append(1) or _cached_entry(profile)
+        )
+        assert calls == []
+
+    def test_fallback_gdy_cache_niedostepny(self):
+        """Awaria backendu cache powinna degradować do buildera."""
+        profile = ProfileFactory()
+        with patch(
+            "apps.accounts.services.profile_cache_service.cache.get_many",
+            side_effect=ConnectionError("redis down"),
+        ):
+            entry = ProfileCacheService.get_or_build(
+                profile.user_id, lambda: _cached_entry(profile)
+            )
+
+        assert entry == _cached_entry(profile)
+        assert ProfileCacheService.stats.snapshot()["errors"] == 1
+
+
+@pytest.mark.django_db
+class TestAddressBulkService:
+    """Testy strumieniowego importu/eksportu adresów."""
+
+    def test_import_w_paczkach(self, django_assert_num_queries):
+        """Import powinien zapisywać bulk_create w paczkach po chunk_size."""
+        profile = ProfileFactory()
+        lines = [f'{{"city": "Miasto {i}"}}'.encode() for i in range(5)]
+
+        # 3 paczki (2+2+1) x (SAVEPOINT, INSERT, RELEASE)
+        with django_assert_num_queries(9):
+            result = AddressBulkService.import_ndjson(lines, profile, chunk_size=2)
+
+        assert result.created == 5
+        assert Address.objects.filter(profile=profile).count() == 5
+
+    def test_import_jeden_domyslny(self):
+        """Kilka linii z isDefault — domyślny zostaje tylko ostatni."""
+        profile = ProfileFactory()
+        old = AddressFactory(profile=profile, is_default=True)
+        lines = [
+            b'{"city": "A", "isDefault": true}',
+            b'{"city": "B", "isDefault": true}',
+        ]
+        AddressBulkService.import_ndjson(lines, profile)
+
+        old.refresh_from_db()
+        assert old.is_default is False
+        assert Address.objects.get(profile=profile, is_default=True).city == "B"
+
+    def test_import_limit_bledow(self):
+        """Lista błędów jest przycinana do MAX_REPORTED_ERRORS."""
+        profile = ProfileFactory()
+        lines = [b"[]"] * (AddressBulkService.MAX_REPORTED_ERRORS + 5)
+        result = AddressBulkService.import_ndjson(lines, profile)
+
+        assert len(result.errors) == AddressBulkService.MAX_REPORTED_ERRORS
+        assert result.errors_truncated is True
+
+    def test_import_limit_bajtow(self):
+        """Czytanie kończy się na linii, która przekracza max_bytes."""
+        profile = ProfileFactory()
+        lines = [b'{"city": "Miasto"}\n'] * 5
+        result = AddressBulkService.import_ndjson(
+            lines, profile, max_bytes=len(lines[0]) * 3
+        )
+
+        assert result.created == 3
+        assert result.limit_exceeded is True
+        assert result.errors[-1]["line"] == 4
+
+    def test_export_jedna_linia_na_adres(self):
+        """Eksport powinien generować linię NDJSON per adres w kolejności utworzenia."""
+        profile = ProfileFactory()
+        AddressFactory.create_batch(3, profile=profile)
+        lines = list(
+            AddressBulkService.export_ndjson(
+                Address.objects.filter(profile=profile), chunk_size=2
+            )
+        )
+        assert len(lines) == 3
+        assert all(line.endswith(b"\n") for line in lines)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import cast
 
 import pytest
@@ -8,9 +9,10 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.test import APIClient
 
-from apps.accounts.models import Profile
+from apps.accounts.models import Address, Profile
 from apps.accounts.models.roles_model import RoleChoices
-from tests.factories.accounts import ProfileFactory, UserFactory
+from apps.accounts.services import AddressBulkService
+from tests.factories.accounts import AddressFactory, ProfileFactory, UserFactory
 
 
 @pytest.mark.django_db
@@ -46,14 +48,55 @@ class TestProfileViewSetList:
         api_client.force_authenticate(user=user1)
         response = cast(Response, api_client.get(reverse("profile-list")))
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1  # type: ignore
-        assert response.data[0]["email"] == user1.email  # type: ignore
+        assert len(response.data["results"]) == 1  # type: ignore
+        assert response.data["results"][0]["email"] == user1.email  # type: ignore
 
     def test_pusta_lista_gdy_brak_profilu(self, authenticated_client: APIClient):
         """Lista profili powinna być pusta gdy użytkownik nie ma profilu."""
         response = cast(Response, authenticated_client.get(reverse("profile-list")))
         assert response.status_code == status.HTTP_200_OK
-        assert response.data == []  # type: ignore
+        assert response.data["results"] == []  # type: ignore
+
+
+@pytest.mark.django_db
+class TestProfileViewSetCache:
+    """Testy odczytu profilu przez cache."""
+
+    def test_powtorny_list_bez_zapytan(
+        self, authenticated_client: APIClient, user, django_assert_num_queries
+    ):
+        """Drugi GET list nie powinien wykonywać zapytań do bazy."""
+        ProfileFactory(user=user)
+        authenticated_client.get(reverse("profile-list"))
+
+        with django_assert_num_queries(0):
+            response = cast(
+                Response, authenticated_client.get(reverse("profile-list"))
+            )
+        assert response.data["results"][0]["email"] == user.email  # type: ignore
+
+    def test_retrieve_z_cache(
+        self, authenticated_client: APIClient, user, django_assert_num_queries
+    ):
+        """GET detail własnego profilu po rozgrzaniu cache nie pyta bazy."""
+        profile = ProfileFactory(user=user)
+        url = reverse("profile-detail", args=[profile.pk])
+        authenticated_client.get(url)
+
+        with django_assert_num_queries(0):
+            response = cast(Response, authenticated_client.get(url))
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_patch_odswieza_cache(self, authenticated_client: APIClient, user):
+        """Po PATCH kolejny odczyt powinien zwrócić nowe dane."""
+        profile = ProfileFactory(user=user, first_name="Stare")
+        authenticated_client.get(reverse("profile-list"))
+
+        url = reverse("profile-detail", args=[profile.pk])
+        authenticated_client.patch(url, {"first_name": "Nowe"}, format="json")
+
+        response = cast(Response, authenticated_client.get(reverse("profile-list")))
+        assert response.data["results"][0]["first_name"] == "Nowe"  # type: ignore
 
 
 @pytest.mark.django_db
@@ -138,3 +181,216 @@ class TestProfileViewSetChangeRole:
         assert response.status_code == status.HTTP_200_OK
         profile.refresh_from_db()
         assert profile.role == RoleChoices.CUSTOMER
+
+
+@pytest.mark.django_db
+class TestAddressViewSet:
+    """Testy AddressViewSet — izolacja i tworzenie adresów."""
+
+    def test_user_widzi_tylko_swoje_adresy(self, authenticated_client: APIClient, user):
+        """GET list powinien zwracać tylko adresy profilu zalogowanego użytkownika."""
+        own = AddressFactory(profile=ProfileFactory(user=user))
+        AddressFactory()
+        response = cast(Response, authenticated_client.get(reverse("address-list")))
+        assert response.status_code == status.HTTP_200_OK
+        assert [a["id"] for a in response.data["results"]] == [str(own.pk)]  # type: ignore
+
+    def test_create_przypisuje_profil(self, authenticated_client: APIClient, user):
+        """POST powinien przypisać adres do profilu zalogowanego użytkownika."""
+        profile = ProfileFactory(user=user)
+        response = cast(
+            Response,
+            authenticated_client.post(
+                reverse("address-list"), {"city": "Kraków"}, format="json"
+            ),
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Address.objects.filter(profile=profile, city="Kraków").exists()
+
+    def test_create_bez_profilu(self, authenticated_client: APIClient):
+        """POST bez profilu powinien zwrócić 400 zamiast 500."""
+        response = cast(
+            Response,
+            authenticated_client.post(
+                reverse("address-list"), {"city": "Kraków"}, format="json"
+            ),
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_domyslnego_przelacza_flage(
+        self, authenticated_client: APIClient, user
+    ):
+        """POST z is_default=True powinien zdjąć flagę ze starego domyślnego."""
+        profile = ProfileFactory(user=user)
+        old = AddressFactory(profile=profile, is_default=True)
+        response = cast(
+            Response,
+            authenticated_client.post(
+                reverse("address-list"),
+                {"city": "Gdańsk", "is_default": True},
+                format="json",
+            ),
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["is_default"] is True  # type: ignore
+        old.refresh_from_db()
+        assert old.is_default is False
+
+
+@pytest.mark.django_db
+class TestAddressViewSetSetDefault:
+    """Testy akcji set-default."""
+
+    def test_przelacza_domyslny_adres(self, authenticated_client: APIClient, user):
+        """PATCH set-default powinien zostawić dokładnie jeden domyślny adres."""
+        profile = ProfileFactory(user=user)
+        old = AddressFactory(profile=profile, is_default=True)
+        new = AddressFactory(profile=profile)
+        url = reverse("address-set-default", args=[new.pk])
+        response = cast(Response, authenticated_client.patch(url))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["is_default"] is True  # type: ignore
+        old.refresh_from_db()
+        new.refresh_from_db()
+        assert (old.is_default, new.is_default) == (False, True)
+
+    def test_juz_domyslny(self, authenticated_client: APIClient, user):
+        """PATCH set-default na domyślnym adresie powinien zwrócić 400."""
+        address = AddressFactory(profile=ProfileFactory(user=user), is_default=True)
+        url = reverse("address-set-default", args=[address.pk])
+        response = cast(Response, authenticated_client.patch(url))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cudzy_adres(self, authenticated_client: APIClient, user):
+        """PATCH set-default cudzego adresu zwraca 404 i nie rusza flag."""
+        own = AddressFactory(profile=ProfileFactory(user=user), is_default=True)
+        foreign = AddressFactory()
+        url = reverse("address-set-default", args=[foreign.pk])
+        response = cast(Response, authenticated_client.patch(url))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        own.refresh_from_db()
+        assert own.is_default is True
+
+    def test_liczba_zapytan(
+        self, authenticated_client: APIClient, user, django_assert_max_num_queries
+    ):
+        """Przełączenie to SELECT + dwa UPDATE (plus savepointy transakcji)."""
+        profile = ProfileFactory(user=user)
+        AddressFactory(profile=profile, is_default=True)
+        new = AddressFactory(profile=profile)
+        url = reverse("address-set-default", args=[new.pk])
+        with django_assert_max_num_queries(5):
+            authenticated_client.patch(url)
+
+
+@pytest.mark.django_db
+class TestAddressViewSetBulk:
+    """Testy importu i eksportu NDJSON."""
+
+    def _post_ndjson(self, client: APIClient, lines: list[str]) -> Response:
+        return cast(
+            Response,
+            client.post(
+                reverse("address-bulk-import"),
+                data="\n".join(lines).encode(),
+                content_type="application/x-ndjson",
+            ),
+        )
+
+    def test_import_tworzy_adresy(self, authenticated_client: APIClient, user):
+        """POST import powinien utworzyć adres z każdej poprawnej linii."""
+        profile = ProfileFactory(user=user)
+        lines = [
+            json.dumps({"city": "Kraków", "postalCode": "30-001", "country": "PL"}),
+            json.dumps({"city": "Gdańsk", "isDefault": True}),
+        ]
+        response = self._post_ndjson(authenticated_client, lines)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 2  # type: ignore
+        assert Address.objects.filter(profile=profile).count() == 2
+        assert Address.objects.get(profile=profile, is_default=True).city == "Gdańsk"
+        assert Address.objects.get(city="Kraków").postal_code == "30-001"
+
+    def test_import_raportuje_bledne_linie(self, authenticated_client: APIClient, user):
+        """Niepoprawne linie powinny być pominięte i zgłoszone z numerem."""
+        ProfileFactory(user=user)
+        lines = [
+            json.dumps({"city": "Kraków"}),
+            "{not json",
+            json.dumps({"country": "XX"}),
+        ]
+        response = self._post_ndjson(authenticated_client, lines)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 1  # type: ignore
+        assert [e["line"] for e in response.data["errors"]] == [2, 3]  # type: ignore
+
+    def test_import_bez_content_length(self, authenticated_client: APIClient, user):
+        """Body bez Content-Length (chunked) jest odrzucane, a nie puste."""
+        ProfileFactory(user=user)
+        response = authenticated_client.post(
+            reverse("address-bulk-import"),
+            data=b'{"city": "Krakow"}',
+            content_type="application/x-ndjson",
+            CONTENT_LENGTH="",
+        )
+
+        assert response.status_code == status.HTTP_411_LENGTH_REQUIRED
+        assert not Address.objects.exists()
+
+    def test_import_puste_body(self, authenticated_client: APIClient, user):
+        """Puste body zwraca 400 zamiast cichego sukcesu."""
+        ProfileFactory(user=user)
+        response = authenticated_client.post(
+            reverse("address-bulk-import"),
+            content_type="application/x-ndjson",
+            CONTENT_LENGTH="0",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_import_za_duze_body(
+        self, authenticated_client: APIClient, user, monkeypatch
+    ):
+        """Content-Length ponad MAX_BYTES jest odrzucany przed czytaniem body."""
+        ProfileFactory(user=user)
+        monkeypatch.setattr(AddressBulkService, "MAX_BYTES", 10)
+        response = self._post_ndjson(
+            authenticated_client, [json.dumps({"city": "Kraków"})]
+        )
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert not Address.objects.exists()
+
+    def test_import_limit_linii(
+        self, authenticated_client: APIClient, user, monkeypatch
+    ):
+        """Po przekroczeniu MAX_ROWS import jest przerywany z 413."""
+        ProfileFactory(user=user)
+        monkeypatch.setattr(AddressBulkService, "MAX_ROWS", 2)
+        lines = [json.dumps({"city": f"Miasto {i}"}) for i in range(5)]
+        response = self._post_ndjson(authenticated_client, lines)
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert response.data["limit_exceeded"] is True  # type: ignore
+        assert response.data["errors"][-1]["line"] == 3  # type: ignore
+        assert Address.objects.count() == 2
+
+    def test_export_strumieniuje_ndjson(self, authenticated_client: APIClient, user):
+        """GET export powinien zwrócić po jednej linii na adres użytkownika."""
+        profile = ProfileFactory(user=user)
+        AddressFactory.create_batch(3, profile=profile)
+        AddressFactory()
+
+        response = authenticated_client.get(reverse("address-bulk-export"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()  # type: ignore
+        ]
+        assert len(rows) == 3
+        assert {"postalCode", "isDefault"} <= rows[0].keys()
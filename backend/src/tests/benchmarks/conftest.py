@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pytest
+
+from tests.shared import BenchmarkResult
+
+_RESULTS: list[BenchmarkResult] = []
+
+
+@pytest.fixture
+def benchmark_report():
+    """Zbiera wyniki benchmarków do wypisania w podsumowaniu pytest."""
+    return _RESULTS.append
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _RESULTS:
+        return
+    terminalreporter.section("benchmarks")
+    for result in _RESULTS:
+        terminalreporter.write_line(result.report())
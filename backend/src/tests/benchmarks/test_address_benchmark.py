@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+"""
+Benchmark przełączania adresu domyślnego.
+
+Porównuje dawny przepływ (UPDATE wszystkich adresów, SELECT, save()) z
+AddressManager.set_default: liczbę zapytań oraz latencję przy równoległych
+requestach na adresy jednego profilu.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+
+from apps.accounts.models import Address
+from tests.factories.accounts import AddressFactory, ProfileFactory
+from tests.shared import BenchmarkResult, benchmark_size, measure
+
+pytestmark = [pytest.mark.slow]
+
+
+def _legacy_set_default(user, address_id) -> None:
+    Address.objects.for_user(user).update(is_default=False)
+    address = Address.objects.for_user(user).get(pk=address_id)
+    address.is_default = True
+    address.save()
+
+
+def _atomic_set_default(user, address_id) -> None:
+    address = Address.objects.for_user(user).get(pk=address_id)
+    Address.objects.set_default(address)
+
+
+def _statements(ctx: CaptureQueriesContext) -> int:
+    """Zapytania bez SAVEPOINT/RELEASE, które dokłada transakcja testu."""
+    return sum(
+        1
+        for query in ctx.captured_queries
+        if not query["sql"].upper().startswith(("SAVEPOINT", "RELEASE"))
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "name, switch",
+    [("legacy", _legacy_set_default), ("atomic", _atomic_set_default)],
+)
+def test_set_default_query_count(name, switch, benchmark_report):
+    """Liczba zapytań i latencja jednego przełączenia (sekwencyjnie)."""
+    profile = ProfileFactory()
+    addresses = AddressFactory.create_batch(benchmark_size(10), profile=profile)
+    ids = iter([a.pk for a in addresses] * 1000)
+
+    with CaptureQueriesContext(connection) as ctx:
+        switch(profile.user, next(ids))
+    result = measure(
+        f"set_default[{name}]", lambda: switch(profile.user, next(ids)), repeat=50
+    )
+    result.extra["queries"] = _statements(ctx)
+    benchmark_report(result)
+
+    assert Address.objects.filter(profile=profile, is_default=True).count() == 1
+
+
+@pytest.mark.skipif(
+    connection.vendor == "sqlite",
+    reason="SQLite in-memory blokuje całe tabele — pomiar ma sens na PostgreSQL",
+)
+@pytest.mark.django_db(transaction=True)
+def test_set_default_parallel(benchmark_report):
+    """Równoległe przełączenia: zawsze dokładnie jeden adres domyślny."""
+    profile = ProfileFactory()
+    addresses = AddressFactory.create_batch(benchmark_size(10), profile=profile)
+    workers = 8
+    rounds = benchmark_size(50)
+
+    def switch(address_id) -> float:
+        start = time.perf_counter()
+        try:
+            _atomic_set_default(profile.user, address_id)
+        finally:
+            connections.close_all()
+        return time.perf_counter() - start
+
+    targets = [addresses[i % len(addresses)].pk for i in range(rounds)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        samples = list(pool.map(switch, targets))
+
+    result = BenchmarkResult(
+        name=f"set_default[atomic, {workers} threads]",
+        samples=samples,
+        extra={"vendor": connection.vendor},
+    )
+    benchmark_report(result)
+
+    assert Address.objects.filter(profile=profile, is_default=True).count() == 1
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from tests.shared import BenchmarkResult
+
+
+class TestBenchmarkResult:
+    """Statystyki raportu benchmarku dla małych prób."""
+
+    @pytest.mark.parametrize(
+        ("samples", "p95"),
+        [
+            ([0.001], 1.0),
+            ([0.001, 0.002], 2.0),
+            ([i / 1000 for i in range(1, 21)], 19.0),
+            ([i / 1000 for i in range(1, 101)], 95.0),
+        ],
+        ids=["n=1", "n=2", "n=20", "n=100"],
+    )
+    def test_p95_najblizsza_ranga(self, samples, p95):
+        result = BenchmarkResult(name="bench", samples=list(reversed(samples)))
+        assert result.p95_ms == pytest.approx(p95)
+
+    def test_p95_nie_mniejszy_od_mediany(self):
+        result = BenchmarkResult(name="bench", samples=[0.003, 0.001])
+        assert result.p95_ms >= result.median_ms
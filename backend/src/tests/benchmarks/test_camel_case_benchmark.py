@@ -0,0 +1,98 @@
+"""
+Benchmark renderera i parsera camelCase.
+
+Porównuje renderer/parser z djangorestframework_camel_case z
+common.renderers / common.parsers na zagnieżdżonych payloadach w kształcie
+odpowiedzi API (strona wyników z profilem i adresami).
+"""
+
+from __future__ import annotations
+
+import datetime
+import io
+import json
+import uuid
+
+import pytest
+from djangorestframework_camel_case.parser import (
+    CamelCaseJSONParser as LibraryCamelCaseJSONParser,
+)
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+from djangorestframework_camel_case.util import camelize
+
+from common.parsers import CamelCaseJSONParser
+from common.renderers import CamelCaseJSONRenderer
+from tests.shared import benchmark_size, measure
+
+pytestmark = [pytest.mark.slow]
+
+
+def _payload(rows: int) -> dict:
+    created_at = datetime.datetime(2025, 1, 2, 3, 4, 5).isoformat()
+    return {
+        "next": "https://api.example.com/api/v1/addresses/?cursor=abc",
+        "previous": None,
+        "results": [
+            {
+                "id": str(uuid.uuid4()),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "street": f"ul. Długa {i}",
+                "city": "Warszawa",
+                "postal_code": "00-001",
+                "country_code": "PL",
+                "is_default": i == 0,
+                "profile": {
+                    "first_name": "Jan",
+                    "last_name": "Kowalski",
+                    "full_name": "Jan Kowalski",
+                    "date_of_birth": "1990-06-15",
+                    "phone_number": "+48 600 100 200",
+                },
+                "delivery_notes": [
+                    {"note_type": "gate_code", "note_value": "1234"},
+                    {"note_type": "floor_number", "note_value": str(i % 10)},
+                ],
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+@pytest.mark.parametrize("rows", [benchmark_size(100)])
+@pytest.mark.parametrize(
+    "name, renderer_class",
+    [
+        ("library", LibraryCamelCaseJSONRenderer),
+        ("memoized", CamelCaseJSONRenderer),
+    ],
+)
+def test_render_throughput(name, renderer_class, rows, benchmark_report):
+    """Przepustowość renderowania strony wyników."""
+    data = _payload(rows)
+    renderer = renderer_class()
+    body = renderer.render(data)
+    assert body == LibraryCamelCaseJSONRenderer().render(data)
+
+    result = measure(f"render[{name}] rows={rows}", lambda: renderer.render(data))
+    result.extra["MB/s"] = f"{len(body) / result.median_ms / 1000:.1f}"
+    benchmark_report(result)
+
+
+@pytest.mark.parametrize("rows", [benchmark_size(100)])
+@pytest.mark.parametrize(
+    "name, parser_class",
+    [("library", LibraryCamelCaseJSONParser), ("memoized", CamelCaseJSONParser)],
+)
+def test_parse_throughput(name, parser_class, rows, benchmark_report):
+    """Przepustowość parsowania body w camelCase."""
+    body = json.dumps(camelize(_payload(rows))).encode()
+    parser = parser_class()
+
+    result = measure(
+        f"parse[{name}] rows={rows}", lambda: parser.parse(io.BytesIO(body))
+    )
+    result.extra["MB/s"] = f"{len(body) / result.median_ms / 1000:.1f}"
+    benchmark_report(result)
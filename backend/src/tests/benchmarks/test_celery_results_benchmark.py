@@ -0,0 +1,91 @@
+"""
+Benchmark zapisu wyników zadań Celery: przepustowość i zapisy do bazy.
+
+Zadania są wykonywane lokalnie (apply) z backendem django-db i
+task_store_eager_result, więc wynik trafia do django_celery_results tak
+jak w workerze. Porównanie: "stored" — każde wykonanie zapisuje wiersz
+(dawne CELERY_RESULT_BACKEND = "django-db" dla wszystkich zadań) vs
+"ignored" — fire-and-forget (ignore_result=True).
+
+Maile trafiają do locmem (jeden na wykonanie — sprawdzane), a rejestr
+doręczeń i sesje do FakeRedis, więc mierzona jest ścieżka udanej wysyłki,
+nie ponowień po błędzie połączenia.
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import fakeredis
+import pytest
+from django.core import mail
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django_celery_results.backends import DatabaseBackend
+
+from core.celery import app
+from core.services.mail import ledger
+from core.services.mail.tasks import send_email_payloads_task
+from core.services.mail.types import EmailPayload
+from core.services.sessions import backend as session_backend
+from core.services.sessions.tasks import persist_dirty_sessions
+from tests.shared import benchmark_size, measure
+
+pytestmark = [pytest.mark.slow, pytest.mark.django_db]
+
+WRITES = ("INSERT", "UPDATE", "DELETE")
+
+
+@pytest.fixture
+def db_results(monkeypatch):
+    backend = DatabaseBackend(app=app)
+    for task in (send_email_payloads_task, persist_dirty_sessions):
+        monkeypatch.setattr(task, "store_eager_result", True)
+        monkeypatch.setattr(task, "_backend", backend)
+
+
+@pytest.fixture
+def local_delivery(settings, monkeypatch):
+    settings.ACTUAL_EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(ledger, "get_ledger_redis", lambda: client)
+    monkeypatch.setattr(session_backend, "get_session_redis", lambda: client)
+
+
+def _payload(n: int) -> EmailPayload:
+    return {
+        "subject": "Kod logowania",
+        "body": "Twój kod: ABC123",
+        "from_email": "noreply@example.com",
+        "to": [f"u{n}@example.com"],
+        "cc": [],
+        "bcc": [],
+        "reply_to": [],
+        "headers": {},
+        "alternatives": {},
+        "idempotency_key": f"bench-{n}",
+    }
+
+
+@pytest.mark.parametrize("mode", ["stored", "ignored"])
+def test_task_result_writes(benchmark_report, db_results, local_delivery, mode):
+    """Wykonania na sekundę i zapisy SQL na wykonanie."""
+    counter = itertools.count()
+    ignore_result = mode == "ignored"
+    repeat = benchmark_size(100)
+
+    def run():
+        send_email_payloads_task.apply(
+            args=[[_payload(next(counter))]], ignore_result=ignore_result
+        )
+        persist_dirty_sessions.apply(ignore_result=ignore_result)
+
+    with CaptureQueriesContext(connection) as queries:
+        result = measure(f"celery-results[{mode}]", run, repeat=repeat, warmup=0)
+    assert len(mail.outbox) == repeat
+    writes = sum(
+        1 for query in queries.captured_queries if query["sql"].startswith(WRITES)
+    )
+    result.extra["tasks/s"] = round(2 * repeat / result.total_s, 1)
+    result.extra["writes/task"] = round(writes / (2 * repeat), 2)
+    benchmark_report(result)
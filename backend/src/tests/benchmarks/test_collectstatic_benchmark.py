@@ -0,0 +1,80 @@
+"""
+Benchmark collectstatic na prawdziwym drzewie plików (admin, DRF, allauth).
+
+Porównuje S3Boto3Storage (HEAD + data modyfikacji per plik, upload po
+kolei) ze StaticStorage (manifest sha256, równoległe uploady): pierwszy
+deploy do pustego bucketu i deploy bez zmian. Domyślnie na moto.
+
+Czasy są tylko raportowane; sprawdzamy liczbę uploadów (PutObject poza
+manifestem): deploy bez zmian nie wysyła żadnego pliku.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.client import BaseClient
+from django.core.management import call_command
+
+from core.storage.clients import registry
+from core.storage.static import STATIC_MANIFEST_NAME
+from tests.shared import measure
+
+pytestmark = [pytest.mark.slow]
+
+BACKENDS = {
+    "library": "storages.backends.s3boto3.S3Boto3Storage",
+    "incremental": "core.storage.storages.StaticStorage",
+}
+
+
+def _collect():
+    call_command("collectstatic", interactive=False, verbosity=0)
+
+
+def _uploads(calls) -> int:
+    """Wysłane pliki statyczne (PutObject; manifest się nie liczy)."""
+    return sum(
+        1
+        for call in calls
+        if call.args[1] == "PutObject"
+        and not call.args[2]["Key"].endswith(STATIC_MANIFEST_NAME)
+    )
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_collectstatic_first_and_unchanged(benchmark_report, settings, backend):
+    """Czas collectstatic: pusty bucket vs deploy bez zmian."""
+    registry.clear()
+    bucket = f"static-{backend}"
+    boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=bucket)
+    settings.AWS_STORAGE_BUCKET_NAME = bucket
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": BACKENDS[backend],
+            "OPTIONS": {"bucket_name": bucket} if backend == "library" else {},
+        },
+    }
+
+    api_call = BaseClient._make_api_call
+    with patch.object(
+        BaseClient, "_make_api_call", autospec=True, side_effect=api_call
+    ) as calls:
+        first = measure(
+            f"collectstatic[{backend}-first]", _collect, repeat=1, warmup=0
+        )
+        first.extra["uploads"] = _uploads(calls.call_args_list)
+        calls.reset_mock()
+        rerun = measure(
+            f"collectstatic[{backend}-unchanged]", _collect, repeat=3, warmup=0
+        )
+        rerun.extra["uploads"] = _uploads(calls.call_args_list)
+    for result in (first, rerun):
+        benchmark_report(result)
+    registry.clear()
+
+    assert first.extra["uploads"] > 0
+    assert rerun.extra["uploads"] == 0
@@ -0,0 +1,75 @@
+"""
+Benchmark budowania wariantów obrazów (jeden worker, jeden wątek).
+
+Każda iteracja to nowy, unikalny JPEG 2400x1600 wgrany do moto — pełna
+ścieżka zadania: pobranie źródła, dekodowanie w zmniejszonej skali,
+WebP + JPEG w każdej szerokości z IMAGE_VARIANT_WIDTHS i upload wyników.
+Drugi pomiar powtarza ten sam plik: klucze adresowane treścią kończą
+pracę na listowaniu prefiksu. Wynik w obrazach na sekundę na worker.
+"""
+
+from __future__ import annotations
+
+import io
+import uuid
+
+import boto3
+import pytest
+from django.utils import timezone
+from PIL import Image
+
+from apps.uploads.models import Upload, UploadStatus, UploadTarget
+from apps.uploads.services import ImageVariantService
+from core.storage.clients import registry
+from tests.shared import benchmark_size, measure
+
+pytestmark = [pytest.mark.slow, pytest.mark.django_db]
+
+
+def _source(seed: int) -> bytes:
+    image = Image.new("RGB", (2400, 1600), (seed % 256, 120, 60))
+    image.putpixel((0, 0), (seed // 256 % 256, 0, 0))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def _upload(s3, user, data: bytes) -> Upload:
+    key = f"images/{user.pk}/{uuid.uuid4().hex}.jpg"
+    s3.put_object(Bucket="products", Key=key, Body=data, ContentType="image/jpeg")
+    return Upload.objects.create(
+        owner=user,
+        target=UploadTarget.PRODUCT_IMAGE,
+        key=key,
+        content_type="image/jpeg",
+        size=len(data),
+        status=UploadStatus.COMMITTED,
+        committed_at=timezone.now(),
+    )
+
+
+def test_image_variants_throughput(benchmark_report, user):
+    """Obrazy/s na worker: nowe źródło vs ten sam plik (warianty już są)."""
+    registry.clear()
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket="products")
+    repeat = benchmark_size(10)
+    sources = iter([_source(seed) for seed in range(repeat + 1)])
+    same = _source(10_000)
+
+    fresh = measure(
+        "variants[fresh]",
+        lambda: ImageVariantService.process(_upload(s3, user, next(sources))),
+        repeat=repeat,
+    )
+    cached = measure(
+        "variants[same-content]",
+        lambda: ImageVariantService.process(_upload(s3, user, same)),
+        repeat=repeat,
+    )
+    for result in (fresh, cached):
+        result.extra["images/s"] = f"{len(result.samples) / result.total_s:.1f}"
+        benchmark_report(result)
+    registry.clear()
+
+    assert cached.median_ms < fresh.median_ms
@@ -0,0 +1,62 @@
+"""
+Benchmark logowania emailem.
+
+Porównuje dawny łańcuch backendów (ModelBackend + AuthenticationBackend z
+allauth) z EmailAuthenticationBackend: liczbę zapytań i latencję dla
+udanego logowania, błędnego hasła i serii prób na nieistniejące konto.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from tests.factories.accounts import UserFactory
+from tests.shared import measure
+
+pytestmark = [pytest.mark.slow]
+
+BACKENDS = {
+    "chain": [
+        "django.contrib.auth.backends.ModelBackend",
+        "allauth.account.auth_backends.AuthenticationBackend",
+    ],
+    "single": [
+        "apps.accounts.backends.EmailAuthenticationBackend",
+        "django.contrib.auth.backends.ModelBackend",
+        "allauth.account.auth_backends.AuthenticationBackend",
+    ],
+}
+CASES = {
+    "success": ("user@test.com", "testpass123!"),
+    "bad_password": ("user@test.com", "zle-haslo"),
+    "missing": ("brak@test.com", "testpass123!"),
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("case", list(CASES))
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_login_latency(backend, case, benchmark_report):
+    """Zapytania i latencja jednego authenticate()."""
+    cache.clear()
+    UserFactory(email="user@test.com")
+    email, password = CASES[case]
+    request = RequestFactory().post("/")
+
+    def login():
+        return authenticate(request, email=email, password=password)
+
+    with override_settings(AUTHENTICATION_BACKENDS=BACKENDS[backend]):
+        login()
+        with CaptureQueriesContext(connection) as ctx:
+            login()
+        result = measure(f"login[{backend}:{case}]", login, repeat=200)
+
+    result.extra["queries"] = len(ctx.captured_queries)
+    result.extra["logins/s"] = f"{1000 / result.median_ms:,.0f}"
+    benchmark_report(result)
@@ -0,0 +1,67 @@
+"""
+Benchmark endpointów allauth wysyłających maile: signup i login-by-code.
+
+Broker jest zastąpiony pustym .delay() — mierzony jest wyłącznie czas
+żądania. Porównanie: renderowanie szablonów w żądaniu (sync) vs tylko
+zakolejkowanie kontekstu (worker, MAIL_RENDER_IN_WORKER).
+"""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from core.services.mail.tasks import send_email_payloads_task
+from tests.factories.accounts import UserFactory
+from tests.shared import benchmark_size, measure
+
+pytestmark = [pytest.mark.slow, pytest.mark.django_db(transaction=True)]
+
+MODES = {"sync": False, "worker": True}
+
+
+@pytest.fixture
+def mail_mode(request, settings, monkeypatch):
+    settings.MAIL_RENDER_IN_WORKER = MODES[request.param]
+    settings.ACCOUNT_RATE_LIMITS = False
+    monkeypatch.setattr(send_email_payloads_task, "delay", lambda payloads: None)
+    return request.param
+
+
+@pytest.mark.parametrize("mail_mode", list(MODES), indirect=True)
+def test_signup_latency(benchmark_report, client, mail_mode):
+    """Latencja POST /_allauth/browser/v1/auth/signup."""
+    counter = itertools.count()
+
+    def signup():
+        response = client.post(
+            "/_allauth/browser/v1/auth/signup",
+            {"email": f"u{next(counter)}@example.com", "password": "Sup3r-Secret-1"},
+            content_type="application/json",
+        )
+        assert response.status_code == 401
+        client.cookies.clear()
+
+    result = measure(f"signup[{mail_mode}]", signup, repeat=benchmark_size(20))
+    benchmark_report(result)
+
+
+@pytest.mark.parametrize("mail_mode", list(MODES), indirect=True)
+def test_login_by_code_latency(benchmark_report, client, mail_mode):
+    """Latencja POST /_allauth/browser/v1/auth/code/request."""
+    UserFactory(email="code@example.com")
+
+    def request_code():
+        response = client.post(
+            "/_allauth/browser/v1/auth/code/request",
+            {"email": "code@example.com"},
+            content_type="application/json",
+        )
+        assert response.status_code == 401
+        client.cookies.clear()
+
+    result = measure(
+        f"login-by-code[{mail_mode}]", request_code, repeat=benchmark_size(20)
+    )
+    benchmark_report(result)
@@ -0,0 +1,67 @@
+"""
+Benchmark odczytu profili.
+
+Porównuje ProfileSerializer(many=True) na instancjach z select_related
+z ProfileReadSerializer na wierszach Profile.objects.read_rows() —
+full_name i age liczone w SQL, bez pól DRF. Rozmiary 1k i 100k wierszy
+przy BENCHMARK_SCALE=100.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth.hashers import make_password
+
+from apps.accounts.models import CustomUser, Profile
+from apps.accounts.serializers import ProfileReadSerializer, ProfileSerializer
+from tests.shared import benchmark_size, measure
+
+pytestmark = [pytest.mark.slow]
+
+
+def _create_profiles(count: int) -> None:
+    password = make_password(None)
+    users = CustomUser.objects.bulk_create(
+        [
+            CustomUser(email=f"bench{i}@test.com", password=password)
+            for i in range(count)
+        ],
+        batch_size=1000,
+    )
+    Profile.objects.bulk_create(
+        [
+            Profile(
+                user=user,
+                first_name="Jan",
+                last_name=f"Kowalski{i}",
+                date_of_birth=f"19{50 + i % 50}-0{1 + i % 9}-1{i % 10}",
+                phone_number="+48600100200" if i % 2 else "",
+            )
+            for i, user in enumerate(users)
+        ],
+        batch_size=1000,
+    )
+
+
+def _serialize_model() -> list:
+    queryset = Profile.objects.select_related("user")
+    return ProfileSerializer(queryset, many=True).data
+
+
+def _serialize_rows() -> list:
+    return ProfileReadSerializer(Profile.objects.read_rows(), many=True).data
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("size", [benchmark_size(10), benchmark_size(1000)])
+def test_profile_read_path(size, benchmark_report):
+    """Czas serializacji wszystkich profili obiema ścieżkami."""
+    _create_profiles(size)
+    assert _serialize_rows() == [dict(row) for row in _serialize_model()]
+
+    repeat = 5 if size >= 10_000 else 20
+    model = measure(f"profiles[serializer] rows={size}", _serialize_model, repeat=repeat)
+    rows = measure(f"profiles[read_rows] rows={size}", _serialize_rows, repeat=repeat)
+    rows.extra["speedup"] = f"{model.median_ms / rows.median_ms:.1f}x"
+    benchmark_report(model)
+    benchmark_report(rows)
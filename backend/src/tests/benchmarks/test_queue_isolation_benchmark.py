@@ -0,0 +1,107 @@
+"""
+Test obciążeniowy kolejek Celery: zalew maili a zadanie krytyczne.
+
+Workery są uruchamiane w procesie (celery.contrib.testing, broker
+memory://, pula wątków). Najpierw do brokera trafia FLOOD wolnych
+"maili", potem jedno zadanie krytyczne — mierzony jest czas od wysłania
+do rozpoczęcia zadania krytycznego. Porównanie: "single" — jedna kolejka
+i jeden worker (jak przed routingiem) vs "routed" — tabela routingu,
+osobny worker dla kolejki mail i dla critical,default.
+
+Workery pobierają wiadomości bez limitu prefetch: przy limicie konsument
+memory:// po zapełnieniu okna QoS czeka na swój 2-sekundowy timeout i to
+on, a nie praca maili, dominowałby pomiar. W trybie "single" zadanie
+krytyczne czeka więc na faktyczne wykonanie zalewu — sprawdzamy, że co
+najmniej tyle, ile wynika z FLOOD × MAIL_DELAY.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import ExitStack
+
+import pytest
+from celery.contrib.testing.worker import start_worker
+
+from core.celery import app
+from tests.shared import BenchmarkResult, benchmark_size
+
+pytestmark = pytest.mark.slow
+
+FLOOD = benchmark_size(50)
+MAIL_DELAY = 0.02
+
+_started = threading.Event()
+
+
+@app.task(name="benchmarks.slow_mail")
+def slow_mail() -> None:
+    time.sleep(MAIL_DELAY)
+
+
+@app.task(name="benchmarks.critical")
+def critical() -> None:
+    _started.set()
+
+
+WORKERS = {
+    "single": [("all", ["default"], 4)],
+    "routed": [("mail", ["mail"], 4), ("general", ["critical", "default"], 2)],
+}
+
+
+@pytest.fixture
+def queue_mode(request, settings):
+    settings.CELERY_TASK_ALWAYS_EAGER = False
+    # memory:// domyślnie odpytuje kolejki co sekundę.
+    settings.CELERY_BROKER_TRANSPORT_OPTIONS = {"polling_interval": 0.01}
+    settings.CELERY_TASK_QUEUE_MAP = (
+        {"benchmarks.slow_mail": "mail", "benchmarks.critical": "critical"}
+        if request.param == "routed"
+        else {}
+    )
+    return request.param
+
+
+def _purge(queues: list[str]) -> None:
+    """Usuń wiadomości pozostałe w brokerze memory:// po poprzednim trybie."""
+    with app.connection_for_write() as conn:
+        for queue in queues:
+            conn.default_channel.queue_purge(queue)
+
+
+@pytest.mark.parametrize("queue_mode", list(WORKERS), indirect=True)
+def test_critical_latency_under_mail_flood(benchmark_report, queue_mode):
+    """Opóźnienie zadania krytycznego za FLOOD maili w kolejce."""
+    _started.clear()
+    _purge(["default", "mail", "critical"])
+    with ExitStack() as stack:
+        for name, queues, concurrency in WORKERS[queue_mode]:
+            stack.enter_context(
+                start_worker(
+                    app,
+                    pool="threads",
+                    concurrency=concurrency,
+                    perform_ping_check=False,
+                    queues=queues,
+                    prefetch_multiplier=0,
+                    hostname=f"{name}-{queue_mode}@bench",
+                )
+            )
+        for _ in range(FLOOD):
+            slow_mail.delay()
+        sent = time.perf_counter()
+        critical.delay()
+        assert _started.wait(timeout=60)
+        latency = time.perf_counter() - sent
+
+    if queue_mode == "single":
+        # Kolejka FIFO: zadanie krytyczne rusza po rozpoczęciu całego zalewu.
+        _, _, concurrency = WORKERS["single"][0]
+        assert latency >= (FLOOD // concurrency - 1) * MAIL_DELAY
+
+    result = BenchmarkResult(name=f"critical-under-flood[{queue_mode}]")
+    result.samples.append(latency)
+    result.extra["flood"] = FLOOD
+    benchmark_report(result)
@@ -0,0 +1,44 @@
+"""
+Benchmark narzutu RequestMetricsMiddleware na żądanie.
+
+Middleware owija widok zwracający krótką odpowiedź (z ustawionym
+resolver_match, jak po routingu Django); narzut to różnica median
+względem samego widoku. Cel: poniżej 50 µs na żądanie — raportowany,
+nie sprawdzany, bo czas ścienny na współdzielonym CI jest zbyt zmienny.
+"""
+
+from __future__ import annotations
+
+import pytest
+from django.http import HttpResponse
+from django.urls import resolve
+
+from core.services.request_metrics import RequestMetricsMiddleware
+from tests.shared import benchmark_size, measure
+
+pytestmark = pytest.mark.slow
+
+BUDGET_US = 50
+
+
+def test_request_metrics_overhead(benchmark_report, rf):
+    """Mediana czasu żądania z middleware i bez."""
+    request = rf.get("/health/live/")
+    match = resolve("/health/live/")
+
+    def view(request):
+        request.resolver_match = match
+        return HttpResponse(b'{"status":"alive"}')
+
+    middleware = RequestMetricsMiddleware(view)
+    repeat = benchmark_size(5000)
+
+    bare = measure("request-metrics[off]", lambda: view(request), repeat=repeat)
+    metered = measure(
+        "request-metrics[on]", lambda: middleware(request), repeat=repeat
+    )
+    overhead_us = (metered.median_ms - bare.median_ms) * 1000
+    metered.extra["overhead_us"] = round(overhead_us, 1)
+    metered.extra["budget_us"] = BUDGET_US
+    benchmark_report(bare)
+    benchmark_report(metered)
@@ -0,0 +1,71 @@
+"""
+Benchmark klienta S3 per request: upload + HEAD.
+
+Każda iteracja symuluje jedno żądanie — nowa instancja storage'u zapisuje
+mały plik i sprawdza jego istnienie. Porównuje S3Boto3Storage z
+django-storages (nowa sesja i klient boto3 w każdej instancji) z
+DefaultStorage na współdzielonym rejestrze: zimny start (rejestr
+czyszczony przed każdą iteracją) i ciepły (klient już w rejestrze).
+Domyślnie na moto; z AWS_S3_ENDPOINT_URL i markerem integration — na MinIO.
+
+Czasy są tylko raportowane; sprawdzamy, że ciepłe żądania nie budują
+sesji boto3.
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+from django.core.files.base import ContentFile
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from core.storage.clients import registry
+from core.storage.storages import DefaultStorage
+from tests.shared import benchmark_size, measure
+
+pytestmark = [pytest.mark.slow]
+
+PAYLOAD = b"x" * 1024
+
+
+class LibraryStorage(S3Boto3Storage):
+    bucket_name = "test-bucket"
+
+
+class PooledStorage(DefaultStorage):
+    bucket_name = "test-bucket"
+    location = ""
+
+
+def _request(storage_class):
+    def run():
+        storage = storage_class()
+        name = storage.save(f"bench/{uuid.uuid4()}.bin", ContentFile(PAYLOAD))
+        assert storage.exists(name)
+
+    return run
+
+
+def _cold(run):
+    def cold():
+        registry.clear()
+        run()
+
+    return cold
+
+
+def test_upload_head_per_request(benchmark_report):
+    """Latencja upload + HEAD na żądanie: biblioteka vs rejestr (zimny/ciepły)."""
+    repeat = benchmark_size(30)
+    library = measure("s3[library]", _request(LibraryStorage), repeat=repeat)
+    cold = measure("s3[pooled-cold]", _cold(_request(PooledStorage)), repeat=repeat)
+    with patch.object(registry, "_session", wraps=registry._session) as sessions:
+        warm = measure("s3[pooled-warm]", _request(PooledStorage), repeat=repeat)
+    warm.extra["speedup_vs_library"] = round(library.median_ms / warm.median_ms, 2)
+    for result in (library, cold, warm):
+        benchmark_report(result)
+    registry.clear()
+
+    assert sessions.call_count == 0
@@ -0,0 +1,43 @@
+"""
+Benchmark narzutu instrumentacji zadań Celery (sygnały + bufor w procesie).
+
+Zadanie jest wykonywane lokalnie (apply) z włączonymi i wyłączonymi
+metrykami; zrzut do Redis odbywa się najwyżej raz na
+TASK_METRICS_FLUSH_INTERVAL, więc mierzony jest koszt pojedynczego zadania.
+"""
+
+from __future__ import annotations
+
+import fakeredis
+import pytest
+
+from core.celery import app
+from core.services.task_metrics import store
+from tests.shared import benchmark_size, measure
+
+pytestmark = pytest.mark.slow
+
+
+@app.task(name="benchmarks.noop")
+def noop() -> None:
+    return None
+
+
+@pytest.fixture
+def metrics_redis(monkeypatch):
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(store, "get_metrics_redis", lambda: client)
+    return client
+
+
+@pytest.mark.parametrize("enabled", [False, True], ids=["off", "on"])
+def test_task_metrics_overhead(benchmark_report, settings, metrics_redis, enabled):
+    """Czas apply() pustego zadania z instrumentacją i bez."""
+    settings.TASK_METRICS_ENABLED = enabled
+    result = measure(
+        f"task-metrics[{'on' if enabled else 'off'}]",
+        noop.apply,
+        repeat=benchmark_size(2000),
+        warmup=50,
+    )
+    benchmark_report(result)
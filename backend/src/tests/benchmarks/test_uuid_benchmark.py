@@ -0,0 +1,62 @@
+"""
+Benchmark kluczy głównych uuid4 vs uuid7.
+
+Wstawia adresy paczkami bulk_create i mierzy tempo wstawiania; na
+PostgreSQL raportuje też rozmiar indeksu PK (pg_relation_size). Pełny
+pomiar 10M wierszy: BENCHMARK_SCALE=1000 na bazie PostgreSQL.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+
+from apps.accounts.models import Address
+from tests.factories.accounts import ProfileFactory
+from tests.shared import BenchmarkResult, benchmark_size
+
+pytestmark = [pytest.mark.slow]
+
+BATCH_SIZE = 5_000
+
+
+def _pk_index_size() -> int | None:
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_relation_size(indexrelid) FROM pg_index "
+            "WHERE indrelid = 'accounts_address'::regclass AND indisprimary"
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("use_uuid7", [False, True], ids=["uuid4", "uuid7"])
+def test_insert_rate(use_uuid7, benchmark_report):
+    """Tempo wstawiania i rozmiar indeksu PK dla obu wersji UUID."""
+    profile = ProfileFactory()
+    total = benchmark_size(10_000)
+    result = BenchmarkResult(name=f"insert[{'uuid7' if use_uuid7 else 'uuid4'}]")
+
+    with override_settings(TIMESTAMPED_MODEL_UUID7=use_uuid7):
+        for start in range(0, total, BATCH_SIZE):
+            batch = [
+                Address(profile=profile, street=f"ul. Długa {i}", city="Warszawa")
+                for i in range(start, min(start + BATCH_SIZE, total))
+            ]
+            started = time.perf_counter()
+            Address.objects.bulk_create(batch, batch_size=1_000)
+            result.samples.append(time.perf_counter() - started)
+
+    result.extra["rows"] = total
+    result.extra["rows/s"] = f"{total / result.total_s:,.0f}"
+    index_size = _pk_index_size()
+    if index_size is not None:
+        result.extra["pk_index_MB"] = f"{index_size / 1024 / 1024:.1f}"
+    benchmark_report(result)
+
+    assert Address.objects.filter(profile=profile).count() == total
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import io
+import uuid
+from collections import OrderedDict
+
+import pytest
+from django.utils.translation import gettext_lazy
+from djangorestframework_camel_case.parser import (
+    CamelCaseJSONParser as LibraryCamelCaseJSONParser,
+)
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+from djangorestframework_camel_case.util import (
+    camelize as library_camelize,
+    underscoreize as library_underscoreize,
+)
+from rest_framework.exceptions import ParseError
+
+from common.camel_case import (
+    KEY_CACHE_SIZE,
+    camelize,
+    camelize_key,
+    underscore_key,
+    underscoreize,
+)
+from common.parsers import CamelCaseJSONParser
+from common.renderers import CamelCaseJSONRenderer
+
+PAYLOADS = [
+    None,
+    [],
+    {},
+    "snake_case_value",
+    {"first_name": "Jan", "last_name": "Kowalski", "is_default": True},
+    {
+        "results": [
+            {
+                "id": uuid.UUID("0190c4b4-8c4e-7000-8000-000000000001"),
+                "created_at": datetime.datetime(2025, 1, 2, 3, 4, 5),
+                "date_of_birth": datetime.date(1990, 6, 15),
+                "price_gross": decimal.Decimal("12.30"),
+                "tags_v2": ("a_b", "c_d"),
+                "nested_obj": OrderedDict(postal_code="00-001", line_2=None),
+            }
+        ],
+        "next": None,
+        "_private_key": 1,
+        "key__double": 2,
+        "ends_with_": 3,
+        "a1_b2": 4.5,
+        1: "int_key",
+    },
+    {"detail": gettext_lazy("Not found."), gettext_lazy("lazy_key"): "x"},
+    {"unicode_text": "zażółć gęślą jaźń   "},
+    {"set_field": frozenset({"only_one"})},
+    {"generator_like": range(3)},
+]
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+@pytest.mark.parametrize("accepted", [None, "application/json; indent=4"])
+def test_renderer_bajt_w_bajt(data, accepted):
+    """Renderer powinien dawać identyczne bajty jak renderer z biblioteki."""
+    expected = LibraryCamelCaseJSONRenderer().render(data, accepted)
+    assert CamelCaseJSONRenderer().render(data, accepted) == expected
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"ignore_fields": ("raw_data",)},
+        {"ignore_keys": ("keep_me",)},
+        {"ignore_fields": ("rawData",), "ignore_keys": ("keepMe",)},
+    ],
+)
+def test_camelize_opcje_ignore(options):
+    """ignore_fields / ignore_keys działają jak w bibliotece."""
+    data = {"raw_data": {"inner_key": 1}, "keep_me": {"inner_key": 2}, "x_y": 3}
+    assert camelize(data, **options) == library_camelize(data, **options)
+
+
+@pytest.mark.parametrize("no_number", [False, True])
+def test_underscoreize_zgodnosc(no_number):
+    """underscoreize powinien dawać to samo co biblioteka dla danych JSON."""
+    data = {
+        "firstName": "Jan",
+        "addressLine2": "x",
+        "HTTPResponse": [{"innerKey": 1, "ABCDef": None}],
+        "already_snake": {"v2Key": True},
+        "ignoreMe": {"deepKey": 1},
+    }
+    options = {
+        "no_underscore_before_number": no_number,
+        "ignore_fields": ("ignore_me",),
+    }
+    assert underscoreize(data, **options) == library_underscoreize(data, **options)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"firstName": "Jan", "items": [{"postalCode": "00-001"}]}', b"[1, 2]"],
+)
+def test_parser_zgodnosc(body):
+    """Parser powinien zwracać te same dane co parser z biblioteki."""
+    expected = LibraryCamelCaseJSONParser().parse(io.BytesIO(body))
+    assert CamelCaseJSONParser().parse(io.BytesIO(body)) == expected
+
+
+def test_parser_blad_skladni():
+    """Niepoprawny JSON kończy się ParseError z tym samym komunikatem."""
+    with pytest.raises(ParseError) as lib_error:
+        LibraryCamelCaseJSONParser().parse(io.BytesIO(b"{bad"))
+    with pytest.raises(ParseError) as error:
+        CamelCaseJSONParser().parse(io.BytesIO(b"{bad"))
+    assert error.value.detail == lib_error.value.detail
+
+
+def test_memo_jest_ograniczone():
+    """Tablice memo nie rosną ponad KEY_CACHE_SIZE."""
+    for i in range(KEY_CACHE_SIZE + 10):
+        camelize_key(f"generated_key_{i}")
+        underscore_key(f"generatedKey{i}")
+    assert camelize_key.cache_info().currsize == KEY_CACHE_SIZE
+    assert underscore_key.cache_info().currsize == KEY_CACHE_SIZE
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import time
+import uuid
+
+import pytest
+from django.test import override_settings
+from freezegun import freeze_time
+
+from common.identifiers import default_uuid, uuid7, uuid7_timestamp_ms
+from tests.factories.accounts import ProfileFactory
+
+
+def test_uuid7_wersja_i_wariant():
+    """uuid7 powinien mieć wersję 7 i wariant RFC 4122/9562."""
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_zawiera_czas_utworzenia():
+    """48 najstarszych bitów to czas unix w milisekundach."""
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+    assert before <= uuid7_timestamp_ms(value) <= after + 1
+
+
+def test_uuid7_scisle_rosnace_w_procesie():
+    """Kolejne wartości rosną także w obrębie jednej milisekundy."""
+    with freeze_time("2025-06-15 12:00:00"):
+        values = [uuid7() for _ in range(10_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_default_uuid_domyslnie_uuid4():
+    """Bez TIMESTAMPED_MODEL_UUID7 klucze dalej są uuid4."""
+    with override_settings(TIMESTAMPED_MODEL_UUID7=False):
+        assert default_uuid().version == 4
+
+
+def test_default_uuid_opt_in_uuid7():
+    """Z TIMESTAMPED_MODEL_UUID7 klucze są uuid7."""
+    with override_settings(TIMESTAMPED_MODEL_UUID7=True):
+        assert default_uuid().version == 7
+
+
+@pytest.mark.django_db
+def test_timestamped_model_uzywa_default_uuid():
+    """Nowe wiersze TimestampedModel dostają uuid7 po włączeniu opcji."""
+    with override_settings(TIMESTAMPED_MODEL_UUID7=True):
+        profile = ProfileFactory()
+    assert profile.pk.version == 7
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import cast
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIClient
+
+from tests.factories.accounts import AddressFactory, ProfileFactory
+
+
+def _get(client: APIClient, url: str, **params) -> Response:
+    return cast(Response, client.get(url, params))
+
+
+def _collect_ids(client: APIClient, url: str, **params) -> list[str]:
+    """Przejdź wszystkie strony po linkach next i zbierz id."""
+    ids: list[str] = []
+    response = _get(client, url, **params)
+    while True:
+        ids += [row["id"] for row in response.data["results"]]  # type: ignore
+        next_url = response.data["next"]  # type: ignore
+        if next_url is None:
+            return ids
+        response = cast(Response, client.get(next_url))
+
+
+@pytest.mark.django_db
+class TestTimestampedCursorPagination:
+    """Testy paginacji keyset po (created_at, id)."""
+
+    def test_strony_bez_duplikatow_i_dziur(self, authenticated_client, user):
+        """Przejście po next zwraca wszystkie wiersze dokładnie raz, od najnowszych."""
+        profile = ProfileFactory(user=user)
+        addresses = AddressFactory.create_batch(7, profile=profile)
+        expected = [
+            str(a.pk)
+            for a in sorted(addresses, key=lambda a: (a.created_at, a.pk), reverse=True)
+        ]
+
+        ids = _collect_ids(authenticated_client, reverse("address-list"), page_size=3)
+        assert ids == expected
+
+    def test_ten_sam_created_at(self, authenticated_client, user):
+        """Remisy created_at są rozstrzygane po id — żaden wiersz nie ginie."""
+        profile = ProfileFactory(user=user)
+        with freeze_time("2026-01-01 12:00:00"):
+            addresses = AddressFactory.create_batch(5, profile=profile)
+
+        ids = _collect_ids(authenticated_client, reverse("address-list"), page_size=2)
+        assert sorted(ids) == sorted(str(a.pk) for a in addresses)
+        assert len(ids) == 5
+
+    def test_previous_wraca_do_poprzedniej_strony(self, authenticated_client, user):
+        """Link previous z drugiej strony zwraca pierwszą stronę."""
+        profile = ProfileFactory(user=user)
+        AddressFactory.create_batch(4, profile=profile)
+        url = reverse("address-list")
+
+        first = _get(authenticated_client, url, page_size=2)
+        second = cast(Response, authenticated_client.get(first.data["next"]))  # type: ignore
+        back = cast(Response, authenticated_client.get(second.data["previous"]))  # type: ignore
+
+        assert first.data["previous"] is None  # type: ignore
+        assert back.data["results"] == first.data["results"]  # type: ignore
+
+    def test_zmodyfikowany_kursor(self, authenticated_client, user):
+        """Kursor z naruszonym podpisem powinien zwrócić 404."""
+        profile = ProfileFactory(user=user)
+        AddressFactory.create_batch(3, profile=profile)
+        url = reverse("address-list")
+        next_url = _get(authenticated_client, url, page_size=1).data["next"]  # type: ignore
+        cursor = parse_qs(urlsplit(next_url).query)["cursor"][0]
+
+        response = _get(authenticated_client, url, cursor=cursor[:-3] + "abc")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_stala_liczba_zapytan_na_strone(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Dalsza strona to nadal jedno zapytanie o wiersze."""
+        profile = ProfileFactory(user=user)
+        AddressFactory.create_batch(6, profile=profile)
+        url = reverse("address-list")
+        next_url = _get(authenticated_client, url, page_size=2).data["next"]  # type: ignore
+        next_url = cast(Response, authenticated_client.get(next_url)).data["next"]  # type: ignore
+
+        with django_assert_num_queries(1):
+            authenticated_client.get(next_url)
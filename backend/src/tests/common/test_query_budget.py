@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+from django.urls import reverse
+
+from apps.accounts.views import AddressViewSet
+from common import query_budget
+from common.query_budget import QueryBudgetExceeded, fingerprint
+from tests.factories.accounts import AddressFactory, ProfileFactory
+
+
+def test_fingerprint():
+    """Wartości i listy IN (...) nie zmieniają fingerprintu."""
+    first = fingerprint("SELECT * FROM t WHERE id IN (%s, %s) AND x = 'a'  LIMIT 21")
+    second = fingerprint("SELECT * FROM t WHERE id IN (%s) AND x = 'bb' LIMIT 5")
+
+    assert first == second == "SELECT * FROM t WHERE id IN (...) AND x = ? LIMIT ?"
+
+
+@pytest.mark.django_db
+class TestQueryBudgetMode:
+    """Tryby QUERY_BUDGET_MODE dla przekroczonego budżetu."""
+
+    @pytest.fixture(autouse=True)
+    def tight_budget(self, monkeypatch, user):
+        AddressFactory(profile=ProfileFactory(user=user))
+        monkeypatch.setattr(AddressViewSet, "query_budgets", {"list": 0})
+
+    def test_raise(self, authenticated_client, settings):
+        """raise — wyjątek z fingerprintami zapytań."""
+        settings.QUERY_BUDGET_MODE = "raise"
+
+        with pytest.raises(QueryBudgetExceeded, match="AddressViewSet.list: 1 queries"):
+            authenticated_client.get(reverse("address-list"))
+
+    def test_log(self, authenticated_client, settings, monkeypatch):
+        """log — odpowiedź bez zmian, ostrzeżenie z fingerprintami."""
+        settings.QUERY_BUDGET_MODE = "log"
+        warnings: list[dict] = []
+        monkeypatch.setattr(
+            query_budget.log, "warning", lambda msg, **kw: warnings.append(kw)
+        )
+
+        response = authenticated_client.get(reverse("address-list"))
+
+        assert response.status_code == 200
+        [warning] = warnings
+        assert (warning["view"], warning["queries"]) == ("AddressViewSet.list", 1)
+        assert "accounts_address" in warning["fingerprints"][0]
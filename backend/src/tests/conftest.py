@@ -9,6 +9,9 @@ from moto import mock_aws
 from rest_framework.test import APIClient
 
 from apps.accounts.models import CustomUser
+from core.utils.health import probes as health_probes
+
+pytest_plugins = ["tests.shared.query_budget"]
 
 
 @pytest.fixture(autouse=True)
@@ -76,6 +79,13 @@ def mock_redis_connection(request):
         yield mock_redis_instance
 
 
+@pytest.fixture(autouse=True)
+def reset_health_probes():
+    """Probe zdrowia w toku z poprzedniego testu nie blokuje kolejnego."""
+    yield
+    health_probes.reset()
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     return APIClient()
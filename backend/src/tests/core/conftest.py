@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+
+
+@pytest.fixture
+def session_redis():
+    """FakeRedis dla silnika sesji (decode_responses jak w produkcji)."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    with patch(
+        "core.services.sessions.backend.get_session_redis", return_value=client
+    ):
+        yield client
+
+
+@pytest.fixture
+def ledger_redis():
+    """FakeRedis dla rejestru doręczeń maili."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    with patch("core.services.mail.ledger.get_ledger_redis", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def metrics_redis():
+    """FakeRedis dla metryk zadań Celery."""
+    client = fakeredis.FakeRedis(decode_responses=True)
+    with patch(
+        "core.services.task_metrics.store.get_metrics_redis", return_value=client
+    ):
+        yield client
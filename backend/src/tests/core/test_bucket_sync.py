@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pytest
+
+from core.storage import S3BucketManager
+from core.storage.clients import registry
+from core.storage.reconcile import FINGERPRINT_TAG
+from core.storage.utils import build_bucket_specs, sync_buckets
+
+CORS = [{"AllowedMethods": ["GET"], "AllowedOrigins": ["*"]}]
+
+
+@pytest.fixture
+def manager():
+    registry.clear()
+    yield S3BucketManager()
+    registry.clear()
+
+
+@pytest.fixture
+def s3_calls(manager):
+    """Lista nazw operacji API S3 wykonanych przez współdzielonego klienta."""
+    calls = []
+
+    def record(model, **kwargs):
+        calls.append(model.name)
+
+    manager.client.meta.events.register("before-call.s3", record)
+    return calls
+
+
+class TestSyncBuckets:
+    """Testy deklaratywnej synchronizacji bucketów."""
+
+    def test_tworzy_brakujace_i_usuwa_nadmiarowe(self, manager):
+        """Brakujące buckety są tworzone, spoza listy — usuwane."""
+        result = sync_buckets("static, media")
+
+        assert result.success
+        assert sorted(result.created) == ["media", "static"]
+        assert result.deleted == ["test-bucket"]
+        assert sorted(manager.list_buckets()) == ["media", "static"]
+
+    def test_niezmieniony_stan_to_jeden_request(self, manager, s3_calls):
+        """Przy zgodnym odcisku synchronizacja kończy się jednym odczytem tagów."""
+        sync_buckets("static,media")
+        s3_calls.clear()
+
+        result = sync_buckets("static,media")
+
+        assert result.skipped
+        assert s3_calls == ["GetBucketTagging"]
+
+    def test_konfiguracja_i_zmiana_odcisku(self, manager):
+        """Zmiana konfiguracji unieważnia odcisk i ustawia tylko różnice."""
+        sync_buckets("static,media")
+        config = {"media": {"policy": "public-read", "cors": CORS}}
+
+        result = sync_buckets("static,media", config)
+
+        assert not result.skipped
+        assert sorted(result.updated) == ["media:cors", "media:policy"]
+        policy = manager.get_bucket_policy("media")
+        assert policy["Statement"][0]["Resource"] == ["arn:aws:s3:::media/*"]
+        assert manager.get_bucket_cors("media") == CORS
+        assert sync_buckets("static,media", config).skipped
+
+    def test_zgodna_konfiguracja_bez_zapisu(self, manager):
+        """Istniejąca konfiguracja równa docelowej nie jest nadpisywana."""
+        manager.create_bucket("media")
+        manager.put_bucket_cors("media", CORS)
+
+        result = sync_buckets("media", {"media": {"cors": CORS}})
+
+        assert result.success
+        assert result.updated == []
+        assert result.deleted == ["test-bucket"]
+
+    def test_pusta_wartosc_usuwa_konfiguracje(self, manager):
+        """Pusta lista CORS usuwa istniejącą konfigurację."""
+        manager.create_bucket("media")
+        manager.put_bucket_cors("media", CORS)
+
+        result = sync_buckets("media", {"media": {"cors": []}})
+
+        assert result.updated == ["media:cors"]
+        assert manager.get_bucket_cors("media") is None
+
+    def test_blad_nie_zapisuje_odcisku(self, manager):
+        """Nieudana operacja zgłasza błąd i wymusza pełną synchronizację potem."""
+        manager.client.put_object(Bucket="test-bucket", Key="plik.txt", Body=b"x")
+
+        result = sync_buckets("static")
+
+        assert not result.success
+        assert "test-bucket" in result.errors[0]
+        assert result.created == ["static"]
+        assert FINGERPRINT_TAG not in manager.get_bucket_tags("static")
+        assert not sync_buckets("static").skipped
+
+    def test_force_pomija_odcisk(self, manager):
+        """force=True zawsze porównuje pełny stan."""
+        sync_buckets("static")
+        manager.create_bucket("extra")
+
+        assert sync_buckets("static").skipped
+        result = sync_buckets("static", force=True)
+        assert result.deleted == ["extra"]
+
+    def test_kolejnosc_i_duplikaty_nazw(self):
+        """Pierwsza nazwa przechowuje odcisk, duplikaty są pomijane."""
+        specs = build_bucket_specs(" static,media,static ,")
+        assert [spec.name for spec in specs] == ["static", "media"]
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from django.db import connections
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from core.utils.health import ReadinessView
+from core.utils.health.probes import SKIPPED
+from core.utils.health.views import probe_database
+
+TIMEOUTS = {"database": 1.0, "redis": 1.0, "storage": 0.2}
+
+
+def _ok() -> None:
+    return None
+
+
+def _sleep(seconds: float):
+    def probe() -> None:
+        time.sleep(seconds)
+
+    return probe
+
+
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    ReadinessView.results.clear()
+    yield
+    ReadinessView.results.clear()
+
+
+def _probes(**overrides):
+    probes = {"database": _ok, "redis": _ok, "storage": _ok}
+    probes.update(overrides)
+    return patch.object(ReadinessView, "probes", probes)
+
+
+@pytest.mark.django_db
+class TestHealthEndpoints:
+    """Testy endpointów liveness/readiness."""
+
+    def test_liveness_bez_zaleznosci(self, client, django_assert_num_queries):
+        """Liveness nie dotyka bazy ani innych zależności."""
+        with django_assert_num_queries(0):
+            response = client.get(reverse("health_live"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"status": "alive"}
+
+    def test_readiness_zdrowy(self, client):
+        """Readiness zwraca status i latencję każdej zależności."""
+        with _probes():
+            response = client.get(reverse("health_ready"))
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert set(data["services"]) == {"database", "redis", "storage"}
+        assert set(data["latencyMs"]) == {"database", "redis", "storage"}
+
+    def test_readiness_503_gdy_zaleznosc_nie_dziala(self, client):
+        """Niezdrowa zależność daje 503 na readiness i 200 na /health/."""
+
+        def broken() -> None:
+            raise ConnectionError("redis down")
+
+        with _probes(redis=broken):
+            ready = client.get(reverse("health_ready"))
+            ReadinessView.results.clear()
+            legacy = client.get(reverse("health_check"))
+
+        assert ready.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert ready.json()["services"]["redis"] == "unhealthy: redis down"
+        assert legacy.status_code == status.HTTP_200_OK
+        assert legacy.json()["status"] == "unhealthy"
+
+    @override_settings(HEALTH_CHECK_TIMEOUTS=TIMEOUTS)
+    def test_zawieszona_zaleznosc_konczy_sie_po_deadline(self, client):
+        """Zawieszony probe nie blokuje odpowiedzi dłużej niż jego deadline."""
+        release = threading.Event()
+        with _probes(storage=release.wait):
+            started = time.perf_counter()
+            response = client.get(reverse("health_ready"))
+            elapsed = time.perf_counter() - started
+
+            ReadinessView.results.clear()
+            again = client.get(reverse("health_ready"))
+        release.set()
+
+        assert elapsed < 0.5
+        assert response.json()["services"]["storage"] == (
+            "unhealthy: timed out after 0.2s"
+        )
+        assert again.json()["services"]["storage"] == SKIPPED
+        assert again.json()["status"] == "unhealthy"
+
+    @override_settings(HEALTH_CHECK_TIMEOUTS={**TIMEOUTS, "database": 0.2})
+    def test_zawieszona_baza_konczy_sie_po_deadline(self, client):
+        """Probe bazy działa w puli — zawieszona baza nie blokuje requestu."""
+        release = threading.Event()
+        with _probes(database=release.wait):
+            started = time.perf_counter()
+            response = client.get(reverse("health_ready"))
+            elapsed = time.perf_counter() - started
+        release.set()
+
+        assert elapsed < 0.5
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["services"]["database"] == (
+            "unhealthy: timed out after 0.2s"
+        )
+
+    def test_probe_rownolegle(self, client):
+        """Probe'y w puli działają równolegle, nie po kolei."""
+        with _probes(redis=_sleep(0.5), storage=_sleep(0.5)):
+            started = time.perf_counter()
+            response = client.get(reverse("health_ready"))
+            elapsed = time.perf_counter() - started
+        assert response.json()["status"] == "healthy"
+        # Po kolei byłoby ≥ 1 s; zapas na narzut żądania na obciążonej maszynie.
+        assert elapsed < 0.9
+
+    def test_probe_bazy_zamyka_wlasne_polaczenie(self):
+        """Probe bazy nie zostawia otwartego połączenia w wątku puli."""
+        closed = []
+        original = connections.create_connection
+
+        def create_connection(alias):
+            db = original(alias)
+            db.close = lambda: closed.append(alias)
+            return db
+
+        with patch.object(connections, "create_connection", create_connection):
+            probe_database()
+        assert closed == ["default"]
+
+    @override_settings(HEALTH_CHECK_CACHE_TTL=60)
+    def test_wynik_z_cache(self, client):
+        """W oknie cache kolejne odpytania nie uruchamiają probe'ów."""
+        calls = []
+        with _probes(redis=lambda: calls.append(1)):
+            client.get(reverse("health_ready"))
+            client.get(reverse("health_ready"))
+            client.get(reverse("health_check"))
+        assert len(calls) == 1
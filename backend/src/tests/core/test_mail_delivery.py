@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import smtplib
+
+import fakeredis
+import pytest
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from core.services.mail.ledger import DeliveryLedger, DeliveryStatus
+from core.services.mail.tasks import retry_delay, send_email_payloads_task
+
+BAD = "bad@example.com"
+
+
+class FlakyBackend(EmailBackend):
+    """locmem, który odrzuca jednego odbiorcę."""
+
+    def send_messages(self, messages):
+        for message in messages:
+            if BAD in message.to:
+                raise smtplib.SMTPRecipientsRefused({BAD: (550, b"No such user")})
+        return super().send_messages(messages)
+
+
+class DownBackend(EmailBackend):
+    def open(self):
+        raise ConnectionRefusedError("SMTP down")
+
+
+def _payload(to: str, key: str, **extra) -> dict:
+    return {
+        "subject": f"Do {to}",
+        "body": "treść",
+        "from_email": "noreply@example.com",
+        "to": [to],
+        "cc": [],
+        "bcc": [],
+        "reply_to": [],
+        "headers": {},
+        "alternatives": {},
+        "idempotency_key": key,
+        **extra,
+    }
+
+
+@pytest.fixture
+def retries(monkeypatch, settings) -> list[tuple[list, int]]:
+    """Ponowienia zaplanowane przez zadanie: (maile, countdown)."""
+    settings.ACTUAL_EMAIL_BACKEND = "tests.core.test_mail_delivery.FlakyBackend"
+    scheduled: list[tuple[list, int]] = []
+    monkeypatch.setattr(
+        send_email_payloads_task,
+        "apply_async",
+        lambda args, countdown: scheduled.append((args[0], countdown)),
+    )
+    return scheduled
+
+
+class TestMailDelivery:
+    """Testy rejestru doręczeń i ponowień pojedynczych maili."""
+
+    def test_ponawiany_tylko_nieudany_mail(self, ledger_redis, retries):
+        """Zły odbiorca nie powoduje ponownej wysyłki pozostałych maili."""
+        batch = [_payload("a@example.com", "k1"), _payload(BAD, "k2")]
+
+        sent = send_email_payloads_task(batch)
+
+        assert sent == 1
+        assert [m.to for m in mail.outbox] == [["a@example.com"]]
+        [(items, countdown)] = retries
+        assert [item["idempotency_key"] for item in items] == ["k2"]
+        assert items[0]["attempt"] == 1
+        assert countdown == retry_delay(1)
+        ledger = DeliveryLedger()
+        assert ledger.get("k1")["status"] == DeliveryStatus.SENT
+        assert ledger.get("k2")["status"] == DeliveryStatus.FAILED
+        assert "550" in ledger.get("k2")["error"]
+
+    def test_ponowne_dostarczenie_nie_dubluje(self, ledger_redis, retries):
+        """Ta sama porcja dostarczona drugi raz nie wysyła maili ponownie."""
+        batch = [_payload("a@example.com", "k1"), _payload("b@example.com", "k2")]
+        send_email_payloads_task(batch)
+
+        assert send_email_payloads_task(batch) == 0
+        assert len(mail.outbox) == 2
+
+    def test_po_limicie_prob_mail_jest_dead(self, ledger_redis, retries, settings):
+        """Po MAIL_MAX_ATTEMPTS próbach mail nie wraca do kolejki."""
+        settings.MAIL_MAX_ATTEMPTS = 3
+
+        send_email_payloads_task([_payload(BAD, "k1", attempt=2)])
+
+        assert retries == []
+        assert DeliveryLedger().get("k1")["status"] == DeliveryStatus.DEAD
+
+    def test_backoff_wykladniczy(self, settings):
+        """Opóźnienie rośnie 2× z każdą próbą, do limitu."""
+        settings.MAIL_RETRY_BACKOFF = 30
+        settings.MAIL_RETRY_BACKOFF_MAX = 100
+
+        assert [retry_delay(attempt) for attempt in (1, 2, 3, 4)] == [30, 60, 100, 100]
+
+    def test_smtp_niedostepny(self, ledger_redis, retries, settings):
+        """Brak połączenia z SMTP: cała porcja wraca z opóźnieniem."""
+        settings.ACTUAL_EMAIL_BACKEND = "tests.core.test_mail_delivery.DownBackend"
+
+        send_email_payloads_task([_payload("a@example.com", "k1")])
+
+        assert [len(items) for items, _ in retries] == [1]
+        assert mail.outbox == []
+
+    def test_bez_redisa_mail_wychodzi(self, retries, monkeypatch):
+        """Niedostępny Redis nie blokuje wysyłki."""
+        server = fakeredis.FakeServer()
+        server.connected = False
+        client = fakeredis.FakeRedis(server=server, decode_responses=True)
+        monkeypatch.setattr(
+            "core.services.mail.ledger.get_ledger_redis", lambda: client
+        )
+
+        sent = send_email_payloads_task([_payload("a@example.com", "k1")])
+
+        assert sent == 1
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+from django.core import mail
+from django.db import transaction
+
+from core.services.mail import enqueue_mail, mail_outbox
+from core.services.mail.tasks import send_email_payloads_task
+
+
+def _payload(index: int) -> dict:
+    return {
+        "subject": f"Mail {index}",
+        "body": "treść",
+        "from_email": "noreply@example.com",
+        "to": [f"user{index}@example.com"],
+        "cc": [],
+        "bcc": [],
+        "reply_to": [],
+        "headers": {},
+        "alternatives": {},
+    }
+
+
+@pytest.fixture
+def batches(monkeypatch) -> list[list[dict]]:
+    """Porcje przekazane do send_email_payloads_task.delay."""
+    sent: list[list[dict]] = []
+    monkeypatch.setattr(send_email_payloads_task, "delay", sent.append)
+    return sent
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMailOutbox:
+    """Testy outboxu maili wysyłanego jednym zadaniem."""
+
+    def test_jedno_zadanie_na_scope(self, batches):
+        """Maile z kilku transakcji w jednym scope idą jednym zadaniem."""
+        with mail_outbox():
+            for index in range(3):
+                with transaction.atomic():
+                    enqueue_mail(_payload(index))
+            assert batches == []
+
+        assert [len(batch) for batch in batches] == [3]
+
+    def test_podzial_na_porcje(self, batches, settings):
+        """Bufor jest dzielony na zadania po MAIL_OUTBOX_MAX_BATCH."""
+        settings.MAIL_OUTBOX_MAX_BATCH = 2
+        with mail_outbox():
+            for index in range(5):
+                enqueue_mail(_payload(index))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_wycofana_transakcja_nie_wysyla(self, batches):
+        """Mail z wycofanego savepointu nie trafia do outboxu."""
+        with mail_outbox():
+            with transaction.atomic():
+                enqueue_mail(_payload(1))
+                try:
+                    with transaction.atomic():
+                        enqueue_mail(_payload(2))
+                        raise RuntimeError
+                except RuntimeError:
+                    pass
+
+        assert [[p["subject"] for p in batch] for batch in batches] == [["Mail 1"]]
+
+    def test_bez_scope_mail_wysylany_od_razu(self, batches):
+        """Poza mail_outbox() każdy mail idzie osobno, po commicie."""
+        with transaction.atomic():
+            enqueue_mail(_payload(1))
+            enqueue_mail(_payload(2))
+            assert batches == []
+
+        assert [len(batch) for batch in batches] == [1, 1]
+
+    def test_rejestracja_jednym_zadaniem(self, client, settings, monkeypatch):
+        """Signup przez allauth: mail weryfikacyjny wychodzi z workera."""
+        settings.ACTUAL_EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+        calls = []
+        original = send_email_payloads_task.delay
+
+        def _delay(payloads):
+            calls.append(len(payloads))
+            return original(payloads)
+
+        monkeypatch.setattr(send_email_payloads_task, "delay", _delay)
+        response = client.post(
+            "/_allauth/browser/v1/auth/signup",
+            {"email": "nowy@example.com", "password": "Sup3r-Secret-123"},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 401
+        assert calls == [1]
+        assert [message.to for message in mail.outbox] == [["nowy@example.com"]]
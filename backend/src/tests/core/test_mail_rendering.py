@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from allauth.account.adapter import get_adapter
+from allauth.core.context import request_context
+from django.contrib.sites.requests import RequestSite
+
+from core.services.mail import rendering
+from core.services.mail.tasks import send_email_payloads_task
+from tests.factories.accounts import UserFactory
+
+
+@pytest.fixture
+def queued(monkeypatch) -> list:
+    """Elementy przekazane do zadania (bez wysyłki)."""
+    items: list = []
+    monkeypatch.setattr(send_email_payloads_task, "delay", items.extend)
+    return items
+
+
+@pytest.fixture
+def web_request(rf):
+    request = rf.get("/")
+    with request_context(request):
+        yield request
+
+
+@pytest.mark.django_db
+class TestMailRendering:
+    """Testy renderowania maili allauth w workerze."""
+
+    def test_kontekst_w_json(self, web_request):
+        """Model, data i strona przechodzą przez JSON; request jest pomijany."""
+        user = UserFactory()
+        moment = datetime(2026, 1, 2, 3, 4, tzinfo=UTC)
+        context = {
+            "user": user,
+            "timestamp": moment,
+            "current_site": RequestSite(web_request),
+            "request": web_request,
+            "codes": ["A", "B"],
+        }
+
+        encoded = rendering.encode_context(context)
+        decoded = rendering.decode_context(encoded)
+
+        assert "request" not in encoded
+        assert decoded["user"] == user
+        assert decoded["timestamp"] == moment
+        assert decoded["current_site"].domain == "testserver"
+        assert decoded["codes"] == ["A", "B"]
+        assert rendering.encode_context({"obj": object()}) is None
+
+    def test_worker_renderuje_to_samo(
+        self, web_request, queued, django_capture_on_commit_callbacks
+    ):
+        """Zakolejkowany job renderuje się w workerze do tego samego maila."""
+        adapter = get_adapter(web_request)
+        context = {"code": "ABC123", "user": UserFactory()}
+        expected = adapter.render_mail("account/email/login_code", "a@b.pl", context)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            adapter.send_mail("account/email/login_code", "a@b.pl", context)
+        [job] = queued
+        rendered = get_adapter().render_job(job)
+
+        assert job["template_prefix"] == "account/email/login_code"
+        assert "body" not in job
+        assert rendered["subject"] == expected.subject
+        assert rendered["body"] == expected.body
+        assert "ABC123" in rendered["body"]
+
+    def test_nieobslugiwany_kontekst_renderowany_w_zadaniu(
+        self, web_request, queued, django_capture_on_commit_callbacks
+    ):
+        """Kontekst spoza JSON: mail renderowany od razu, jak wcześniej."""
+        adapter = get_adapter(web_request)
+        context = {"code": "XYZ", "extra": object()}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            adapter.send_mail("account/email/login_code", "a@b.pl", context)
+
+        [payload] = queued
+        assert "template_prefix" not in payload
+        assert "XYZ" in payload["body"]
+
+    def test_tryb_synchroniczny(
+        self, web_request, queued, settings, django_capture_on_commit_callbacks
+    ):
+        """MAIL_RENDER_IN_WORKER=False przywraca renderowanie w żądaniu."""
+        settings.MAIL_RENDER_IN_WORKER = False
+        adapter = get_adapter(web_request)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            adapter.send_mail("account/email/login_code", "a@b.pl", {"code": "Q"})
+
+        assert "body" in queued[0]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from core.services.request_metrics import RequestMetrics, collector
+from core.utils.metrics import PrometheusWriter
+from tests.factories.accounts import AddressFactory, ProfileFactory
+
+
+@pytest.fixture
+def metrics(monkeypatch) -> RequestMetrics:
+    """Świeży rejestr metryk żądań (middleware bierze go przy starcie klienta)."""
+    fresh = RequestMetrics()
+    monkeypatch.setattr(collector, "_metrics", fresh)
+    return fresh
+
+
+def _exported(metrics: RequestMetrics) -> str:
+    writer = PrometheusWriter()
+    metrics.export(writer)
+    return writer.render()
+
+
+class TestRequestMetrics:
+    """Testy middleware metryk żądań."""
+
+    def test_czas_i_rozmiar_per_widok(self, client, metrics):
+        """Żądanie trafia do statystyk nazwanego widoku; 404 do <unresolved>."""
+        response = client.get(reverse("health_live"))
+        client.get("/nie-ma-takiego-adresu/")
+
+        stats = metrics.snapshot()
+        live = stats[("health_live", "GET")]
+        assert sum(live.latency) == 1
+        assert live.size_sum == len(response.content)
+        assert sum(stats[("<unresolved>", "GET")].latency) == 1
+
+        body = _exported(metrics)
+        assert 'http_request_duration_seconds_count{view="health_live"' in body
+        assert "# TYPE http_response_size_bytes histogram" in body
+
+    def test_niestandardowe_metody(self, client, metrics):
+        """Metody spoza listy nie tworzą osobnych serii."""
+        for method in ("PURGE", "XYZ1", "XYZ2"):
+            client.generic(method, reverse("health_live"))
+
+        methods = {method for _, method in metrics.snapshot()}
+        assert methods == {"other"}
+
+    @pytest.mark.django_db
+    def test_zapytania_sql(self, authenticated_client, user, metrics):
+        """Zapytania SQL widoku są liczone razem z czasem."""
+        AddressFactory.create_batch(2, profile=ProfileFactory(user=user))
+
+        authenticated_client.get(reverse("address-list"))
+
+        stats = metrics.snapshot()[("address-list", "GET")]
+        assert stats.queries_sum > 0
+        assert stats.query_seconds > 0
+
+    def test_trafienia_cache(self, metrics):
+        """Cache liczy trafienia i chybienia tylko w trakcie żądania."""
+        cache.set("metrics:a", 1)
+        cache.get("metrics:a")  # poza żądaniem — bez liczenia
+
+        sample = metrics.start()
+        cache.get("metrics:a")
+        cache.get("metrics:b")
+        cache.get_many(["metrics:a", "metrics:b"])
+
+        assert (sample.cache_hits, sample.cache_misses) == (2, 2)
+
+    def test_shardy_watkow(self, metrics):
+        """Wątki zapisują do własnych shardów; snapshot je sumuje."""
+
+        def serve():
+            for _ in range(100):
+                sample = metrics.start()
+                metrics.record("address-list", "GET", 200, 0.01, 10, sample)
+
+        threads = [threading.Thread(target=serve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = metrics.snapshot()[("address-list", "GET")]
+        assert sum(stats.latency) == 400
+        assert stats.size_sum == 4000
+
+    def test_shardy_zakonczonych_watkow(self, metrics):
+        """Wątek na żądanie (runserver): shardy nie rosną z liczbą żądań,
+        a statystyki zakończonych wątków zostają w sumie."""
+
+        def serve():
+            sample = metrics.start()
+            metrics.record("address-list", "GET", 200, 0.01, 10, sample)
+
+        for _ in range(200):
+            thread = threading.Thread(target=serve)
+            thread.start()
+            thread.join()
+
+        assert len(metrics._shards) <= 1
+        stats = metrics.snapshot()[("address-list", "GET")]
+        assert sum(stats.latency) == 200
+        assert stats.size_sum == 2000
+        assert metrics._shards == []
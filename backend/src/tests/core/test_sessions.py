@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+import redis
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.services.sessions import SessionStore
+from core.services.sessions.tasks import (
+    persist_dirty_sessions,
+    sweep_expired_sessions,
+)
+
+DAY = 60 * 60 * 24
+
+
+def _create_session(**data) -> SessionStore:
+    store = SessionStore()
+    for key, value in data.items():
+        store[key] = value
+    store.create()
+    return store
+
+
+@pytest.mark.django_db
+class TestSessionStore:
+    """Testy silnika sesji z Redisem."""
+
+    def test_zapis_trafia_tylko_do_redisa(self, session_redis):
+        """save() nie pisze do bazy, tylko oznacza sesję do zrzutu."""
+        store = _create_session(user="jan")
+        store["cart"] = 3
+        store.save()
+
+        assert not Session.objects.exists()
+        assert session_redis.sismember(SessionStore.DIRTY_KEY, store.session_key)
+        assert SessionStore(store.session_key)["cart"] == 3
+
+    def test_zrzut_laczy_zapisy(self, session_redis):
+        """Wiele zapisów wielu sesji to jeden UPSERT przy zrzucie."""
+        stores = [_create_session(n=i) for i in range(5)]
+        for store in stores:
+            store["n"] += 10
+            store.save()
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert SessionStore.persist_dirty() == 5
+        writes = [
+            query for query in ctx.captured_queries
+            if "django_session" in query["sql"]
+        ]
+        assert len(writes) == 1
+
+        assert session_redis.scard(SessionStore.DIRTY_KEY) == 0
+        session = Session.objects.get(session_key=stores[0].session_key)
+        assert SessionStore().decode(session.session_data) == {"n": 10}
+        assert persist_dirty_sessions() == 0
+
+    def test_zrzut_nadpisuje_istniejace_wiersze(self, session_redis):
+        """Ponowny zrzut aktualizuje wiersz zamiast go dublować."""
+        store = _create_session(n=1)
+        SessionStore.persist_dirty()
+        store["n"] = 2
+        store.save()
+        SessionStore.persist_dirty()
+
+        session = Session.objects.get(session_key=store.session_key)
+        assert SessionStore().decode(session.session_data) == {"n": 2}
+
+    def test_blad_zrzutu_zwraca_klucze(self, session_redis):
+        """Gdy zapis do bazy się nie uda, sesje czekają na kolejny zrzut."""
+        store = _create_session(n=1)
+        with patch.object(
+            SessionStore, "_persist_batch", side_effect=RuntimeError("db down")
+        ), pytest.raises(RuntimeError):
+            SessionStore.persist_dirty()
+        assert session_redis.sismember(SessionStore.DIRTY_KEY, store.session_key)
+
+    def test_odczyt_z_bazy_po_utracie_redisa(self, session_redis):
+        """Brak wpisu w Redis wraca do bazy i odtwarza wpis."""
+        store = _create_session(user="jan")
+        SessionStore.persist_dirty()
+        session_redis.flushall()
+
+        assert SessionStore(store.session_key)["user"] == "jan"
+        assert session_redis.exists(SessionStore._key(store.session_key))
+
+    def test_delete_usuwa_z_obu_magazynow(self, session_redis):
+        """Wylogowanie usuwa sesję z Redisa i od razu z bazy."""
+        store = _create_session(user="jan")
+        SessionStore.persist_dirty()
+        store.delete()
+
+        assert not session_redis.exists(SessionStore._key(store.session_key))
+        assert not Session.objects.exists()
+
+    def test_wylogowanie_w_trakcie_zrzutu(self, session_redis):
+        """delete() między odczytem z Redisa a zapisem nie zostawia wiersza."""
+        store = _create_session(user="jan")
+        bulk_create = QuerySet.bulk_create
+
+        def logout_then_write(queryset, *args, **kwargs):
+            SessionStore(store.session_key).delete()
+            return bulk_create(queryset, *args, **kwargs)
+
+        with patch.object(
+            QuerySet, "bulk_create", autospec=True, side_effect=logout_then_write
+        ):
+            assert SessionStore.persist_dirty() == 0
+
+        assert not Session.objects.filter(session_key=store.session_key).exists()
+        assert SessionStore(store.session_key).load() == {}
+
+    def test_redis_niedostepny_degraduje_do_bazy(self, session_redis):
+        """Przy awarii Redisa sesja jest zapisywana i czytana z bazy."""
+        with patch.object(
+            session_redis, "set", side_effect=redis.ConnectionError("down")
+        ):
+            store = SessionStore()
+            store["user"] = "jan"
+            store.save()
+        assert Session.objects.filter(session_key=store.session_key).exists()
+
+        with patch.object(
+            session_redis, "pipeline", side_effect=redis.ConnectionError("down")
+        ):
+            assert SessionStore(store.session_key)["user"] == "jan"
+
+
+@pytest.mark.django_db
+class TestSessionSlidingExpiry:
+    """Testy przesuwania TTL tylko poniżej progu."""
+
+    @override_settings(
+        SESSION_COOKIE_AGE=14 * DAY, SESSION_REFRESH_THRESHOLD=13 * DAY
+    )
+    def test_swieza_sesja_nie_jest_zapisywana(self, session_redis):
+        """Odczyt świeżej sesji nie oznacza jej jako zmienionej."""
+        store = _create_session(user="jan")
+        loaded = SessionStore(store.session_key)
+        loaded["user"]
+        assert loaded.modified is False
+
+    @override_settings(
+        SESSION_COOKIE_AGE=14 * DAY, SESSION_REFRESH_THRESHOLD=13 * DAY
+    )
+    def test_odswiezenie_ponizej_progu(self, session_redis):
+        """Gdy zostało mniej niż próg, odczyt wymusza zapis z pełnym TTL."""
+        store = _create_session(user="jan")
+        key = SessionStore._key(store.session_key)
+        session_redis.expire(key, 12 * DAY)
+
+        loaded = SessionStore(store.session_key)
+        loaded["user"]
+        assert loaded.modified is True
+        loaded.save()
+        assert session_redis.ttl(key) > 13 * DAY
+
+    @override_settings(
+        SESSION_COOKIE_AGE=14 * DAY, SESSION_REFRESH_THRESHOLD=13 * DAY
+    )
+    def test_krotka_sesja_odswiezana_po_polowie(self, session_redis):
+        """Przy set_expiry krótszym niż próg liczy się połowa życia sesji."""
+        store = SessionStore()
+        store.set_expiry(3600)
+        store.create()
+        key = SessionStore._key(store.session_key)
+
+        session_redis.expire(key, 2000)
+        fresh = SessionStore(store.session_key)
+        fresh.get("x")
+        assert fresh.modified is False
+
+        session_redis.expire(key, 1000)
+        stale = SessionStore(store.session_key)
+        stale.get("x")
+        assert stale.modified is True
+
+
+@pytest.mark.django_db
+class TestSessionSweeper:
+    """Testy sprzątania wygasłych sesji paczkami."""
+
+    def test_usuwa_tylko_wygasle_paczkami(self, django_assert_max_num_queries):
+        """Wygasłe sesje znikają w kilku krótkich DELETE, aktywne zostają."""
+        now = timezone.now()
+        Session.objects.bulk_create(
+            [
+                Session(
+                    session_key=f"expired{i:04d}",
+                    session_data="",
+                    expire_date=now - timedelta(minutes=i + 1),
+                )
+                for i in range(25)
+            ]
+            + [
+                Session(
+                    session_key="active",
+                    session_data="",
+                    expire_date=now + timedelta(days=1),
+                )
+            ]
+        )
+
+        with django_assert_max_num_queries(6):
+            assert SessionStore.clear_expired(batch_size=10) == 25
+        assert list(Session.objects.values_list("session_key", flat=True)) == [
+            "active"
+        ]
+        assert sweep_expired_sessions() == 0
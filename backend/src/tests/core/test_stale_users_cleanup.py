@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+from allauth.account.models import EmailAddress
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.accounts.models import CustomUser
+from core.services.allauth import cleanup
+from core.services.allauth.tasks import cleanup_stale_unverified_users
+from tests.factories.accounts import AdminUserFactory, UserFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cursor():
+    cache.delete(cleanup.CURSOR_CACHE_KEY)
+    yield
+    cache.delete(cleanup.CURSOR_CACHE_KEY)
+
+
+@pytest.mark.django_db
+class TestStaleUsersCleanup:
+    """Testy usuwania nieaktywowanych kont paczkami."""
+
+    def test_usuwa_tylko_nieaktywowane(self):
+        """Konta zweryfikowane, zalogowane i administracyjne zostają."""
+        stale = UserFactory.create_batch(5)
+        verified = UserFactory()
+        EmailAddress.objects.create(
+            user=verified, email=verified.email, verified=True, primary=True
+        )
+        logged_in = UserFactory(last_login=timezone.now())
+        admin = AdminUserFactory()
+
+        result = cleanup.delete_stale_unverified_users(batch_size=2)
+
+        assert result == cleanup.CleanupResult(deleted=5, batches=3, finished=True)
+        assert not CustomUser.objects.filter(pk__in=[u.pk for u in stale]).exists()
+        assert set(CustomUser.objects.values_list("pk", flat=True)) == {
+            verified.pk,
+            logged_in.pk,
+            admin.pk,
+        }
+
+    def test_limit_czasu_i_wznowienie(self):
+        """Po wyczerpaniu limitu kursor zostaje, a kolejne uruchomienie kończy."""
+        UserFactory.create_batch(5)
+
+        first = cleanup.delete_stale_unverified_users(batch_size=2, time_budget=0)
+
+        assert first == cleanup.CleanupResult(deleted=2, batches=1, finished=False)
+        assert cache.get(cleanup.CURSOR_CACHE_KEY) is not None
+        assert CustomUser.objects.count() == 3
+
+        second = cleanup.delete_stale_unverified_users(batch_size=2)
+
+        assert second.finished and second.deleted == 3
+        assert cache.get(cleanup.CURSOR_CACHE_KEY) is None
+        assert not CustomUser.objects.exists()
+
+    def test_zadanie_wznawia_sie_po_limicie(self, settings, monkeypatch):
+        """Przerwane zadanie planuje swoje dokończenie."""
+        settings.STALE_USERS_CLEANUP_BATCH_SIZE = 2
+        settings.STALE_USERS_CLEANUP_TIME_BUDGET = 0
+        scheduled: list[dict] = []
+        monkeypatch.setattr(
+            cleanup_stale_unverified_users,
+            "apply_async",
+            lambda **kwargs: scheduled.append(kwargs),
+        )
+        UserFactory.create_batch(3)
+
+        assert cleanup_stale_unverified_users() == 2
+        assert scheduled == [{"countdown": settings.STALE_USERS_CLEANUP_RESUME_DELAY}]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+
+import boto3
+import pytest
+from django.core.management import call_command
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from core.storage.clients import registry
+from core.storage.static import STATIC_MANIFEST_NAME
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def static_dir(tmp_path, settings):
+    """Źródła statyczne w katalogu tymczasowym i StaticStorage na moto."""
+    registry.clear()
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "app.css").write_text("body { color: red; }")
+    (tmp_path / "app.js").write_text("console.log('olivin');")
+    settings.STATICFILES_DIRS = [str(tmp_path)]
+    settings.STATICFILES_FINDERS = [
+        "django.contrib.staticfiles.finders.FileSystemFinder"
+    ]
+    settings.AWS_STORAGE_BUCKET_NAME = BUCKET
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "core.storage.storages.StaticStorage"},
+    }
+    yield tmp_path
+    registry.clear()
+
+
+@pytest.fixture
+def uploads(monkeypatch) -> list[str]:
+    """Nazwy plików faktycznie wysłanych do S3 (bez manifestu)."""
+    sent: list[str] = []
+    original = S3Boto3Storage._save
+
+    def _save(self, name, content):
+        if name != STATIC_MANIFEST_NAME:
+            sent.append(name)
+        return original(self, name, content)
+
+    monkeypatch.setattr(S3Boto3Storage, "_save", _save)
+    return sent
+
+
+def _collect() -> None:
+    call_command("collectstatic", interactive=False, verbosity=0)
+
+
+def _manifest() -> dict:
+    s3 = boto3.client("s3", region_name="us-east-1")
+    body = s3.get_object(Bucket=BUCKET, Key=STATIC_MANIFEST_NAME)["Body"]
+    return json.loads(body.read())
+
+
+class TestIncrementalStaticStorage:
+    """Testy przyrostowego collectstatic na StaticStorage."""
+
+    def test_pierwszy_deploy_wysyla_wszystko(self, static_dir, uploads):
+        """Bez manifestu w buckecie wysyłane są wszystkie pliki."""
+        _collect()
+
+        assert sorted(uploads) == ["app.js", "css/app.css"]
+        assert set(_manifest()) == {"app.js", "css/app.css"}
+
+    def test_bez_zmian_nic_nie_jest_wysylane(self, static_dir, uploads):
+        """Ponowny collectstatic bez zmian nie wysyła żadnego pliku."""
+        _collect()
+        uploads.clear()
+
+        _collect()
+
+        assert uploads == []
+
+    def test_wysylany_tylko_zmieniony_plik(self, static_dir, uploads, settings):
+        """Zmieniony plik trafia do S3, reszta nie; wymuszenie wysyła wszystko."""
+        _collect()
+        uploads.clear()
+        (static_dir / "app.js").write_text("console.log('v2');")
+
+        _collect()
+        assert uploads == ["app.js"]
+
+        uploads.clear()
+        settings.STATICFILES_FORCE_UPLOAD = True
+        _collect()
+        assert sorted(uploads) == ["app.js", "css/app.css"]
+
+    def test_blad_uploadu_nie_zapisuje_manifestu(self, static_dir, monkeypatch):
+        """Nieudany upload przerywa collectstatic, manifest zostaje stary."""
+
+        def _fail(self, name, content):
+            raise OSError("S3 unavailable")
+
+        monkeypatch.setattr(S3Boto3Storage, "_save", _fail)
+
+        with pytest.raises(OSError):
+            _collect()
+
+        s3 = boto3.client("s3", region_name="us-east-1")
+        assert "Contents" not in s3.list_objects_v2(Bucket=BUCKET)
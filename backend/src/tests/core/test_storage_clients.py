@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import threading
+
+import pytest
+from django.core.files.base import ContentFile
+from django.test import override_settings
+
+from core.storage import S3BucketManager, S3ClientOptions, get_s3_client
+from core.storage.clients import registry
+from core.storage.storages import DefaultStorage
+
+
+class BucketStorage(DefaultStorage):
+    bucket_name = "test-bucket"
+    location = ""
+
+
+@pytest.fixture(autouse=True)
+def clear_registry():
+    registry.clear()
+    yield
+    registry.clear()
+
+
+class TestS3ClientRegistry:
+    """Testy współdzielonego rejestru klientów S3."""
+
+    def test_jeden_klient_na_opcje(self):
+        """Te same opcje zwracają tego samego klienta."""
+        assert get_s3_client() is get_s3_client()
+        assert S3BucketManager().client is S3BucketManager().client
+
+    def test_rozne_opcje_rozni_klienci(self):
+        """Inny endpoint lub poświadczenia to osobny klient."""
+        options = S3ClientOptions.from_settings()
+        other = S3ClientOptions.from_settings(access_key="other")
+        assert get_s3_client(options) is not get_s3_client(other)
+
+    @override_settings(AWS_S3_MAX_POOL_CONNECTIONS=7, AWS_S3_TCP_KEEPALIVE=False)
+    def test_ustawienia_puli(self):
+        """Rozmiar puli i keep-alive trafiają do konfiguracji klienta."""
+        config = get_s3_client().meta.config
+        assert config.max_pool_connections == 7
+        assert config.tcp_keepalive is False
+
+    @override_settings(USE_AWS=True, AWS_S3_ENDPOINT_URL="http://minio:9000")
+    def test_aws_pomija_lokalny_endpoint(self):
+        """W trybie AWS lokalny endpoint MinIO jest pomijany."""
+        assert S3ClientOptions.from_settings().endpoint_url is None
+
+    def test_nowy_proces_po_fork(self):
+        """Po zmianie PID (fork) rejestr tworzy nowego klienta."""
+        client = get_s3_client()
+        registry._pid = os.getpid() + 1
+        assert get_s3_client() is not client
+
+
+class TestDefaultStorage:
+    """Testy storage'ów na współdzielonych klientach."""
+
+    def test_upload_i_head(self):
+        """Zapis i sprawdzenie istnienia pliku działają na kliencie z rejestru."""
+        storage = BucketStorage()
+        name = storage.save("avatar.txt", ContentFile(b"hello"))
+        assert storage.exists(name)
+        assert storage.size(name) == 5
+        assert storage.connection.meta.client is registry.client(
+            storage.client_options()
+        )
+
+    def test_instancje_i_watki_dziela_klienta(self):
+        """Osobne instancje i wątki mają własne zasoby, ale wspólnego klienta."""
+        first, second = BucketStorage(), BucketStorage()
+        connections = [first.connection, second.connection]
+
+        thread = threading.Thread(
+            target=lambda: connections.append(first.connection)
+        )
+        thread.start()
+        thread.join()
+
+        assert len({id(connection) for connection in connections}) == 3
+        assert len({id(c.meta.client) for c in connections}) == 1
+
+    def test_url_bez_podpisu(self):
+        """Publiczny storage generuje URL bez parametrów podpisu."""
+        storage = BucketStorage()
+        storage.custom_domain = None
+        url = storage.url("avatar.txt")
+        assert "X-Amz-Signature" not in url
+        assert storage.unsigned_connection.meta.client is not (
+            storage.connection.meta.client
+        )
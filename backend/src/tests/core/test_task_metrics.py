@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import runpy
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+import core.settings
+from core.celery import app
+from core.services.task_metrics import TaskMetrics
+from core.services.task_metrics import signals as task_signals
+
+
+@app.task(name="tests.metrics.ok")
+def ok_task() -> int:
+    return 1
+
+
+@app.task(name="tests.metrics.broken")
+def broken_task() -> None:
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def metrics(monkeypatch, metrics_redis) -> TaskMetrics:
+    """Świeży bufor metryk procesu."""
+    fresh = TaskMetrics()
+    monkeypatch.setattr(task_signals, "metrics", fresh)
+    return fresh
+
+
+class TestTaskMetrics:
+    """Testy instrumentacji zadań Celery i eksportu /metrics/."""
+
+    def test_sukcesy_bledy_i_czas(self, client, metrics):
+        """Sygnały zliczają wykonania per zadanie; eksport w formacie Prometheus."""
+        ok_task.apply()
+        ok_task.apply()
+        broken_task.apply(throw=False)
+        metrics.flush()
+
+        body = client.get("/metrics/").content.decode()
+
+        assert 'celery_task_succeeded_total{task="tests.metrics.ok"} 2' in body
+        assert 'celery_task_failed_total{task="tests.metrics.broken"} 1' in body
+        assert 'celery_task_runtime_seconds_count{task="tests.metrics.ok"} 2' in body
+        assert (
+            'celery_task_runtime_seconds_bucket{task="tests.metrics.ok",le="+Inf"} 2'
+            in body
+        )
+        assert "# TYPE celery_task_queue_wait_seconds histogram" in body
+
+    def test_czas_w_kolejce(self, metrics, metrics_redis):
+        """Czas w kolejce liczony od nagłówka enqueued_at (dla ETA — od ETA)."""
+        request = SimpleNamespace(enqueued_at=time.time() - 2, eta=None)
+        task = SimpleNamespace(name="tests.metrics.queued", request=request)
+
+        task_signals.on_prerun(task_id="t1", task=task)
+        metrics.flush()
+
+        fields = metrics_redis.hgetall("celery:metrics:task:tests.metrics.queued")
+        assert fields["wait:2.5"] == "1"
+        assert 2 <= float(fields["wait_sum"]) < 2.5
+
+    def test_zrzut_bezczynnego_procesu(self, settings, metrics, metrics_redis):
+        """Ostatnia paczka trafia do Redis bez kolejnego zadania."""
+        ok_task.apply()  # interwał jeszcze nie minął — zostaje w buforze
+        key = "celery:metrics:task:tests.metrics.ok"
+        assert not metrics_redis.exists(key)
+
+        settings.TASK_METRICS_FLUSH_INTERVAL = 0.01
+        task_signals.on_process_start()
+        try:
+            deadline = time.monotonic() + 5
+            while not metrics_redis.exists(key) and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            task_signals.on_shutdown()
+
+        assert metrics_redis.hget(key, "succeeded") == "1"
+
+    def test_sumy_z_wielu_procesow(self, metrics_redis):
+        """Bufory kilku procesów (dzieci prefork) sumują się w Redis."""
+        children = [TaskMetrics(), TaskMetrics()]
+        for child in children:
+            child.observe("tests.metrics.ok", "runtime", 0.02)
+            child.increment("tests.metrics.ok", "succeeded")
+            child.flush()
+
+        fields = metrics_redis.hgetall("celery:metrics:task:tests.metrics.ok")
+        assert fields["succeeded"] == "2"
+        assert fields["runtime:0.025"] == "2"
+        assert float(fields["runtime_sum"]) == pytest.approx(0.04)
+
+    def test_token(self, client, settings, metrics):
+        """Ustawiony METRICS_AUTH_TOKEN wymaga nagłówka Authorization."""
+        settings.METRICS_AUTH_TOKEN = "secret"
+
+        assert client.get("/metrics/").status_code == 401
+        response = client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+
+    def test_produkcja_wymaga_tokenu(self, monkeypatch):
+        """Ustawienia produkcyjne bez METRICS_AUTH_TOKEN nie startują."""
+        path = Path(core.settings.__file__).parent / "production.py"
+        monkeypatch.delenv("METRICS_AUTH_TOKEN", raising=False)
+        with pytest.raises(ImproperlyConfigured, match="METRICS_AUTH_TOKEN"):
+            runpy.run_path(str(path))
+
+        monkeypatch.setenv("METRICS_AUTH_TOKEN", "secret")
+        assert runpy.run_path(str(path))["DEBUG"] is False
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from django_celery_results.models import GroupResult, TaskResult
+
+from core.services.allauth.tasks import cleanup_stale_unverified_users
+from core.services.mail.tasks import send_email_payloads_task
+from core.services.sessions.tasks import persist_dirty_sessions
+from core.services.task_results import prune_task_results
+
+
+def _results(model, count: int, age: timedelta, prefix: str) -> None:
+    id_field = "task_id" if model is TaskResult else "group_id"
+    model.objects.bulk_create(
+        model(**{id_field: f"{prefix}-{n}"}) for n in range(count)
+    )
+    # date_done ma auto_now — cofamy go osobnym UPDATE.
+    model.objects.filter(**{f"{id_field}__startswith": prefix}).update(
+        date_done=timezone.now() - age
+    )
+
+
+@pytest.mark.django_db
+class TestTaskResults:
+    """Testy zapisu i czyszczenia wyników zadań Celery."""
+
+    def test_prune_usuwa_tylko_stare(self):
+        """Stare wyniki zadań i grup znikają paczkami, świeże zostają."""
+        _results(TaskResult, 5, timedelta(days=2), "old")
+        _results(TaskResult, 2, timedelta(minutes=1), "new")
+        _results(GroupResult, 3, timedelta(days=2), "old")
+
+        deleted = prune_task_results(older_than=86400, batch_size=2)
+
+        assert deleted == 8
+        assert set(TaskResult.objects.values_list("task_id", flat=True)) == {
+            "new-0",
+            "new-1",
+        }
+        assert not GroupResult.objects.exists()
+
+    def test_wynik_per_zadanie(self):
+        """Wysyłka maili i zrzut sesji są fire-and-forget, sprzątanie — nie."""
+        assert send_email_payloads_task.ignore_result is True
+        assert persist_dirty_sessions.ignore_result is True
+        assert cleanup_stale_unverified_users.ignore_result is False
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from core.celery import app
+from core.services.mail.tasks import send_email_payloads_task
+from core.services.queues import queue_for
+from core.services.sessions.tasks import persist_dirty_sessions
+
+
+class TestTaskRouting:
+    """Testy routingu zadań Celery do kolejek."""
+
+    def test_tabela_kolejek(self, settings):
+        """Wpis dokładny wygrywa ze wzorcem; brak wpisu — kolejka domyślna."""
+        settings.CELERY_TASK_QUEUE_MAP = {
+            "pkg.tasks.urgent": "critical",
+            "pkg.tasks.*": "mail",
+        }
+
+        assert queue_for("pkg.tasks.urgent") == "critical"
+        assert queue_for("pkg.tasks.other") == "mail"
+        assert queue_for("other.task") == "default"
+
+    def test_router_celery(self):
+        """Router nadaje kolejkę i priorytet; opcje z wysyłki wygrywają."""
+        router = app.amqp.router
+
+        mail = router.route({}, send_email_payloads_task.name)
+        session = router.route({}, persist_dirty_sessions.name)
+        urgent = router.route({"priority": 0}, send_email_payloads_task.name)
+
+        assert (mail["queue"].name, mail["priority"]) == ("mail", 6)
+        assert (session["queue"].name, session["priority"]) == ("critical", 0)
+        assert urgent["priority"] == 0
+
+    def test_acks_late_z_profilu(self):
+        """acks_late i reject_on_worker_lost pochodzą z profilu kolejki."""
+        assert send_email_payloads_task.acks_late is True
+        assert send_email_payloads_task.reject_on_worker_lost is True
@@ -8,7 +8,7 @@ from factory.declarations import (  # noqa: F401 (reserved for future use)
 from factory.django import DjangoModelFactory
 from factory.faker import Faker
 
-from apps.accounts.models import CustomUser, Profile
+from apps.accounts.models import Address, CustomUser, Profile
 from apps.accounts.models.roles_model import RoleChoices
 
 
@@ -56,3 +56,17 @@ class ProfileFactory(DjangoModelFactory):
     first_name = Faker("first_name")
     last_name = Faker("last_name")
     role = RoleChoices.CUSTOMER
+
+
+class AddressFactory(DjangoModelFactory):
+    """Fabryka dla modelu Address."""
+
+    class Meta:
+        model = Address
+
+    profile = SubFactory(ProfileFactory)
+    street = Faker("street_address")
+    city = Faker("city")
+    postal_code = Faker("postcode")
+    country = "PL"
+    is_default = False
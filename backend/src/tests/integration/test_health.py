@@ -23,13 +23,13 @@ def test_health_check_integration(client):
     assert response.data["services"]["storage"] == "healthy"
 
 
-@patch("core.utils.health.views.connection.cursor")
-def test_health_check_database_unhealthy(mock_cursor, client):
+@patch("core.utils.health.views.connections.create_connection")
+def test_health_check_database_unhealthy(mock_create_connection, client):
     """
     W tym teście badamy sytuację awaryjną za pomocą Mockowania (z wbudowanej biblioteki unittest.mock).
     Zmuszamy wewnętrzne zapytanie kursora Postgresa do rzucenia wyjątkiem obojętnie co by się działo.
     """
-    mock_cursor.side_effect = Exception("Database connection rejected")
+    mock_create_connection.side_effect = Exception("Database connection rejected")
 
     url = reverse("health_check")
     response = client.get(url, secure=True)
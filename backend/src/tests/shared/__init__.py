@@ -1,3 +1,9 @@
+from tests.shared.benchmark import BenchmarkResult, benchmark_size, measure
 from tests.shared.load_json import parametrize_data_from_json
 
-__all__ = ["parametrize_data_from_json"]
+__all__ = [
+    "BenchmarkResult",
+    "benchmark_size",
+    "measure",
+    "parametrize_data_from_json",
+]
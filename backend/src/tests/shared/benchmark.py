@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import math
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass
+class BenchmarkResult:
+    """Wynik pomiaru: czasy pojedynczych wywołań (s) i opcjonalne metryki."""
+
+    name: str
+    samples: list[float] = field(default_factory=list)
+    extra: dict[str, object] = field(default_factory=dict)
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.samples) * 1000
+
+    @property
+    def p95_ms(self) -> float:
+        # Metoda najbliższej rangi: najmniejsza próbka, od której co
+        # najmniej 95% próbek jest nie większych.
+        ordered = sorted(self.samples)
+        return ordered[math.ceil(len(ordered) * 0.95) - 1] * 1000
+
+    @property
+    def total_s(self) -> float:
+        return sum(self.samples)
+
+    def report(self) -> str:
+        extra = " ".join(f"{key}={value}" for key, value in self.extra.items())
+        return (
+            f"{self.name}: n={len(self.samples)} median={self.median_ms:.3f}ms "
+            f"p95={self.p95_ms:.3f}ms {extra}"
+        ).rstrip()
+
+
+def measure(
+    name: str,
+    fn: Callable[[], object],
+    *,
+    repeat: int = 20,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """
+    Zmierz czas wywołań funkcji.
+
+    Args:
+        name: Nazwa pomiaru w raporcie.
+        fn: Mierzona funkcja bez argumentów.
+        repeat: Liczba mierzonych wywołań.
+        warmup: Liczba wywołań rozgrzewających (nie liczone).
+
+    Returns:
+        BenchmarkResult: Czasy poszczególnych wywołań.
+    """
+    for _ in range(warmup):
+        fn()
+    result = BenchmarkResult(name=name)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        result.samples.append(time.perf_counter() - start)
+    return result
+
+
+def benchmark_size(default: int) -> int:
+    """
+    Rozmiar danych benchmarku, skalowany zmienną BENCHMARK_SCALE.
+
+    Domyślne rozmiary są małe, żeby benchmarki mieściły się w zwykłym
+    przebiegu testów; pełne rozmiary uruchamia się np. BENCHMARK_SCALE=100.
+    """
+    return int(default * float(os.environ.get("BENCHMARK_SCALE", "1")))
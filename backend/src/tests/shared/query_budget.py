@@ -0,0 +1,105 @@
+"""
+Plugin pytest: budżety zapytań viewsetów (common.query_budget) dla list
+rosnącej długości.
+
+Fixture query_budget sprawdza akcję dla 1, 10 i 100 wierszy: każde
+wywołanie musi zmieścić się w query_budgets viewsetu, a liczba zapytań
+nie może rosnąć z liczbą wierszy (N+1). Akcje na jednym obiekcie są
+mierzone raz. Budżet musi być dokładny — luz ukryłby regresję o jedno
+zapytanie. Błąd pokazuje fingerprinty SQL.
+
+Budżety obejmują odczyt użytkownika przy uwierzytelnieniu sesją, więc
+pomiar idzie przez session_client (sesja w Redis jak w produkcji), a nie
+przez force_authenticate.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from rest_framework.test import APIClient
+
+from common.query_budget import QueryLog, budget_message, capture_queries
+
+SIZES = (1, 10, 100)
+
+
+class QueryBudgetChecker:
+    def check(
+        self,
+        viewset: type,
+        action: str,
+        call: Callable[[], object],
+        seed: Callable[[int], object] | None = None,
+        sizes: tuple[int, ...] = SIZES,
+    ) -> dict[int, int]:
+        """
+        Wywołaj akcję po dosianiu wierszy do kolejnych rozmiarów.
+
+        Args:
+            viewset: Viewset z query_budgets.
+            action: Nazwa akcji (klucz w query_budgets).
+            call: Wykonuje żądanie; odpowiedź musi mieć status < 400.
+            seed: Tworzy podaną liczbę dodatkowych wierszy zwracanych przez
+                akcję; None — akcja na jednym obiekcie, jeden pomiar.
+            sizes: Łączne liczby wierszy, dla których mierzymy.
+
+        Returns:
+            dict[int, int]: Liczba zapytań per rozmiar.
+        """
+        budget = viewset.query_budgets.get(action)
+        if budget is None:
+            pytest.fail(f"{viewset.__name__} has no query budget for {action!r}")
+        label = f"{viewset.__name__}.{action}"
+        counts: dict[int, int] = {}
+        logs: dict[int, QueryLog] = {}
+        seeded = 0
+        for size in sizes if seed is not None else (1,):
+            if seed is not None:
+                seed(size - seeded)
+                seeded = size
+            with capture_queries() as query_log:
+                response = call()
+            status = getattr(response, "status_code", 200)
+            assert status < 400, f"{label} returned {status}"
+            counts[size], logs[size] = len(query_log), query_log
+            if len(query_log) > budget:
+                pytest.fail(f"{budget_message(label, query_log, budget)} ({size} rows)")
+        if len(set(counts.values())) > 1:
+            largest = max(counts)
+            pytest.fail(
+                f"{label}: query count grows with rows {counts}\n"
+                + budget_message(label, logs[largest], budget)
+            )
+        if max(counts.values()) < budget:
+            pytest.fail(
+                f"{label}: budget {budget} is looser than measured "
+                f"{max(counts.values())} queries — tighten it"
+            )
+        return counts
+
+
+@pytest.fixture
+def query_budget(settings) -> QueryBudgetChecker:
+    """Sprawdzanie budżetu zapytań akcji dla list 1, 10 i 100 wierszy."""
+    # Pomiar robi fixture — bez wyjątku z samego viewsetu.
+    settings.QUERY_BUDGET_MODE = "off"
+    return QueryBudgetChecker()
+
+
+@pytest.fixture
+def session_client(settings, user) -> Iterator[APIClient]:
+    """Klient zalogowany sesją — uwierzytelnienie kosztuje tyle co w produkcji."""
+    # Silnik z produkcji na FakeRedis: odczyt sesji bez SQL, zostaje jedno
+    # zapytanie o użytkownika.
+    settings.SESSION_ENGINE = "core.services.sessions.backend"
+    client = fakeredis.FakeRedis(decode_responses=True)
+    with patch(
+        "core.services.sessions.backend.get_session_redis", return_value=client
+    ):
+        api_client = APIClient()
+        api_client.force_login(user)
+        yield api_client
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+
+import boto3
+import pytest
+from PIL import Image
+
+from core.storage.clients import registry
+
+
+@pytest.fixture(autouse=True)
+def upload_buckets():
+    """Buckety celów uploadu w mocku S3 i świeży rejestr klientów."""
+    registry.clear()
+    s3 = boto3.client("s3", region_name="us-east-1")
+    for bucket in ("profiles", "products", "private-media"):
+        s3.create_bucket(Bucket=bucket)
+    yield s3
+    registry.clear()
+
+
+@pytest.fixture
+def png_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def sha256_b64(data: bytes) -> str:
+    return base64.b64encode(hashlib.sha256(data).digest()).decode()
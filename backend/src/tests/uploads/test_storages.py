@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.urls import reverse
+from PIL import Image
+
+from apps.accounts.models import Profile
+from apps.uploads.models import StoredBlob, Upload, UploadTarget
+from apps.uploads.services import DirectUploadService
+from apps.uploads.storages import ContentAddressedProfileStorage
+from tests.factories.accounts import ProfileFactory, UserFactory
+from tests.uploads.conftest import sha256_b64
+
+PAYLOAD = b"avatar-bytes" * 100
+
+
+class _Stream(io.RawIOBase):
+    """Strumień bez seek — jak body żądania czytane bezpośrednio."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        chunk = self._buffer.read(len(target))
+        target[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def _objects(s3, prefix: str = "cas/", bucket: str = "profiles") -> list[str]:
+    response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
+    return [item["Key"] for item in response.get("Contents", [])]
+
+
+def _upload(s3, user, data: bytes, target=UploadTarget.PROFILE_AVATAR) -> Upload:
+    """Direct upload: initiate, PUT prosto do bucketu, commit."""
+    upload, _ = DirectUploadService.initiate(
+        user,
+        target=target,
+        content_type="image/png",
+        size=len(data),
+        checksum_sha256=sha256_b64(data),
+    )
+    bucket = "profiles" if target == UploadTarget.PROFILE_AVATAR else "products"
+    s3.put_object(
+        Bucket=bucket,
+        Key=upload.key,
+        Body=data,
+        ContentType="image/png",
+        ChecksumSHA256=sha256_b64(data),
+    )
+    return DirectUploadService.commit(upload)
+
+
+@pytest.mark.django_db
+class TestContentAddressedStorage:
+    """Testy storage'u deduplikującego zapisy po hashu treści."""
+
+    def test_ta_sama_tresc_zapisana_raz(self, upload_buckets):
+        """Drugi zapis tej samej treści dodaje tylko referencję, bez PUT."""
+        storage = ContentAddressedProfileStorage()
+
+        first = storage.save("a/avatar.PNG", ContentFile(PAYLOAD))
+        second = storage.save("b/other.png", ContentFile(PAYLOAD))
+
+        assert first == second
+        assert first.startswith("cas/") and first.endswith(".png")
+        assert _objects(upload_buckets) == [first]
+        blob = StoredBlob.objects.get(key=first)
+        assert blob.ref_count == 2
+        assert blob.size == len(PAYLOAD)
+
+    def test_usuniecie_ostatniej_referencji(self, upload_buckets):
+        """Obiekt znika z bucketu dopiero razem z ostatnią referencją."""
+        storage = ContentAddressedProfileStorage()
+        key = storage.save("avatar.png", ContentFile(PAYLOAD))
+        storage.save("avatar.png", ContentFile(PAYLOAD))
+
+        storage.delete(key)
+        assert _objects(upload_buckets) == [key]
+        assert StoredBlob.objects.get(key=key).ref_count == 1
+
+        storage.delete(key)
+        assert _objects(upload_buckets) == []
+        assert not StoredBlob.objects.exists()
+
+        again = storage.save("avatar.png", ContentFile(PAYLOAD))
+        assert _objects(upload_buckets) == [again]
+
+    def test_klucz_spoza_rejestru_usuwany_normalnie(self, upload_buckets):
+        """Obiekty wgrane inną drogą (np. direct upload) są po prostu usuwane."""
+        upload_buckets.put_object(Bucket="profiles", Key="avatars/1/x.png", Body=b"x")
+
+        ContentAddressedProfileStorage().delete("avatars/1/x.png")
+
+        response = upload_buckets.list_objects_v2(Bucket="profiles")
+        assert "Contents" not in response
+
+    def test_strumien_bez_seek(self, upload_buckets):
+        """Treść bez seek jest buforowana, hash i obiekt się zgadzają."""
+        storage = ContentAddressedProfileStorage()
+        expected = storage.save("avatar.png", ContentFile(PAYLOAD))
+
+        key = storage.save("avatar.png", File(_Stream(PAYLOAD), name="avatar.png"))
+
+        assert key == expected
+        assert StoredBlob.objects.get(key=key).ref_count == 2
+
+    def test_statystyki_w_adminie(self, admin_client, upload_buckets):
+        """Changelist w adminie pokazuje współczynnik i zaoszczędzone bajty."""
+        storage = ContentAddressedProfileStorage()
+        for _ in range(3):
+            storage.save("avatar.png", ContentFile(PAYLOAD))
+        storage.save("other.png", ContentFile(b"other"))
+
+        stats = StoredBlob.objects.dedupe_stats()
+        response = admin_client.get(reverse("admin:uploads_storedblob_changelist"))
+
+        assert stats["bytes_saved"] == 2 * len(PAYLOAD)
+        assert stats["references"] == 4
+        assert stats["dedupe_ratio"] == round(
+            (3 * len(PAYLOAD) + 5) / (len(PAYLOAD) + 5), 2
+        )
+        assert response.status_code == 200
+        assert f"dedupe ratio {stats['dedupe_ratio']}×" in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestDirectUploadDedup:
+    """Direct uploady przechodzą przez rejestr StoredBlob."""
+
+    def _png(self, color: str) -> bytes:
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 8), color).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    def test_ten_sam_avatar_dwa_razy(
+        self, upload_buckets, django_capture_on_commit_callbacks
+    ):
+        """Ten sam avatar od dwóch osób to jeden obiekt z dwiema referencjami;
+        zmiana avatara zwalnia referencję, a ostatnia usuwa obiekt."""
+        first, second = ProfileFactory(), ProfileFactory()
+        red, blue = self._png("red"), self._png("blue")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            key = _upload(upload_buckets, first.user, red).key
+            assert _upload(upload_buckets, second.user, red).key == key
+
+        assert StoredBlob.objects.get().ref_count == 2
+        assert _objects(upload_buckets) == [key]
+        # Obiekty z kluczami uploadu zostały usunięte po commicie.
+        assert _objects(upload_buckets, prefix="avatars/") == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _upload(upload_buckets, first.user, blue)
+
+        assert StoredBlob.objects.get(key=key).ref_count == 1
+        assert Profile.objects.get(pk=first.pk).avatar.name != key
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Profile.objects.get(pk=second.pk).delete()
+
+        assert not StoredBlob.objects.filter(key=key).exists()
+        assert key not in _objects(upload_buckets)
+
+    def test_ponowny_upload_wlasnego_avatara(
+        self, upload_buckets, django_capture_on_commit_callbacks
+    ):
+        """Ten sam plik jako nowy avatar tego samego profilu — licznik bez zmian."""
+        profile = ProfileFactory()
+        data = self._png("red")
+        with django_capture_on_commit_callbacks(execute=True):
+            key = _upload(upload_buckets, profile.user, data).key
+        with django_capture_on_commit_callbacks(execute=True):
+            _upload(upload_buckets, profile.user, data)
+
+        assert StoredBlob.objects.get(key=key).ref_count == 1
+        assert _objects(upload_buckets) == [key]
+
+    def test_zdjecia_produktow(
+        self, upload_buckets, django_capture_on_commit_callbacks
+    ):
+        """Zdjęcie produktu: referencję trzyma Upload, usunięcie ją zwalnia."""
+        owner = UserFactory()
+        data = self._png("green")
+        with django_capture_on_commit_callbacks(execute=True):
+            first = _upload(upload_buckets, owner, data, UploadTarget.PRODUCT_IMAGE)
+            _upload(upload_buckets, owner, data, UploadTarget.PRODUCT_IMAGE)
+
+        blob = StoredBlob.objects.get()
+        assert (blob.bucket, blob.ref_count) == ("products", 2)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first.delete()
+
+        assert StoredBlob.objects.get().ref_count == 1
+        assert _objects(upload_buckets, bucket="products") == [blob.key]
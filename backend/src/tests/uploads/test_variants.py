@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import io
+import uuid
+
+import pytest
+import requests
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+
+from apps.accounts.models import Profile
+from apps.uploads.models import Upload, UploadStatus, UploadTarget
+from apps.uploads.services import ImageVariantError, ImageVariantService
+from tests.factories.accounts import ProfileFactory
+from tests.uploads.conftest import sha256_b64
+
+WIDTHS = (32, 16)
+
+
+def _jpeg(width: int = 64, height: int = 48) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "green").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _committed(s3, user, data: bytes, target=UploadTarget.PRODUCT_IMAGE) -> Upload:
+    bucket = "profiles" if target == UploadTarget.PROFILE_AVATAR else "products"
+    key = f"images/{user.pk}/{uuid.uuid4().hex}.jpg"
+    s3.put_object(Bucket=bucket, Key=key, Body=data, ContentType="image/jpeg")
+    return Upload.objects.create(
+        owner=user,
+        target=target,
+        key=key,
+        content_type="image/jpeg",
+        size=len(data),
+        status=UploadStatus.COMMITTED,
+        committed_at=timezone.now(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def variant_widths(settings):
+    settings.IMAGE_VARIANT_WIDTHS = WIDTHS
+
+
+@pytest.mark.django_db
+class TestImageVariants:
+    """Testy wariantów obrazów budowanych po commicie uploadu."""
+
+    def test_buduje_warianty_z_cache_control(self, user, upload_buckets):
+        """Każda szerokość powstaje w WebP i JPEG pod kluczem z hashem źródła."""
+        upload = _committed(upload_buckets, user, _jpeg())
+
+        variants = ImageVariantService.process(upload)
+
+        assert set(variants) == {"webp", "jpeg"}
+        assert set(variants["webp"]) == {"32", "16"}
+        key = variants["jpeg"]["16"]
+        assert key.startswith("variants/") and key.endswith("/w16-q80.jpg")
+        head = upload_buckets.head_object(Bucket="products", Key=key)
+        assert head["ContentType"] == "image/jpeg"
+        assert "immutable" in head["CacheControl"]
+        body = upload_buckets.get_object(Bucket="products", Key=variants["webp"]["32"])
+        with Image.open(io.BytesIO(body["Body"].read())) as image:
+            assert image.format == "WEBP"
+            assert image.size == (32, 24)
+        upload.refresh_from_db()
+        assert upload.variants == variants
+
+    def test_warianty_z_acl_storage(self, user, upload_buckets):
+        """Warianty dostają ACL storage'u celu, tak jak oryginał (public-read)."""
+        upload = _committed(upload_buckets, user, _jpeg())
+
+        variants = ImageVariantService.process(upload)
+
+        acl = upload_buckets.get_object_acl(
+            Bucket="products", Key=variants["webp"]["16"]
+        )
+        grantees = {
+            grant["Grantee"].get("URI"): grant["Permission"] for grant in acl["Grants"]
+        }
+        assert grantees["http://acs.amazonaws.com/groups/global/AllUsers"] == "READ"
+
+    def test_ten_sam_plik_nie_jest_przetwarzany_ponownie(
+        self, user, upload_buckets, monkeypatch
+    ):
+        """Warianty adresowane treścią — ponowny upload tego samego pliku
+        nie renderuje obrazów drugi raz."""
+        data = _jpeg()
+        first = ImageVariantService.process(_committed(upload_buckets, user, data))
+        rendered = []
+        monkeypatch.setattr(ImageVariantService, "_render", rendered.append)
+
+        second = ImageVariantService.process(_committed(upload_buckets, user, data))
+
+        assert second == first
+        assert rendered == []
+
+    def test_zbyt_duzy_obraz(self, user, upload_buckets, settings):
+        """Obraz ponad limit pikseli jest odrzucany przed dekodowaniem."""
+        settings.IMAGE_VARIANT_MAX_PIXELS = 100
+        upload = _committed(upload_buckets, user, _jpeg())
+
+        with pytest.raises(ImageVariantError):
+            ImageVariantService.process(upload)
+
+    def test_pending_upload_jest_pomijany(self, user, upload_buckets):
+        """Warianty powstają tylko dla zatwierdzonych uploadów."""
+        upload = _committed(upload_buckets, user, _jpeg())
+        upload.status = UploadStatus.PENDING
+
+        assert ImageVariantService.process(upload) == {}
+
+    def test_commit_avatara_uruchamia_zadanie(
+        self,
+        authenticated_client,
+        user,
+        django_capture_on_commit_callbacks,
+    ):
+        """Commit avatara planuje zadanie po transakcji; profil dostaje warianty."""
+        ProfileFactory(user=user)
+        data = _jpeg()
+        started = authenticated_client.post(
+            reverse("upload-list"),
+            {
+                "target": "profile_avatar",
+                "content_type": "image/jpeg",
+                "size": len(data),
+                "checksum": sha256_b64(data),
+            },
+            format="json",
+        )
+        requests.put(
+            started.data["upload_url"], data=data, headers=started.data["headers"]
+        )
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            authenticated_client.post(
+                reverse("upload-commit", args=[started.data["id"]]), {}, format="json"
+            )
+
+        assert any("DirectUploadService._link" in c.__qualname__ for c in callbacks)
+        profile = Profile.objects.get(user=user)
+        assert set(profile.avatar_variants["webp"]) == {"32", "16"}
+        response = authenticated_client.get(reverse("profile-list"))
+        urls = response.data["results"][0]["avatar_variants"]
+        assert urls["jpeg"]["16"].endswith(profile.avatar_variants["jpeg"]["16"])
+        upload = authenticated_client.get(
+            reverse("upload-detail", args=[started.data["id"]])
+        )
+        assert upload.data["variants"] == urls
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import pytest
+import requests
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+
+from apps.accounts.models import Profile
+from apps.uploads.models import Upload, UploadStatus
+from apps.uploads.services import DirectUploadService
+from tests.factories.accounts import ProfileFactory, UserFactory
+from tests.uploads.conftest import sha256_b64
+
+
+def _start(client, data: bytes, **overrides):
+    payload = {
+        "target": "profile_avatar",
+        "filename": "avatar.png",
+        "content_type": "image/png",
+        "size": len(data),
+        "checksum": sha256_b64(data),
+        **overrides,
+    }
+    return client.post(reverse("upload-list"), payload, format="json")
+
+
+def _commit_multipart(client, started: dict, data: bytes):
+    part_size = started["part_size"]
+    parts = []
+    for part in started["parts"]:
+        offset = (part["part_number"] - 1) * part_size
+        response = requests.put(part["url"], data=data[offset : offset + part_size])
+        parts.append(
+            {"part_number": part["part_number"], "etag": response.headers["ETag"]}
+        )
+    return client.post(
+        reverse("upload-commit", args=[started["id"]]),
+        {"parts": parts},
+        format="json",
+    )
+
+
+def _put(instructions: dict, data: bytes) -> None:
+    response = requests.put(
+        instructions["upload_url"], data=data, headers=instructions["headers"]
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+class TestDirectUpload:
+    """Testy uploadu bezpośrednio do S3."""
+
+    def test_single_part_podpina_avatar(self, authenticated_client, user, png_bytes):
+        """Upload single-part po commicie staje się avatarem profilu."""
+        ProfileFactory(user=user)
+        started = _start(authenticated_client, png_bytes)
+        assert started.status_code == status.HTTP_201_CREATED
+        assert started.data["parts"] == []
+        assert started.data["headers"]["Content-Type"] == "image/png"
+        _put(started.data, png_bytes)
+
+        response = authenticated_client.post(
+            reverse("upload-commit", args=[started.data["id"]]), {}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == UploadStatus.COMMITTED
+        assert response.data["key"].startswith("cas/")
+        assert response.data["url"].endswith(response.data["key"])
+        profile = Profile.objects.get(user=user)
+        assert profile.avatar.name == response.data["key"]
+        profile_data = authenticated_client.get(reverse("profile-list")).data
+        assert profile_data["results"][0]["avatar"] == response.data["url"]
+
+    def test_niedozwolony_typ_i_rozmiar(self, authenticated_client, png_bytes):
+        """Typ spoza listy celu i zbyt duży plik są odrzucane od razu."""
+        wrong_type = _start(authenticated_client, png_bytes, content_type="text/html")
+        too_big = _start(authenticated_client, png_bytes, size=50 * 1024 * 1024)
+        no_checksum = _start(authenticated_client, png_bytes, checksum="")
+
+        assert wrong_type.status_code == status.HTTP_400_BAD_REQUEST
+        assert too_big.status_code == status.HTTP_400_BAD_REQUEST
+        assert no_checksum.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Upload.objects.exists()
+
+    def test_tresc_niezgodna_z_typem(self, authenticated_client, upload_buckets):
+        """Plik, którego bajty nie pasują do Content-Type, jest usuwany."""
+        data = b"<html>nie obrazek</html>"
+        started = _start(authenticated_client, data, target="product_image")
+        _put(started.data, data)
+
+        response = authenticated_client.post(
+            reverse("upload-commit", args=[started.data["id"]]), {}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "content_type" in response.data
+        assert Upload.objects.get().status == UploadStatus.ABORTED
+        listing = upload_buckets.list_objects_v2(Bucket="products")
+        assert listing["KeyCount"] == 0
+
+    def test_zla_suma_kontrolna(self, authenticated_client, png_bytes):
+        """Treść inna niż zadeklarowana suma kontrolna nie przechodzi commitu."""
+        started = _start(authenticated_client, png_bytes, target="product_image")
+        _put(started.data, png_bytes[:-1] + b"\x00")
+
+        response = authenticated_client.post(
+            reverse("upload-commit", args=[started.data["id"]]), {}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "checksum" in response.data
+
+    def test_commit_bez_pliku(self, authenticated_client, png_bytes):
+        """Commit przed wysłaniem pliku zwraca 400, upload zostaje pending."""
+        started = _start(authenticated_client, png_bytes)
+        response = authenticated_client.post(
+            reverse("upload-commit", args=[started.data["id"]]), {}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Upload.objects.get().status == UploadStatus.PENDING
+
+    @override_settings(UPLOADS_MULTIPART_THRESHOLD=1024, UPLOADS_PART_SIZE=0)
+    def test_multipart(self, authenticated_client, png_bytes):
+        """Multipart: URL na część, commit składa obiekt i sprawdza SHA-256."""
+        data = png_bytes + b"\x00" * (5 * 1024 * 1024)
+        started = _start(authenticated_client, data, target="product_image")
+        assert started.status_code == status.HTTP_201_CREATED
+        assert [part["part_number"] for part in started.data["parts"]] == [1, 2]
+
+        response = _commit_multipart(authenticated_client, started.data, data)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status"] == UploadStatus.COMMITTED
+        assert response.data["size"] == len(data)
+
+    @override_settings(UPLOADS_MULTIPART_THRESHOLD=1024, UPLOADS_PART_SIZE=0)
+    def test_multipart_zla_suma_kontrolna(
+        self, authenticated_client, png_bytes, upload_buckets
+    ):
+        """Części z poprawnymi ETagami, ale inną treścią niż zadeklarowana."""
+        data = png_bytes + b"\x00" * (5 * 1024 * 1024)
+        started = _start(authenticated_client, data, target="product_image")
+
+        response = _commit_multipart(
+            authenticated_client, started.data, data[:-1] + b"\x01"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "checksum" in response.data
+        assert Upload.objects.get().status == UploadStatus.ABORTED
+        assert upload_buckets.list_objects_v2(Bucket="products")["KeyCount"] == 0
+
+    def test_commit_sprawdza_status_pod_blokada(self, user, png_bytes):
+        """Commit z nieaktualną instancją nie podpina uploadu drugi raz."""
+        ProfileFactory(user=user)
+        upload, instructions = DirectUploadService.initiate(
+            user,
+            target="profile_avatar",
+            content_type="image/png",
+            size=len(png_bytes),
+            checksum_sha256=sha256_b64(png_bytes),
+        )
+        _put(instructions, png_bytes)
+        stale = Upload.objects.get(pk=upload.pk)
+        DirectUploadService.commit(upload)
+
+        with pytest.raises(ValidationError, match="not pending"):
+            DirectUploadService.commit(stale)
+
+    def test_abort(self, authenticated_client, png_bytes):
+        """DELETE przerywa upload; commit po przerwaniu jest odrzucany."""
+        started = _start(authenticated_client, png_bytes)
+        url = reverse("upload-detail", args=[started.data["id"]])
+
+        assert authenticated_client.delete(url).status_code == 204
+        response = authenticated_client.post(
+            reverse("upload-commit", args=[started.data["id"]]), {}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_cudzy_upload(self, api_client, png_bytes):
+        """Użytkownik nie widzi uploadów innych użytkowników."""
+        owner, other = UserFactory(), UserFactory()
+        api_client.force_authenticate(user=owner)
+        started = _start(api_client, png_bytes)
+
+        api_client.force_authenticate(user=other)
+        response = api_client.post(
+            reverse("upload-commit", args=[started.data["id"]]), {}, format="json"
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -7,9 +7,28 @@ set -o nounset
 echo "Checking Redis connection..."
 /wait-for/redis.sh
 
-echo "Starting Celery worker..."
+# Kolejki i pula workera (CELERY_QUEUE_PROFILES w ustawieniach):
+#   CELERY_WORKER_QUEUES       - kolejki w kolejności priorytetu (-Q)
+#   CELERY_WORKER_POOL         - prefork | threads | gevent (gevent wymaga pakietu)
+#   CELERY_WORKER_CONCURRENCY  - liczba procesów / wątków (puste = liczba CPU)
+#   CELERY_WORKER_PREFETCH     - prefetch multiplier
+CELERY_WORKER_QUEUES="${CELERY_WORKER_QUEUES:-critical,default,media,mail}"
+CELERY_WORKER_POOL="${CELERY_WORKER_POOL:-prefork}"
+CELERY_WORKER_PREFETCH="${CELERY_WORKER_PREFETCH:-1}"
+
+args=(
+    -Q "${CELERY_WORKER_QUEUES}"
+    --pool "${CELERY_WORKER_POOL}"
+    --prefetch-multiplier "${CELERY_WORKER_PREFETCH}"
+    -n "${CELERY_WORKER_NAME:-worker}@%h"
+)
+if [ -n "${CELERY_WORKER_CONCURRENCY:-}" ]; then
+    args+=(--concurrency "${CELERY_WORKER_CONCURRENCY}")
+fi
+
+echo "Starting Celery worker (queues: ${CELERY_WORKER_QUEUES}, pool: ${CELERY_WORKER_POOL})..."
 # logs exists
 mkdir -p logs
 
 # run celery worker
-exec celery -A core.celery worker -l info
\ No newline at end of file
+exec celery -A core.celery worker -l info "${args[@]}"
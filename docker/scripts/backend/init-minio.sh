@@ -12,15 +12,27 @@ import os
 sys.path.insert(0, "/app/src")
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
-from core.storage.utils import sync_buckets
+from core.storage.utils import get_buckets_config_from_env, sync_buckets
 
-result = sync_buckets("${S3_BUCKETS_NAMES}")
+result = sync_buckets(
+    "${S3_BUCKETS_NAMES}",
+    get_buckets_config_from_env(),
+    force=os.environ.get("S3_BUCKETS_FORCE_SYNC", "False").lower() == "true",
+)
 
+if result.skipped:
+    print("✅ Stan bucketów bez zmian od ostatniej synchronizacji.")
 if result.created:
     print(f"✅ Utworzono buckety: {', '.join(result.created)}")
 if result.deleted:
     print(f"🗑️  Usunięto buckety: {', '.join(result.deleted)}")
-if result.success and not result.created and not result.deleted:
+if result.updated:
+    print(f"🔧 Zaktualizowano konfigurację: {', '.join(result.updated)}")
+if (
+    result.success
+    and not result.skipped
+    and not (result.created or result.deleted or result.updated)
+):
     print("✅ Wszystkie buckety są aktualne, brak zmian.")
 
 result.exit_on_failure()